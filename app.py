@@ -5,16 +5,31 @@ from components.image_generator import show_image_generator
 from components.video_generator import show_video_generator
 from components.image_editor import show_image_editor
 from components.history import show_history
+from services.bedrock_service import get_generation_cache_stats, get_inflight_stats, get_prompt_cache_stats
+from genai_kit.aws.rate_limiter import get_rate_limiter_stats
+from genai_kit.aws.circuit_breaker import get_circuit_breaker_stats
+from genai_kit.aws.metrics import get_metrics_snapshot, render_metrics, start_metrics_server
+from services.local_storage import start_media_server
 from session import SessionManager
 from styles import load_styles
 from constants import MediaType
+from config import config
 
 
 @st.dialog("전체 기록 삭제")
 def confirm_delete(session_manager: SessionManager):
     st.text("생성된 모든 기록을 삭제하시겠습니까?")
+    media_only = st.checkbox("S3는 미디어 파일만 삭제 (image/, video/, blob/)", value=False)
     if st.button("Submit", use_container_width=True):
-        success = session_manager.clear_history()
+        placeholder = st.empty()
+
+        def on_progress(progress):
+            placeholder.caption(
+                f"레코드 {progress['items_deleted']}개 · 파일 {progress['objects_deleted']}"
+                f"/{progress['objects_listed']}개 삭제 · {progress['elapsed']:.1f}s"
+            )
+
+        success = session_manager.clear_history(media_only=media_only, on_progress=on_progress)
         if success:
             st.success("삭제를 완료했습니다")
         else:
@@ -25,6 +40,9 @@ def confirm_delete(session_manager: SessionManager):
 def main():
     st.set_page_config(page_title="Bedrock Nova Gallery", layout="wide")
     load_styles()
+    start_metrics_server(config.METRICS_PORT)
+    if config.STORAGE_BACKEND == 'local':
+        start_media_server(config.LOCAL_STORAGE_PATH, config.LOCAL_MEDIA_PORT)
 
     st.sidebar.title("Bedrock Nova Gallery")
     st.sidebar.caption("Made by [hi-space](https://github.com/hi-space/multimodal-gen-ai-labs.git)")
@@ -53,8 +71,61 @@ def main():
         )
         cols_gallery = st.slider("갤러리 열 수 설정", min_value=1, max_value=7, value=3)
         cols_history = st.slider("히스토리 열 수 설정", min_value=1, max_value=3, value=1)
+        page_size = st.select_slider("페이지당 항목 수", options=[10, 20, 50, 100], value=20)
         show_details = st.checkbox("상세 정보 표시", value=False)
 
+    with st.sidebar.expander("**생성 캐시**", icon='💾', expanded=False):
+        cache_stats = get_generation_cache_stats()
+        st.caption(
+            f"hit {cache_stats['disk_hits'] + cache_stats['s3_hits']} "
+            f"(disk {cache_stats['disk_hits']} / S3 {cache_stats['s3_hits']}) · "
+            f"miss {cache_stats['misses']} · bypass {cache_stats['bypassed']} · "
+            f"{cache_stats['entries']}개, {cache_stats['bytes'] / 1024 / 1024:.1f} MB"
+        )
+        prompt_stats = get_prompt_cache_stats()
+        st.caption(
+            f"프롬프트: hit {prompt_stats['hits']} · miss {prompt_stats['misses']} · "
+            f"병합 {prompt_stats['shared']} · {prompt_stats['entries']}개"
+        )
+        inflight_stats = get_inflight_stats()
+        st.caption(
+            f"동시 요청 병합: {inflight_stats['shared']} · 실행 {inflight_stats['executed']} · "
+            f"진행 중 {inflight_stats['in_flight']}"
+        )
+
+    with st.sidebar.expander("**모델 상태**", icon='🚦', expanded=False):
+        limiter_stats = get_rate_limiter_stats()
+        if not limiter_stats:
+            st.caption("아직 호출된 모델이 없습니다")
+        for name, stats in limiter_stats.items():
+            st.caption(
+                f"**{name}**  \n"
+                f"{stats['rate']} req/s · 동시 {stats['in_flight']}/{stats['concurrency_limit']} · "
+                f"대기 {stats['queue_depth']} · throttle {stats['throttles']}"
+            )
+        for model_id, stats in get_circuit_breaker_stats().items():
+            if stats['state'] != 'closed' or stats['transitions']:
+                st.caption(
+                    f"**{model_id}** circuit {stats['state']} · "
+                    f"실패 {stats['failures']} · 거절 {stats['rejected']}"
+                )
+
+    with st.sidebar.expander("**AWS 호출 지표**", icon='📈', expanded=False):
+        metrics = get_metrics_snapshot()
+        if not metrics:
+            st.caption("아직 기록된 호출이 없습니다")
+        else:
+            st.dataframe(metrics, hide_index=True, use_container_width=True)
+        st.download_button(
+            "Prometheus text",
+            data=render_metrics(),
+            file_name="metrics.txt",
+            mime="text/plain",
+            use_container_width=True,
+        )
+        if config.METRICS_PORT:
+            st.caption(f"`:{config.METRICS_PORT}/metrics` 에서 scrape 가능")
+
     with st.sidebar.expander("**데이터 관리**", icon='⚠️', expanded=True):
         if st.button("전체 삭제", icon="🚨", use_container_width=True):
             confirm_delete(session_manager)
@@ -68,27 +139,11 @@ def main():
     with image_editing_tab:
         show_image_editor(session_manager)
 
-    media_items = get_media_items(session_manager, filter_type)
     with gallery_tab:
-        show_gallery(media_items, cols_gallery, show_details)
+        show_gallery(session_manager, filter_type, cols_gallery, show_details, page_size)
 
     with history_tab:
-        show_history(media_items, cols_history, show_details)
-
-
-def get_media_items(session_manager: SessionManager, filter_type):
-    history = session_manager.get_history()
-    if history:
-        media_items = [item for item in history 
-                          if item['media_type'] in filter_type]
-        
-        media_items = sorted(
-            media_items,
-            key=lambda x: x.get('created_at', ''),
-            reverse=True
-        )
-        return media_items
-    return []
+        show_history(session_manager, filter_type, cols_history, show_details, page_size)
 
 
 if __name__ == "__main__":
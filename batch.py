@@ -0,0 +1,202 @@
+"""
+Headless batch image generation from a JSONL file.
+
+    python batch.py prompts.jsonl --concurrency 4 --rewrite
+
+Each input line is a JSON object:
+
+    {"id": "sku-001", "prompt": "red sneakers on white", "model": "NOVA_CANVAS",
+     "width": 1024, "height": 1024, "count": 1, "seed": 42, "cfg": 8.0,
+     "colors": ["#FF0000"], "rewrite": true}
+
+Only "prompt" is required. Rows with "editing_mode" (IMAGE_VARIATION, INPAINTING,
+OUTPAINTING, IMAGE_CONDITIONING, BACKGROUND_REMOVAL) and "ref_image" (file path)
+go through edit_image with optional "mask_prompt" / "negative_text".
+
+Finished rows are appended to a checkpoint file (default: <input>.checkpoint.jsonl)
+and skipped on the next run. Rows without "id" are keyed by a hash of the line.
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Set, Tuple
+from genai_kit.aws.bedrock import BedrockModel
+from genai_kit.utils.images import encode_image_base64_from_file
+from services.bedrock_service import get_model_size
+from services.pipeline import build_image_pipeline
+from services.storage_service import StorageService
+from constants import EditingMode
+from config import config
+
+
+class Checkpoint:
+    '''
+    완료된 row key를 append-only JSONL로 기록합니다.
+    '''
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[str] = set()
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 중단 시점에 잘린 마지막 줄
+                    if entry.get('status') == 'ok':
+                        self.done.add(entry['key'])
+
+    def record(self, entry: Dict[str, Any]):
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+            if entry.get('status') == 'ok':
+                self.done.add(entry['key'])
+
+
+def read_rows(path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            key = str(row.get('id') or hashlib.sha256(line.encode('utf-8')).hexdigest()[:16])
+            yield key, row
+
+
+def record_id(key: str, index: int) -> str:
+    # 같은 row를 다시 실행해도 같은 레코드를 덮어쓰도록 결정적인 id 사용
+    return hashlib.sha256(f"{key}:{index}".encode('utf-8')).hexdigest()[:12]
+
+
+def resolve_model(value: str) -> BedrockModel:
+    if value in BedrockModel.__members__:
+        return BedrockModel[value]
+    return BedrockModel(value)
+
+
+def to_item(key: str, row: Dict[str, Any], rewrite: bool) -> Dict[str, Any]:
+    model_type = resolve_model(row.get('model', BedrockModel.NOVA_CANVAS.name))
+    return {
+        'key': key,
+        'prompt': row['prompt'],
+        'rewrite': row.get('rewrite', rewrite),
+        'model_type': model_type,
+        'size': get_model_size(model_type, int(row.get('width', 1024)), int(row.get('height', 1024))),
+        'count': int(row.get('count', 1)),
+        'seed': row.get('seed', 0),
+        'cfg': float(row.get('cfg', 8.0)),
+        'color_guide': row.get('colors', []),
+        'editing_mode': EditingMode(row['editing_mode']) if row.get('editing_mode') else None,
+        'ref_image': encode_image_base64_from_file(row['ref_image']) if row.get('ref_image') else None,
+        'mask_prompt': row.get('mask_prompt'),
+        'negative_text': row.get('negative_text'),
+        'record_id': lambda item, index: record_id(item['key'], index),
+        'started_at': time.perf_counter(),
+    }
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(p / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="JSONL file of prompts and parameters")
+    parser.add_argument("--checkpoint", default=None, help="default: <input>.checkpoint.jsonl")
+    parser.add_argument("--concurrency", type=int, default=4, help="image generation workers")
+    parser.add_argument("--rewrite-workers", type=int, default=2)
+    parser.add_argument("--upload-workers", type=int, default=8)
+    parser.add_argument("--record-workers", type=int, default=4)
+    parser.add_argument("--rewrite", action="store_true", help="rewrite prompts with gen_english by default")
+    args = parser.parse_args()
+
+    checkpoint = Checkpoint(args.checkpoint or f"{args.input}.checkpoint.jsonl")
+    rows = [(key, row) for key, row in read_rows(args.input) if key not in checkpoint.done]
+    skipped = len(checkpoint.done)
+    print(f"{len(rows)} rows to generate, {skipped} already done")
+
+    storage = StorageService(bucket_name=config.S3_BUCKET, cloudfront_domain=config.CF_DOMAIN)
+    pipeline = build_image_pipeline(
+        storage,
+        rewrite_workers=args.rewrite_workers,
+        generate_workers=args.concurrency,
+        upload_workers=args.upload_workers,
+        record_workers=args.record_workers,
+    )
+
+    recorded: Dict[str, List[str]] = {}
+    totals: Dict[str, int] = {}
+    failed: Set[str] = set()
+    latencies, images, done = [], 0, 0
+    start = time.perf_counter()
+
+    # row 변환 (모델 / editing_mode 해석, ref_image 읽기)은 feed thread에서 lazy하게 하고,
+    # 변환에 실패한 row는 다른 실패와 같이 stage "prepare"의 오류로 기록
+    results = pipeline.run(
+        ({'key': key, 'row': row} for key, row in rows),
+        prepare=lambda raw: to_item(raw['key'], raw['row'], args.rewrite),
+    )
+    try:
+        for result in results:
+            item = result['value']
+            key = item['key']
+            if key in failed:
+                continue
+
+            if result['error'] is not None:
+                failed.add(key)
+                done += 1
+                checkpoint.record({'key': key, 'status': 'error', 'stage': result['stage'],
+                                   'error': str(result['error'])})
+                print(f"[{done}/{len(rows)}] {key} failed at {result['stage']}: {result['error']}")
+                continue
+
+            ids = recorded.setdefault(key, [])
+            ids.append(item['id'])
+            images += 1
+            # 이미지 수는 row의 마지막 이미지에만 있고, 이미지들은 완료 순서대로 도착함
+            if item['image_count'] is not None:
+                totals[key] = item['image_count']
+            if len(ids) < totals.get(key, len(ids) + 1):
+                continue
+
+            # row의 모든 이미지가 기록된 시점에 완료 처리
+            done += 1
+            latency = time.perf_counter() - item['started_at']
+            latencies.append(latency)
+            checkpoint.record({'key': key, 'status': 'ok', 'ids': ids, 'model': item['used_model'],
+                               'latency': latency})
+            print(f"[{done}/{len(rows)}] {key} ok {latency:.1f}s")
+    except KeyboardInterrupt:
+        print("Interrupted, stopping pipeline (rerun to resume)")
+    finally:
+        results.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"\n{len(latencies)} rows / {images} images in {elapsed:.1f}s, {len(failed)} failed\n"
+        f"throughput: {len(latencies) / elapsed if elapsed else 0:.2f} rows/s, "
+        f"{images / elapsed if elapsed else 0:.2f} images/s\n"
+        f"latency p50 {percentile(latencies, 50):.2f}s, p95 {percentile(latencies, 95):.2f}s"
+    )
+    for name, stats in pipeline.stats().items():
+        print(f"  {name:<9} workers {stats['workers']:>2}  utilization {stats['utilization']:6.1%}  "
+              f"processed {stats['processed']:>4}  failed {stats['failed']:>3}  "
+              f"max queue {stats['max_queue_depth']:>3}")
+
+
+if __name__ == "__main__":
+    main()
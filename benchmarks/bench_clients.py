@@ -0,0 +1,55 @@
+"""
+Per-call overhead of a fresh boto3 client vs. the shared client registry.
+
+    python -m benchmarks.bench_clients --iterations 50            # client setup only
+    python -m benchmarks.bench_clients --iterations 50 --call     # + list_async_invokes round trip
+
+Without --call no request is sent, so only client construction (credential
+resolution, endpoint/model loading) is measured. With --call each iteration
+also performs a lightweight bedrock-runtime request, which includes the TLS
+handshake for fresh clients and a reused keep-alive connection for pooled ones.
+"""
+import argparse
+import statistics
+import time
+import boto3
+from genai_kit.aws.client import clear_clients, get_client
+
+
+def fresh_client(region: str):
+    return boto3.client(service_name='bedrock-runtime', region_name=region)
+
+
+def pooled_client(region: str):
+    return get_client(service_name='bedrock-runtime', region_name=region)
+
+
+def measure(factory, region: str, iterations: int, call: bool):
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client = factory(region)
+        if call:
+            client.list_async_invokes(maxResults=1)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies), statistics.mean(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--region", default="us-east-1")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--call", action="store_true")
+    args = parser.parse_args()
+
+    clear_clients()
+    pooled_client(args.region)  # registry warm-up (첫 생성 비용은 프로세스당 1회)
+
+    print(f"{'client':<10} {'p50 ms':>8} {'mean ms':>8}")
+    for name, factory in (("fresh", fresh_client), ("pooled", pooled_client)):
+        p50, mean = measure(factory, args.region, args.iterations, args.call)
+        print(f"{name:<10} {p50:>8.2f} {mean:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
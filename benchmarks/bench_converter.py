@@ -0,0 +1,145 @@
+"""
+DynamoDB value conversion: json.dumps/json.loads round trip vs. direct converter.
+
+    python -m benchmarks.bench_converter --records 200 --repeat 20
+
+"roundtrip" reproduces the previous DynamoDB helper (json.dumps with a
+Decimal/datetime default, then json.loads with parse_float=Decimal on writes);
+"direct" walks the structure once with genai_kit.utils.converter.
+Records mimic what the app stores: image records with a base64 ref_image and
+video records whose details come from get_async_invoke (nested dicts,
+datetimes, model input with prompt/config). No AWS access is needed.
+"""
+import argparse
+import base64
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from genai_kit.utils.converter import (
+    from_dynamodb,
+    from_dynamodb_items,
+    json_default,
+    to_dynamodb,
+)
+
+
+def image_record(i: int) -> dict:
+    return {
+        'id': f"{i:016x}",
+        'media_type': 'IMAGE',
+        'url': f"https://example.cloudfront.net/image/{i:016x}.png",
+        'prompt': "A watercolor painting of a lighthouse on a cliff at sunset, " * 3,
+        'ref_image': base64.b64encode(os.urandom(48 * 1024)).decode('utf-8'),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'updated_at': datetime.now(timezone.utc).isoformat(),
+        'details': {
+            'taskType': 'TEXT_IMAGE',
+            'imageGenerationConfig': {
+                'numberOfImages': 3,
+                'height': 1024,
+                'width': 1024,
+                'cfgScale': random.uniform(1.1, 10.0),
+                'seed': random.randint(0, 2147483646),
+                'quality': 'premium',
+            },
+        },
+    }
+
+
+def video_record(i: int) -> dict:
+    submit = datetime.now(timezone.utc) - timedelta(minutes=random.randint(1, 600))
+    return {
+        'id': f"{i:012x}",
+        'media_type': 'VIDEO',
+        'url': f"https://example.cloudfront.net/video/{i:012x}/output.mp4",
+        'prompt': "Slow dolly shot through a neon-lit market in the rain, " * 4,
+        'created_at': submit.isoformat(),
+        'updated_at': datetime.now(timezone.utc).isoformat(),
+        'details': {
+            'invocationArn': f"arn:aws:bedrock:us-east-1:123456789012:async-invoke/{i:012x}",
+            'modelArn': "arn:aws:bedrock:us-east-1::foundation-model/amazon.nova-reel-v1:0",
+            'clientRequestToken': f"{i:032x}",
+            'status': 'Completed',
+            'submitTime': submit,
+            'lastModifiedTime': submit + timedelta(minutes=5),
+            'endTime': submit + timedelta(minutes=5, seconds=random.random() * 60),
+            'outputDataConfig': {
+                's3OutputDataConfig': {'s3Uri': f"s3://bucket/video/{i:012x}"},
+            },
+            'modelInput': {
+                'taskType': 'TEXT_VIDEO',
+                'textToVideoParams': {'text': "Slow dolly shot through a neon-lit market"},
+                'videoGenerationConfig': {
+                    'durationSeconds': 6,
+                    'fps': 24,
+                    'dimension': '1280x720',
+                    'seed': random.randint(0, 2147483646),
+                },
+            },
+            'ResponseMetadata': {
+                'RequestId': f"{i:036x}",
+                'HTTPStatusCode': 200,
+                'HTTPHeaders': {'content-type': 'application/json', 'content-length': '812'},
+                'RetryAttempts': 0,
+            },
+        },
+    }
+
+
+def make_records(count: int) -> list:
+    return [video_record(i) if i % 2 else image_record(i) for i in range(count)]
+
+
+def roundtrip_write(item):
+    return json.loads(json.dumps(item, default=json_default), parse_float=Decimal)
+
+
+def roundtrip_read(items):
+    return json.loads(json.dumps(items, default=json_default))
+
+
+def timeit(fn, arg, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    # DynamoDB에서 읽은 것처럼 숫자를 Decimal로 바꾼 항목 (datetime은 ISO 문자열)
+    stored = [roundtrip_write(record) for record in records]
+    assert [to_dynamodb(record) for record in records] == stored
+    assert from_dynamodb_items(stored) == roundtrip_read(stored)
+
+    # sync_video_jobs처럼 video details만 따로 변환하는 경우
+    details = [record['details'] for record in records if record['media_type'] == 'VIDEO']
+
+    cases = [
+        ("write (put/update)", lambda rs: [roundtrip_write(r) for r in rs], lambda rs: [to_dynamodb(r) for r in rs], records),
+        ("write video details", lambda ds: [roundtrip_write(d) for d in ds], lambda ds: [to_dynamodb(d) for d in ds], details),
+        ("read (get_item)", lambda rs: [roundtrip_read(r) for r in rs], lambda rs: [from_dynamodb(r) for r in rs], stored),
+        ("read bulk (query/scan)", roundtrip_read, from_dynamodb_items, stored),
+    ]
+
+    print(f"{args.records} records, median of {args.repeat} runs")
+    print(f"{'case':<24} {'roundtrip ms':>13} {'direct ms':>10} {'speedup':>8}")
+    for name, old, new, data in cases:
+        old_ms = timeit(old, data, args.repeat)
+        new_ms = timeit(new, data, args.repeat)
+        print(f"{name:<24} {old_ms:>13.2f} {new_ms:>10.2f} {old_ms / new_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Peak memory of parsing an invoke_model image response.
+
+    python -m benchmarks.bench_image_response --images 5 --image-mb 6
+
+A synthetic body with N base64 images of --image-mb random bytes each (close to
+a 4096x1024 PNG) is parsed three ways, with tracemalloc measuring the peak of
+allocations made while parsing (the simulated network body is excluded):
+
+  legacy     json.loads(body.read()) then base64_to_bytes() per image
+  stream-b64 iter_response_images(decode=False), what invoke_bedrock returns
+  stream     iter_response_images(), one decoded BytesIO at a time
+
+Each consumer keeps only the current image, as an upload loop would.
+"""
+import argparse
+import base64
+import json
+import os
+import time
+import tracemalloc
+from io import BytesIO
+from genai_kit.utils.image_stream import iter_response_images
+
+
+def make_body(images: int, image_bytes: int) -> bytes:
+    payload = [base64.b64encode(os.urandom(image_bytes)).decode('ascii') for _ in range(images)]
+    return json.dumps({"images": payload, "error": None}).encode('utf-8')
+
+
+def legacy(body: BytesIO):
+    response_body = json.loads(body.read())
+    for image in response_body.get("images"):
+        # 기존 base64_to_bytes
+        yield BytesIO(base64.decodebytes(bytes(image, "utf-8")))
+
+
+def stream_b64(body: BytesIO):
+    for image in iter_response_images(body, decode=False):
+        yield BytesIO(base64.b64decode(image))
+
+
+def stream(body: BytesIO):
+    yield from iter_response_images(body)
+
+
+def measure(fn, raw: bytes):
+    body = BytesIO(raw)
+    tracemalloc.start()
+    start = time.perf_counter()
+    total = 0
+    for image in fn(body):
+        total += len(image.getbuffer())
+        del image
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=5)
+    parser.add_argument("--image-mb", type=float, default=6.0)
+    args = parser.parse_args()
+
+    raw = make_body(args.images, int(args.image_mb * 1024 * 1024))
+    print(f"response body: {len(raw) / 1024 / 1024:.1f} MB, {args.images} images")
+
+    for name, fn in (("legacy", legacy), ("stream-b64", stream_b64), ("stream", stream)):
+        peak, elapsed, total = measure(fn, raw)
+        print(f"{name:<11} peak {peak / 1024 / 1024:7.1f} MB   "
+              f"{elapsed * 1000:7.1f} ms   decoded {total / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Per-call overhead of the AWS call instrumentation (genai_kit.aws.metrics).
+
+    python -m benchmarks.bench_metrics --iterations 20000
+
+Runs dynamodb get_item against botocore's Stubber (no network), once on a
+plain client and once on an instrumented one, so the difference is the cost
+of the event hooks and the registry update. The registry update alone is
+also measured in isolation.
+"""
+import argparse
+import time
+import boto3
+from botocore.stub import Stubber
+from genai_kit.aws.metrics import MetricsRegistry, instrument_client
+
+
+def stubbed_calls(client, iterations: int) -> float:
+    with Stubber(client) as stubber:
+        for _ in range(iterations):
+            stubber.add_response('get_item', {'Item': {'id': {'S': 'x'}}})
+        start = time.perf_counter()
+        for _ in range(iterations):
+            client.get_item(TableName='bench', Key={'id': {'S': 'x'}})
+        return (time.perf_counter() - start) / iterations * 1e6
+
+
+def registry_updates(iterations: int) -> float:
+    registry = MetricsRegistry()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        registry.observe('dynamodb', 'GetItem', '', 0.012, request_bytes=64, response_bytes=512)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    plain = boto3.client('dynamodb', region_name='us-east-1',
+                         aws_access_key_id='bench', aws_secret_access_key='bench')
+    instrumented = boto3.client('dynamodb', region_name='us-east-1',
+                                aws_access_key_id='bench', aws_secret_access_key='bench')
+    instrument_client(instrumented, MetricsRegistry())
+
+    stubbed_calls(plain, 1000)  # warm-up
+    stubbed_calls(instrumented, 1000)
+
+    plain_us = stubbed_calls(plain, args.iterations)
+    instrumented_us = stubbed_calls(instrumented, args.iterations)
+    print(f"{'client':<14} {'us/call':>8}")
+    print(f"{'plain':<14} {plain_us:>8.2f}")
+    print(f"{'instrumented':<14} {instrumented_us:>8.2f}")
+    print(f"{'overhead':<14} {instrumented_us - plain_us:>8.2f}")
+    print(f"{'registry only':<14} {registry_updates(args.iterations):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Augmented prompt generation: blocking invoke + XML extraction vs. streamed
+extraction with early termination on </prompt>.
+
+    python -m benchmarks.bench_prompt_stream --iterations 5
+    python -m benchmarks.bench_prompt_stream --iterations 5 --image ref.jpg
+
+The prompt cache is bypassed so every iteration reaches the model. For the
+blocking path time-to-first-token equals total latency; for the streamed path
+TTFT is when the first character inside <prompt> becomes available.
+"""
+import argparse
+import base64
+import statistics
+import time
+from genai_kit.aws.bedrock import BedrockModel
+from genai_kit.aws.claude import BedrockClaude
+from genai_kit.utils.converter import XmlStreamExtractor, extract_xml_values
+from genai_kit.utils.images import encode_image_base64_from_file
+from config import config
+
+
+PROMPT = """Create a detailed image generation prompt for the keyword below.
+Write your reasoning in <thinking> tags first, then the final prompt in <prompt> tags.
+Add a short <note> after the prompt.
+
+<keyword>
+{keyword}
+</keyword>
+"""
+
+
+def blocking(claude: BedrockClaude, text: str, image: str):
+    start = time.perf_counter()
+    res = claude.invoke_llm_response(text=text, image=image)
+    prompt = extract_xml_values(res, 'prompt') if res else ""
+    total = time.perf_counter() - start
+    return total, total, len(prompt)
+
+
+def streamed(claude: BedrockClaude, text: str, image: str):
+    start = time.perf_counter()
+    ttft = None
+    extractor = XmlStreamExtractor('prompt')
+    chunks = claude.converse_stream(
+        text=text,
+        image=base64.b64decode(image) if image else None,
+        image_format='jpeg',
+    )
+    try:
+        for chunk in chunks:
+            if extractor.feed(chunk) and ttft is None:
+                ttft = time.perf_counter() - start
+            if extractor.done:
+                break
+    finally:
+        chunks.close()
+    total = time.perf_counter() - start
+    return ttft or total, total, len(extractor.value)
+
+
+def report(name: str, results):
+    ttfts = [r[0] * 1000 for r in results]
+    totals = [r[1] * 1000 for r in results]
+    print(f"{name:<10} ttft p50 {statistics.median(ttfts):8.1f} ms   "
+          f"total p50 {statistics.median(totals):8.1f} ms   "
+          f"total mean {statistics.mean(totals):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--region", default=config.BEDROCK_REGION)
+    parser.add_argument("--keyword", default="a lighthouse at dusk")
+    parser.add_argument("--image", default=None, help="optional reference image path")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    image = encode_image_base64_from_file(args.image) if args.image else None
+    claude = BedrockClaude(region=args.region, modelId=BedrockModel.SONNET_3_5_CR)
+    text = PROMPT.format(keyword=args.keyword)
+
+    for name, fn in (("blocking", blocking), ("streamed", streamed)):
+        results = [fn(claude, text, image) for _ in range(args.iterations)]
+        report(name, results)
+
+
+if __name__ == "__main__":
+    main()
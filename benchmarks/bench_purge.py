@@ -0,0 +1,121 @@
+"""
+clear_all_items throughput: serial scan/delete vs. the parallel purge engine.
+
+Runs against local stand-ins for DynamoDB and S3 (DynamoDB Local + moto server):
+
+    docker run -p 8000:8000 amazon/dynamodb-local
+    moto_server -p 5000
+    python -m benchmarks.bench_purge --items 5000 --objects 5000 --rtt-ms 8
+
+Each mode seeds the same number of items and objects, then deletes them.
+--rtt-ms adds an artificial delay to every HTTP request to approximate the
+network round trip to the regional endpoints.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import boto3
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from genai_kit.aws.client import get_client
+from genai_kit.aws.dynamodb import DynamoDB
+from genai_kit.utils.random import random_id
+from services.purge import purge_bucket, purge_table
+from benchmarks.bench_upsert import ensure_table
+
+
+def legacy_delete_items(db: DynamoDB):
+    scan = db.table.scan()
+    with db.table.batch_writer() as batch:
+        for item in scan['Items']:
+            batch.delete_item(Key={'id': item['id']})
+
+    while 'LastEvaluatedKey' in scan:
+        scan = db.table.scan(ExclusiveStartKey=scan['LastEvaluatedKey'])
+        with db.table.batch_writer() as batch:
+            for item in scan['Items']:
+                batch.delete_item(Key={'id': item['id']})
+
+
+def legacy_delete_objects(s3, bucket: str):
+    paginator = s3.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket):
+        objects = page.get('Contents', [])
+        if objects:
+            s3.delete_objects(Bucket=bucket, Delete={'Objects': [{'Key': obj['Key']} for obj in objects]})
+
+
+def seed(db: DynamoDB, s3, bucket: str, items: int, objects: int):
+    with db.table.batch_writer() as batch:
+        for _ in range(items):
+            batch.put_item(Item={'id': random_id(), 'media_type': 'IMAGE', 'prompt': 'a lighthouse at dusk'})
+
+    keys = [f"{prefix}/{random_id()}.png" for prefix in ("image", "blob") for _ in range(objects // 2)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda key: s3.put_object(Bucket=bucket, Key=key, Body=b"x"), keys))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dynamodb-endpoint", default="http://localhost:8000")
+    parser.add_argument("--s3-endpoint", default="http://localhost:5000")
+    parser.add_argument("--table", default="nova-gallery-bench")
+    parser.add_argument("--bucket", default="nova-gallery-bench")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--objects", type=int, default=5000)
+    parser.add_argument("--segments", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    def on_send(**kwargs):
+        if args.rtt_ms:
+            time.sleep(args.rtt_ms / 1000)
+
+    # thread마다 새로 만드는 DynamoDB resource에도 지연이 들어가도록 default session에 등록
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    boto3.DEFAULT_SESSION.events.register("before-send", on_send)
+
+    db = DynamoDB(table_name=args.table, endpoint_url=args.dynamodb_endpoint)
+    ensure_table(db)
+    s3 = get_client('s3', endpoint_url=args.s3_endpoint)
+    s3.meta.events.register("before-send", on_send)
+    try:
+        s3.create_bucket(Bucket=args.bucket)
+    except s3.exceptions.BucketAlreadyOwnedByYou:
+        pass
+
+    modes = {
+        "serial": (
+            lambda: legacy_delete_items(db),
+            lambda: legacy_delete_objects(s3, args.bucket),
+        ),
+        "parallel": (
+            lambda: purge_table(db, segments=args.segments),
+            lambda: purge_bucket(s3, args.bucket, workers=args.workers),
+        ),
+    }
+
+    print(f"{'mode':<10} {'items/s':>10} {'objects/s':>10} {'total s':>8}")
+    for name, (delete_items, delete_objects) in modes.items():
+        seed(db, s3, args.bucket, args.items, args.objects)
+
+        start = time.perf_counter()
+        delete_items()
+        items_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        delete_objects()
+        objects_s = time.perf_counter() - start
+
+        print(f"{name:<10} {args.items / items_s:>10.0f} {args.objects / objects_s:>10.0f} "
+              f"{items_s + objects_s:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
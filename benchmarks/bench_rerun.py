@@ -0,0 +1,52 @@
+"""
+Data-path latency of one Streamlit rerun (gallery page + history page).
+
+    python -m benchmarks.bench_rerun --reruns 20
+
+"inline sync" reproduces the previous behaviour where every rerun called
+StorageService.sync_video_jobs() before listing; "poller" only reads the
+records the background VideoJobPoller has already written.
+Uses the tables and buckets configured in config.py.
+"""
+import argparse
+import statistics
+import time
+from services.storage_service import StorageService
+from config import config
+from constants import MediaType
+
+
+def rerun(storage: StorageService, page_size: int, inline_sync: bool):
+    if inline_sync:
+        storage.sync_video_jobs()
+    media_types = [type.value for type in MediaType]
+    storage.get_media_page(media_type=media_types, page_size=page_size)  # gallery
+    storage.get_media_page(media_type=media_types, page_size=page_size)  # history
+
+
+def measure(storage: StorageService, reruns: int, page_size: int, inline_sync: bool):
+    latencies = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        rerun(storage, page_size, inline_sync)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies), max(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    storage = StorageService(bucket_name=config.S3_BUCKET, cloudfront_domain=config.CF_DOMAIN)
+    rerun(storage, args.page_size, inline_sync=True)  # warm-up
+
+    print(f"{'mode':<12} {'p50 ms':>8} {'max ms':>8}")
+    for name, inline_sync in (("inline sync", True), ("poller", False)):
+        p50, worst = measure(storage, args.reruns, args.page_size, inline_sync)
+        print(f"{name:<12} {p50:>8.1f} {worst:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
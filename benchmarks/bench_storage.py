@@ -0,0 +1,99 @@
+"""
+Gallery listing latency per storage backend.
+
+    python -m benchmarks.bench_storage --records 5000 --pages 20 --page-size 20
+    python -m benchmarks.bench_storage --backend aws --pages 20
+
+"local" seeds --records image/video records into a LocalStorageBackend in a
+temporary directory (SQLite + filesystem, no AWS access needed) and reports
+upsert throughput. "aws" only reads the table configured in config.py.
+Both then page through the gallery (summary listing, newest first across
+media types) and fetch full details for each page, as the UI does.
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from services.local_storage import LocalStorageBackend
+from services.storage_service import StorageService
+from genai_kit.aws.amazon_video import VideoStatus
+from genai_kit.aws.bedrock import BedrockModel
+from config import config
+
+
+def seed(storage: StorageService, records: int) -> float:
+    start = time.perf_counter()
+    for i in range(records):
+        if i % 5:
+            storage.upload_image(
+                model_type=BedrockModel.NOVA_CANVAS.value,
+                prompt=f"A watercolor painting of a lighthouse #{i}",
+                details={
+                    'taskType': 'TEXT_IMAGE',
+                    'imageGenerationConfig': {'width': 1024, 'height': 1024, 'cfgScale': 6.5, 'seed': i},
+                },
+                id=f"image-{i:08d}",
+                url=f"{storage.backend.url(f'image/image-{i:08d}')}.png",
+            )
+        else:
+            storage.update_video_status(
+                model_type=BedrockModel.NOVA_REEL.value,
+                prompt=f"Slow dolly shot through a neon-lit market #{i}",
+                details={
+                    'status': random.choice([VideoStatus.IN_PROGRESS.value, VideoStatus.COMPLETED.value]),
+                    'submitTime': '2025-01-01T00:00:00+00:00',
+                },
+                id=f"video-{i:08d}",
+            )
+    return records / (time.perf_counter() - start)
+
+
+def measure(storage: StorageService, pages: int, page_size: int):
+    list_ms, detail_ms = [], []
+    cursor = None
+    for _ in range(pages):
+        start = time.perf_counter()
+        items, cursor = storage.get_media_page(page_size=page_size, cursor=cursor, summary=True)
+        list_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        storage.get_media_details([item['id'] for item in items])
+        detail_ms.append((time.perf_counter() - start) * 1000)
+        if cursor is None:
+            break
+    return list_ms, detail_ms
+
+
+def percentile(samples, q: float) -> float:
+    return statistics.quantiles(samples, n=100)[int(q) - 1] if len(samples) > 1 else samples[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["local", "aws"], default="local")
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path:
+        if args.backend == "local":
+            backend = LocalStorageBackend(path, media_url="http://localhost:8502")
+            storage = StorageService(bucket_name="", cloudfront_domain="", backend=backend)
+            rate = seed(storage, args.records)
+            print(f"seeded {args.records} records: {rate:,.0f} upserts/s")
+        else:
+            storage = StorageService(bucket_name=config.S3_BUCKET, cloudfront_domain=config.CF_DOMAIN)
+
+        measure(storage, 1, args.page_size)  # warm-up
+        list_ms, detail_ms = measure(storage, args.pages, args.page_size)
+
+    print(f"{'operation':<12} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, samples in (("list page", list_ms), ("details", detail_ms)):
+        print(f"{name:<12} {statistics.median(samples):>8.3f} {percentile(samples, 95):>8.3f}")
+    print(f"in-progress videos: {len(storage.get_in_progress_videos())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+DynamoDB bytes read per gallery/history page: full items vs. summary projection.
+
+    python -m benchmarks.bench_summary --pages 5 --page-size 20
+
+"full" reproduces the previous listing that returned whole items (inline
+ref_image base64 and the complete details dict); "summary" projects only the
+listing attributes. Response sizes come from the Content-Length recorded by
+genai_kit.aws.metrics, so they are what actually crossed the wire.
+Uses the tables and buckets configured in config.py.
+"""
+import argparse
+import statistics
+import time
+from genai_kit.aws.metrics import registry
+from services.storage_service import StorageService
+from config import config
+from constants import MediaType
+
+
+def query_bytes() -> int:
+    return sum(
+        row['response_bytes'] for row in registry.snapshot()
+        if row['service'] == 'dynamodb' and row['operation'] == 'Query'
+    )
+
+
+def measure(storage: StorageService, pages: int, page_size: int, summary: bool):
+    media_types = [type.value for type in MediaType]
+    sizes, latencies = [], []
+    cursor = None
+    for _ in range(pages):
+        before = query_bytes()
+        start = time.perf_counter()
+        items, cursor = storage.get_media_page(
+            media_type=media_types, page_size=page_size, cursor=cursor, summary=summary
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        sizes.append(query_bytes() - before)
+        if cursor is None:
+            break
+    return statistics.mean(sizes), statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    storage = StorageService(bucket_name=config.S3_BUCKET, cloudfront_domain=config.CF_DOMAIN)
+    measure(storage, 1, args.page_size, summary=True)  # warm-up
+
+    print(f"{'mode':<10} {'KB/page':>10} {'p50 ms':>8}")
+    for name, summary in (("full", False), ("summary", True)):
+        size, p50 = measure(storage, args.pages, args.page_size, summary)
+        print(f"{name:<10} {size / 1024:>10.1f} {p50:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Media record write benchmark: get -> put/update -> get vs. single UpdateItem upsert.
+
+Runs against a local DynamoDB stand-in (DynamoDB Local or moto server):
+
+    docker run -p 8000:8000 amazon/dynamodb-local
+    python -m benchmarks.bench_upsert --endpoint-url http://localhost:8000 --rtt-ms 8
+
+--rtt-ms adds an artificial delay to every HTTP request to approximate the
+network round trip to a regional DynamoDB endpoint.
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from genai_kit.aws.dynamodb import DynamoDB
+from genai_kit.utils.random import random_id
+
+
+def legacy_upsert(db: DynamoDB, id: str, updates: dict, defaults: dict):
+    existing_item = db.get_item(id)
+    if existing_item:
+        db.update_item(id, updates)
+        return db.get_item(id)
+    db.put_item({"id": id, **defaults, **updates})
+    return db.get_item(id)
+
+
+def single_upsert(db: DynamoDB, id: str, updates: dict, defaults: dict):
+    return db.upsert_item(id, updates=updates, defaults=defaults)
+
+
+def make_record(step: int):
+    now = datetime.now().isoformat()
+    updates = {
+        "model_type": "amazon.nova-canvas-v1:0",
+        "url": f"https://example.cloudfront.net/image/{step}.png",
+        "updated_at": now,
+        "details": {
+            "taskType": "TEXT_IMAGE",
+            "textToImageParams": {"text": "a lighthouse at dusk"},
+            "imageGenerationConfig": {"numberOfImages": 1, "width": 1024, "height": 1024,
+                                      "cfgScale": 8.0, "seed": step},
+        },
+    }
+    defaults = {
+        "media_type": "IMAGE",
+        "prompt": "a lighthouse at dusk",
+        "ref_image": None,
+        "created_at": now,
+    }
+    return updates, defaults
+
+
+def ensure_table(db: DynamoDB):
+    client = db.db.meta.client
+    if db.name in client.list_tables()["TableNames"]:
+        return
+    client.create_table(
+        TableName=db.name,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    client.get_waiter("table_exists").wait(TableName=db.name)
+
+
+def run(db: DynamoDB, fn, iterations: int, counter: dict):
+    latencies = []
+    counter["requests"] = 0
+    ids = [random_id() for _ in range(iterations)]
+
+    # 신규 생성 + 재갱신 (video sync 경로처럼 같은 id를 두 번 기록)
+    for rewrite in (False, True):
+        for step, id in enumerate(ids):
+            updates, defaults = make_record(step)
+            start = time.perf_counter()
+            record = fn(db, id, updates, defaults)
+            latencies.append(time.perf_counter() - start)
+            assert record["created_at"] and record["media_type"] == "IMAGE"
+
+    calls = len(ids) * 2
+    return {
+        "round_trips_per_write": counter["requests"] / calls,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": statistics.quantiles(latencies, n=20)[18] * 1000,
+        "total_s": sum(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", default="http://localhost:8000")
+    parser.add_argument("--table", default="nova-gallery-bench")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    db = DynamoDB(table_name=args.table, endpoint_url=args.endpoint_url)
+    ensure_table(db)
+
+    counter = {"requests": 0}
+
+    def on_send(**kwargs):
+        counter["requests"] += 1
+        if args.rtt_ms:
+            time.sleep(args.rtt_ms / 1000)
+
+    db.db.meta.client.meta.events.register("before-send.dynamodb", on_send)
+
+    results = {
+        "get -> put/update -> get": run(db, legacy_upsert, args.iterations, counter),
+        "upsert_item (UpdateItem ALL_NEW)": run(db, single_upsert, args.iterations, counter),
+    }
+
+    print(f"{'path':<34} {'RT/write':>9} {'p50 ms':>8} {'p95 ms':>8} {'total s':>8}")
+    for name, r in results.items():
+        print(f"{name:<34} {r['round_trips_per_write']:>9.2f} {r['p50_ms']:>8.2f} "
+              f"{r['p95_ms']:>8.2f} {r['total_s']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
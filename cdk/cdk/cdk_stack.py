@@ -7,6 +7,7 @@ from aws_cdk import (
     aws_cloudfront_origins as origins,
     aws_dynamodb as dynamodb,
     aws_apprunner as apprunner,
+    Duration,
     RemovalPolicy, 
     CfnOutput
 )
@@ -29,6 +30,10 @@ class CdkStack(Stack):
             bucket_name=generate_name("bucket-2"),
             removal_policy=RemovalPolicy.DESTROY,
             block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            lifecycle_rules=[
+                # 생성 결과 캐시 (services/generation_cache.py)
+                s3.LifecycleRule(prefix="cache/", expiration=Duration.days(30)),
+            ],
         )
 
         # CloudFront OAC 생성
@@ -82,6 +87,20 @@ class CdkStack(Stack):
             removal_policy=RemovalPolicy.DESTROY
         )
 
+        # 미디어 유형별 최신순 조회를 위한 GSI
+        table.add_global_secondary_index(
+            index_name="media_type-created_at-index",
+            partition_key=dynamodb.Attribute(
+                name="media_type",
+                type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="created_at",
+                type=dynamodb.AttributeType.STRING
+            ),
+            projection_type=dynamodb.ProjectionType.ALL
+        )
+
         # 출력값 정의
         CfnOutput(self, "BucketName", value=bucket.bucket_name)
         CfnOutput(self, "CloudFrontDomainName", value=distribution.domain_name)
@@ -1,28 +1,49 @@
-import json
 import streamlit as st
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from components.pagination import load_media_page, show_page_controls
+from session import SessionManager
 from constants import MediaType
 from utils import format_datetime
 
 
-def show_gallery(media_items: List[dict] = [], cols_per_row: int = 3, show_details: bool = False):
+def show_gallery(session_manager: SessionManager,
+                 filter_type: List[str],
+                 cols_per_row: int = 3,
+                 show_details: bool = False,
+                 page_size: int = 20):
     st.title("🖼️ GenAI Gallery")
 
+    media_items, page_index, next_cursor = load_media_page(
+        session_manager, "gallery", filter_type, page_size
+    )
+
     if media_items and len(media_items) > 0:
-        display_media_grid(media_items, cols_per_row, show_details)
+        details = {}
+        if show_details:
+            # 상세 정보를 켠 항목만 한 번에 조회
+            details = session_manager.get_history_details([
+                item for item in media_items if st.session_state.get(_detail_key(item))
+            ])
+        display_media_grid(media_items, cols_per_row, show_details, details)
     else:
         st.info("표시할 미디어가 없습니다.")
 
-def display_media_grid(media_items: List[Dict[str, Any]], cols_per_row: int, show_details: bool):
+    show_page_controls("gallery", page_index, next_cursor)
+
+def display_media_grid(media_items: List[Dict[str, Any]],
+                       cols_per_row: int,
+                       show_details: bool,
+                       details: Optional[Dict[str, Dict[str, Any]]] = None):
     cols = st.columns(cols_per_row)
+    details = details or {}
     
     for idx, item in enumerate(media_items):
         col_idx = idx % cols_per_row
         
         with cols[col_idx]:
-            display_media_item(item, show_details)
+            display_media_item(item, show_details, details.get(item.get('id')))
 
-def display_media_item(item: Dict[str, Any], show_details: bool):
+def display_media_item(item: Dict[str, Any], show_details: bool, detail: Optional[Dict[str, Any]] = None):
     container = st.container()
     
     media_type = item.get('media_type', '')
@@ -38,10 +59,13 @@ def display_media_item(item: Dict[str, Any], show_details: bool):
             st.code(item.get('prompt', ''), wrap_lines=True, language='txt')
             st.markdown(f"**ID:** {item.get('id', '')}")
             st.markdown(f"**모델:** {item.get('model_type', '')}")
-            if details := item.get('details'):
-                st.markdown("**상세 정보:**")
-                st.json(json.loads(json.dumps(details, default=float)), expanded=False)
+            if st.toggle("상세 정보", key=_detail_key(item)) and detail:
+                st.json(detail.get('details') or {}, expanded=False)
     else:
         prompt = item.get('prompt', '')
         if len(prompt) > 0:
             container.caption(f"_{prompt}_")
+
+
+def _detail_key(item: Dict[str, Any]) -> str:
+    return f"gallery_detail_{item.get('id', '')}"
@@ -1,15 +1,29 @@
-import json
 import streamlit as st
 from typing import List
 from genai_kit.utils.images import base64_to_image
+from components.pagination import load_media_page, show_page_controls
+from session import SessionManager
 from constants import MediaType
 from utils import format_datetime
 
 
-def show_history(media_items: List[dict] = [], cols_per_row: int = 1, show_details: bool = False):
+def show_history(session_manager: SessionManager,
+                 filter_type: List[str],
+                 cols_per_row: int = 1,
+                 show_details: bool = False,
+                 page_size: int = 20):
     st.title("📋 Request History")
 
+    media_items, page_index, next_cursor = load_media_page(
+        session_manager, "history", filter_type, page_size
+    )
+
     if media_items and len(media_items) > 0:
+        # 상세 정보는 펼쳐 본 항목만 한 번에 조회
+        details = session_manager.get_history_details([
+            item for item in media_items
+            if show_details or st.session_state.get(_detail_key(item))
+        ])
         cols = st.columns(cols_per_row)
         
         for idx, item in enumerate(media_items):
@@ -17,15 +31,17 @@ def show_history(media_items: List[dict] = [], cols_per_row: int = 1, show_detai
                 icon = _get_emoji(item['media_type'])
                 with st.expander(
                     f"**{item['media_type']}** - **{item.get('id', '')}** - {format_datetime(item['created_at'])}",
-                    expanded=show_details,
+                    expanded=show_details or item['id'] in details,
                     icon=icon,
                 ):
-                    display_history_item(item)
+                    display_history_item(item, details.get(item['id']), show_details)
     else:
         st.info("아직 요청 기록이 없습니다.")
 
+    show_page_controls("history", page_index, next_cursor)
+
 
-def display_history_item(item):
+def display_history_item(item, detail=None, show_details: bool = False):
     col1, col2 = st.columns([1, 3])
     
     with col1:
@@ -37,21 +53,22 @@ def display_history_item(item):
     
     with col2:
         media_type = item['media_type']
-        details = json.loads(json.dumps(item['details'], default=float))
         task_type = media_type
-        prompt = item.get('prompt', '')
+        prompt = item.get('prompt') or ''
 
-        if media_type == MediaType.IMAGE.value and isinstance(details, dict):
-            task_type = f"{media_type} ➡️ {details.get('taskType', '')}"
+        summary_details = item.get('details') or {}
+        if media_type == MediaType.IMAGE.value and summary_details.get('taskType'):
+            task_type = f"{media_type} ➡️ {summary_details['taskType']}"
                 
         st.text(item['id'])
         st.text(format_datetime(item['created_at'], seconds=True))
         st.text(task_type)
         st.text(item['model_type'])
 
-        ref_image = item.get('ref_image', None)
-        if ref_image:            
-            st.image(base64_to_image(ref_image),width=400)
+        ref_image = (detail or {}).get('ref_image', None)
+        if ref_image:
+            # blob 참조는 URL로 변환되어 있음 (이전 레코드는 base64)
+            st.image(ref_image if ref_image.startswith(('http://', 'https://')) else base64_to_image(ref_image), width=400)
 
         if len(prompt) > 0:
             st.code(prompt, wrap_lines=True, language='txt')
@@ -63,8 +80,15 @@ def display_history_item(item):
             st.image(url)
         elif url and media_type == MediaType.VIDEO.value:
             st.video(url)
-                
-        st.json(details)
+
+        if not show_details:
+            st.toggle("상세 정보", key=_detail_key(item))
+        if detail:
+            st.json(detail.get('details') or {})
+
+
+def _detail_key(item) -> str:
+    return f"history_detail_{item['id']}"
 
 
 def _get_emoji(media_type: str):
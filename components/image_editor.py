@@ -3,10 +3,11 @@ from typing import List
 from genai_kit.aws.amazon_image import ImageParams, TitanImageSize, NovaImageSize
 from genai_kit.aws.sd_image import SDImageSize
 from genai_kit.aws.bedrock import BedrockModel
-from genai_kit.utils.images import encode_image_base64, base64_to_bytes
-from services.bedrock_service import edit_image
+from genai_kit.utils.images import encode_image_base64
+from components.jobs import show_jobs
+from services.job_queue import JobKind
 from session import SessionManager
-from constants import EditingMode, MediaType
+from constants import EditingMode
 
 
 def show_image_editor(session_manager: SessionManager):
@@ -27,6 +28,8 @@ def show_image_editor(session_manager: SessionManager):
     if generate_clicked:
         generate_image(session_manager)
 
+    show_jobs(session_manager, JobKind.EDIT_IMAGE)
+
 def initialize_session_state():
     if 'editing_mode' not in st.session_state:
         st.session_state.editing_mode = ""
@@ -100,55 +103,20 @@ def show_model_section():
 
 
 def generate_image(session_manager: SessionManager):
-    st.divider()
-    st.subheader("Generated Images")
-    
-    with st.status("Generating images...", expanded=True) as status:
-        try:
-            configs = st.session_state.generation_configs
-
-            model_type = BedrockModel(st.session_state.model_type)
-            imgs, configuration = edit_image(
-                model_type=model_type,
-                editing_mode=st.session_state.editing_mode,
-                text=st.session_state.editing_text,
-                mask_prompt=st.session_state.mask_prompt,
-                ref_image=st.session_state.ref_image,
-                size=configs['size'],
-                count=configs['num_images'],
-                seed=configs['seed'],
-                cfg=configs['cfg_scale'],
-            )
-
-            print(configuration)
-
-            # Display prompt and generated image
-            if st.session_state.editing_text and len(st.session_state.editing_text) > 0:
-                st.info(st.session_state.editing_text)\
-
-            cols = st.columns(len(imgs))
-            for idx, img in enumerate(imgs):
-                with cols[idx]:
-                    image_data = base64_to_bytes(img)
-                    st.image(image_data, use_container_width=True)
-            
-                # Add to history
-                session_manager.add_to_history(
-                    prompt=st.session_state.editing_text,
-                    media_type = MediaType.IMAGE,
-                    model_type = model_type,
-                    media_file=image_data,
-                    details = configuration,
-                    ref_image = st.session_state.ref_image,
-                )
-            
-            status.update(label="Generation completed!", state="complete")
-            
-        except Exception as e:
-            status.update(label=f"Error: {str(e)}", state="error")
-            st.error(f"이미지 생성 중 오류가 발생했습니다: {str(e)}")
-        finally:
-            st.session_state.is_generating_image = False
+    # 편집은 job worker가 실행하고, 결과는 show_jobs()가 갱신하며 표시
+    configs = st.session_state.generation_configs
+    session_manager.submit_job(
+        JobKind.EDIT_IMAGE,
+        model_type=BedrockModel(st.session_state.model_type).value,
+        editing_mode=EditingMode(st.session_state.editing_mode).value,
+        prompt=st.session_state.editing_text,
+        mask_prompt=st.session_state.mask_prompt,
+        ref_image=st.session_state.ref_image,
+        size=configs['size'].name,
+        count=configs['num_images'],
+        seed=configs['seed'],
+        cfg=configs['cfg_scale'],
+    )
 
 def _get_model_configurations(model_type: str):
     num_images = st.slider("Number of Images", 1, 5, 1, key="editing_num_image")
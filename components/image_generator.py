@@ -3,17 +3,31 @@ from typing import List
 from genai_kit.aws.amazon_image import ImageParams, TitanImageSize, NovaImageSize
 from genai_kit.aws.sd_image import SDImageSize
 from genai_kit.aws.bedrock import BedrockModel
-from genai_kit.utils.images import encode_image_base64, base64_to_bytes
+from genai_kit.utils.images import encode_image_base64, base64_to_raw_bytes
 from services.bedrock_service import (
-    gen_english,
-    gen_mm_image_prompt,
-    gen_image,
+    stream_english,
+    stream_mm_image_prompt,
+    gen_image_batch,
+    gen_image_compare,
     is_sd_model,
 )
+from components.jobs import show_jobs
+from components.streaming import stream_prompt
+from services.job_queue import JobKind
 from session import SessionManager
 from constants import MediaType
 
 
+IMAGE_MODELS = [
+    BedrockModel.NOVA_CANVAS,
+    BedrockModel.TITAN_IMAGE,
+    BedrockModel.STABLE_IMAGE_CORE,
+    BedrockModel.STABLE_IMAGE_ULTRA,
+    BedrockModel.SD3_LARGE,
+]
+BATCH_GRID_COLUMNS = 5
+
+
 def show_image_generator(session_manager: SessionManager):
     st.title("🎨 Image Generator")
     initialize_session_state()
@@ -30,7 +44,14 @@ def show_image_generator(session_manager: SessionManager):
         generate_clicked = show_model_section()
 
     if generate_clicked:
-        generate_image(session_manager)
+        if st.session_state.compare_mode:
+            generate_comparison(session_manager)
+        elif st.session_state.generation_configs['batch']:
+            generate_image_batch(session_manager)
+        else:
+            generate_image(session_manager)
+
+    show_jobs(session_manager, JobKind.GEN_IMAGE)
 
 def initialize_session_state():
     if 'image_prompt' not in st.session_state:
@@ -45,6 +66,8 @@ def initialize_session_state():
         st.session_state.model_type = ""
     if 'generation_configs' not in st.session_state:
         st.session_state.generation_configs = None
+    if 'compare_mode' not in st.session_state:
+        st.session_state.compare_mode = False
 
 def show_prompt_section():
     st.subheader("Generate a Image Prompt")
@@ -62,7 +85,9 @@ def show_prompt_section():
         prompt_text = st.text_area("Enter your prompt:", height=150)
         if st.button("Generate Prompt", icon='📝', type="primary", use_container_width=True):
             with st.spinner("Generating prompt..."):
-                st.session_state.image_prompt = gen_english(
+                st.session_state.image_prompt = stream_prompt(
+                    stream_english,
+                    fallback=prompt_text,
                     request=prompt_text,
                     temperature=temperature,
                     top_p=top_p,
@@ -81,7 +106,9 @@ def show_prompt_section():
                 if reference_image:
                     image = encode_image_base64(reference_image)
                     st.session_state.ref_image = image
-                st.session_state.image_prompt = gen_mm_image_prompt(
+                st.session_state.image_prompt = stream_prompt(
+                    stream_mm_image_prompt,
+                    fallback=multimodal_keyword_text,
                     keyword=multimodal_keyword_text,
                     image=image,
                     temperature=temperature,
@@ -102,10 +129,27 @@ def show_image_prompt_section():
 
 def show_model_section():
     st.subheader("Select Image Model")
+    compare_mode = st.toggle("Compare Models", key="compare_mode")
+
+    if compare_mode:
+        model_types = st.multiselect(
+            "Choose models to compare:",
+            IMAGE_MODELS,
+            default=IMAGE_MODELS,
+            format_func=lambda x: x.name
+        )
+        st.session_state.compare_model_types = model_types
+
+        with st.expander("Image Configuration", expanded=True):
+            configs = _get_comparison_configurations()
+            st.session_state.generation_configs = configs
+
+        return st.button("Compare Models", icon='⚖️', type="primary", use_container_width=True,
+                         disabled=len(model_types) == 0)
+
     model_type = st.selectbox(
         "Choose a model:",
-        [BedrockModel.NOVA_CANVAS, BedrockModel.TITAN_IMAGE,
-         BedrockModel.STABLE_IMAGE_CORE, BedrockModel.STABLE_IMAGE_ULTRA, BedrockModel.SD3_LARGE],
+        IMAGE_MODELS,
          format_func=lambda x: x.name
     )
 
@@ -118,55 +162,154 @@ def show_model_section():
     return st.button("Generate Images", icon='🎨', type="primary", use_container_width=True)
 
 def generate_image(session_manager: SessionManager):
+    # 생성은 job worker가 실행하고, 결과는 show_jobs()가 갱신하며 표시
+    configs = st.session_state.generation_configs
+    session_manager.submit_job(
+        JobKind.GEN_IMAGE,
+        model_type=BedrockModel(st.session_state.model_type).value,
+        prompt=st.session_state.image_prompt,
+        size=configs['size'].name,
+        count=configs['num_images'],
+        seed=configs['seed'],
+        cfg=configs['cfg_scale'],
+        color_guide=configs['selected_colors'],
+        ref_image=st.session_state.ref_image,
+    )
+
+def generate_image_batch(session_manager: SessionManager):
     st.divider()
     st.subheader("Generated Images")
-    
-    with st.status("Generating images...", expanded=True) as status:
-        try:
-            configs = st.session_state.generation_configs
-
-            model_type = BedrockModel(st.session_state.model_type)
-            imgs, configuration = gen_image(
-                prompt = st.session_state.image_prompt,
-                model_type=model_type,
-                size=configs['size'],
-                count=configs['num_images'],
-                seed=configs['seed'],
-                cfg=configs['cfg_scale'],
-                color_guide=configs['selected_colors']
-            )
-
-            print(configuration)
-
-            # Display prompt and generated image
-            st.info(st.session_state.image_prompt)
-            cols = st.columns(len(imgs))
-            for idx, img in enumerate(imgs):
-                with cols[idx]:
-                    image_data = base64_to_bytes(img)
-                    st.image(image_data, use_container_width=True)
-            
-                # Add to history
-                session_manager.add_to_history(
+
+    configs = st.session_state.generation_configs
+    model_type = BedrockModel(st.session_state.model_type)
+    total = configs['total_images']
+    st.info(st.session_state.image_prompt)
+
+    progress = st.progress(0.0, text=f"0 / {total}")
+    cols = st.columns(BATCH_GRID_COLUMNS)
+    uploads = []
+    done = 0
+
+    shards = gen_image_batch(
+        prompt=st.session_state.image_prompt,
+        model_type=model_type,
+        size=configs['size'],
+        total=total,
+        seed=configs['seed'],
+        cfg=configs['cfg_scale'],
+        color_guide=configs['selected_colors'],
+        max_workers=configs['max_workers'],
+    )
+    for shard in shards:
+        if shard['error']:
+            st.error(f"Shard {shard['index']} (seed {shard['seed']}) 생성 중 오류가 발생했습니다: {shard['error']}")
+            continue
+
+        used_model = shard['used_model']
+        if used_model != model_type:
+            st.warning(f"Shard {shard['index']}: {model_type.name} 모델을 사용할 수 없어 {used_model.name}로 생성했습니다")
+
+        for img in shard['images']:
+            image_data = base64_to_raw_bytes(img)
+            with cols[done % BATCH_GRID_COLUMNS]:
+                st.image(image_data, caption=f"seed {shard['seed']} · {used_model.name}", use_container_width=True)
+            done += 1
+
+            # 생성이 계속되는 동안 업로드를 백그라운드로 진행
+            uploads.append(session_manager.add_to_history_async(
+                prompt=st.session_state.image_prompt,
+                media_type = MediaType.IMAGE,
+                model_type = used_model,
+                media_file=image_data,
+                details = shard['body'],
+                ref_image = st.session_state.ref_image,
+            ))
+        progress.progress(min(done / total, 1.0), text=f"{done} / {total}")
+
+    with st.spinner("Uploading images..."):
+        session_manager.wait_for_history(uploads)
+
+def generate_comparison(session_manager: SessionManager):
+    st.divider()
+    st.subheader("Model Comparison")
+
+    configs = st.session_state.generation_configs
+    model_types = st.session_state.compare_model_types
+    st.info(st.session_state.image_prompt)
+
+    # 모델별 자리를 먼저 만들고 결과가 도착하는 순서대로 채움
+    placeholders = {}
+    cols = st.columns(len(model_types))
+    for idx, model_type in enumerate(model_types):
+        with cols[idx]:
+            st.markdown(f"**{model_type.name}**")
+            placeholders[model_type] = st.empty()
+            placeholders[model_type].info("Generating...")
+
+    uploads = []
+    with st.status("Generating images...", expanded=False) as status:
+        results = gen_image_compare(
+            model_types=model_types,
+            prompt=st.session_state.image_prompt,
+            width=configs['size'].width,
+            height=configs['size'].height,
+            seed=configs['seed'],
+            cfg=configs['cfg_scale'],
+        )
+        for result in results:
+            model_type = result['model_type']
+            container = placeholders[model_type].container()
+
+            if result['error']:
+                container.error(result['error'])
+                st.write(f"{model_type.name}: failed ({result['latency']:.1f}s)")
+                continue
+
+            for img in result['images']:
+                image_data = base64_to_raw_bytes(img)
+                container.image(image_data, use_container_width=True)
+
+                uploads.append(session_manager.add_to_history_async(
                     prompt=st.session_state.image_prompt,
                     media_type = MediaType.IMAGE,
                     model_type = model_type,
                     media_file=image_data,
-                    details = configuration,
+                    details = result['body'],
                     ref_image = st.session_state.ref_image,
-                )
-            
-            status.update(label="Generation completed!", state="complete")
-            
-        except Exception as e:
-            status.update(label=f"Error: {str(e)}", state="error")
-            st.error(f"이미지 생성 중 오류가 발생했습니다: {str(e)}")
-        finally:
-            st.session_state.is_generating_image = False
+                ))
+            container.caption(f"⏱️ {result['latency']:.2f}s")
+            st.write(f"{model_type.name}: {result['latency']:.2f}s")
+
+        status.update(label="Comparison completed!", state="complete")
+
+    with st.spinner("Uploading images..."):
+        session_manager.wait_for_history(uploads)
+
+def _get_comparison_configurations():
+    cfg_scale = st.slider("CFG Scale", 1.0, 10.0, 8.0, 0.5, key="compare_cfg_scale")
+    seed = st.number_input("Seed", 0, 2147483646, 0, key="compare_seed")
+
+    # 모델별로 가장 가까운 지원 크기로 변환됨
+    size_options = {f"{size.width} X {size.height}": size for size in NovaImageSize}
+    selected_size = st.selectbox("Image Size", options=list(size_options.keys()),
+                                 index=1, key="compare_size")
+
+    return {
+        'cfg_scale': cfg_scale,
+        'seed': seed,
+        'size': size_options[selected_size],
+    }
 
 def _get_model_configurations(model_type: str):
     disabled = is_sd_model(model_type)
-    num_images = st.slider("Number of Images", 1, 5, 1, disabled=disabled)
+    batch = st.checkbox("Batch generation", key="batch_generation")
+    if batch:
+        num_images = 1
+        total_images = st.slider("Total Images", 5, 50, 20, 5)
+        max_workers = st.slider("Max Concurrency", 1, 8, 4)
+    else:
+        num_images = st.slider("Number of Images", 1, 5, 1, disabled=disabled)
+        total_images, max_workers = num_images, 1
     cfg_scale = st.slider("CFG Scale", 1.0, 10.0, 8.0, 0.5, disabled=disabled)
     seed = st.number_input("Seed", 0, 2147483646, 0)
     
@@ -200,6 +343,9 @@ def _get_model_configurations(model_type: str):
 
     return {
         'num_images': num_images,
+        'batch': batch,
+        'total_images': total_images,
+        'max_workers': max_workers,
         'cfg_scale': cfg_scale,
         'seed': seed,
         'size': size_options[selected_size],
@@ -0,0 +1,78 @@
+import streamlit as st
+from datetime import datetime
+from typing import Any, Dict, List
+from services.job_queue import JobKind, JobStatus
+from session import SessionManager
+from utils import format_datetime
+
+
+REFRESH_INTERVAL = 2  # seconds
+MAX_VISIBLE_JOBS = 10
+STATUS_ICONS = {
+    JobStatus.QUEUED.value: '⏳',
+    JobStatus.RUNNING.value: '🔄',
+    JobStatus.DONE.value: '✅',
+    JobStatus.FAILED.value: '❌',
+}
+
+
+def show_jobs(session_manager: SessionManager, kind: JobKind):
+    '''
+    이 세션이 제출한 job 목록을 표시합니다.
+    진행 중인 job이 있는 동안에는 이 영역만 REFRESH_INTERVAL마다 다시 그립니다.
+    '''
+    pending = _has_pending(session_manager.get_jobs(kind))
+    st.fragment(_show_job_list, run_every=REFRESH_INTERVAL if pending else None)(session_manager, kind, pending)
+
+
+def _show_job_list(session_manager: SessionManager, kind: JobKind, refreshing: bool):
+    jobs = session_manager.get_jobs(kind)
+    if refreshing and not _has_pending(jobs):
+        # 모두 끝나면 전체를 다시 그려 history에 반영하고 자동 갱신을 멈춤
+        st.rerun()
+    if not jobs:
+        return
+
+    st.divider()
+    st.subheader("Jobs")
+    for job in jobs[:MAX_VISIBLE_JOBS]:
+        icon = STATUS_ICONS.get(job['status'], '')
+        with st.expander(
+            f"**{job['status']}** - {job['id'][:8]} - "
+            f"{format_datetime(datetime.fromtimestamp(job['created_at']).isoformat())}",
+            expanded=job['status'] != JobStatus.FAILED.value,
+            icon=icon,
+        ):
+            display_job(job)
+
+
+def display_job(job: Dict[str, Any]):
+    if job['status'] == JobStatus.FAILED.value:
+        st.error(f"생성 중 오류가 발생했습니다: {job['error']}")
+        return
+
+    if job['status'] != JobStatus.DONE.value:
+        st.caption("대기 중..." if job['status'] == JobStatus.QUEUED.value else "생성 중...")
+        return
+
+    result = job['result'] or {}
+    if 'fallback_model' in result:
+        st.warning(f"{result['model_type']} 모델을 사용할 수 없어 {result['fallback_model']}로 생성했습니다")
+
+    records = result.get('records', [])
+    if job['kind'] == JobKind.GEN_VIDEO.value:
+        for record in records:
+            st.caption("비디오 생성이 시작되었습니다. 작업은 약 5분 소요됩니다.")
+            st.json(record.get('details', {}), expanded=False)
+        return
+
+    if records:
+        st.info(records[0].get('prompt') or '')
+        cols = st.columns(len(records))
+        for idx, record in enumerate(records):
+            with cols[idx]:
+                st.image(record['url'], use_container_width=True)
+
+
+def _has_pending(jobs: List[Dict[str, Any]]) -> bool:
+    return any(job['status'] in (JobStatus.QUEUED.value, JobStatus.RUNNING.value) for job in jobs)
@@ -0,0 +1,84 @@
+import streamlit as st
+from typing import Any, Dict, List, Optional, Tuple
+from session import SessionManager
+
+
+def load_media_page(
+    session_manager: SessionManager,
+    key: str,
+    filter_type: List[str],
+    page_size: int,
+) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+    """
+    현재 페이지 커서로 한 페이지만 조회합니다.
+
+    Returns:
+        (items, page_index, next_cursor)
+    """
+    state = _get_page_state(key, filter_type, page_size)
+    if not filter_type:
+        return [], 0, None
+
+    cursor = state['cursors'][state['page']]
+    items, next_cursor = session_manager.get_history_page(
+        media_type=filter_type,
+        page_size=page_size,
+        cursor=cursor,
+    )
+    return items, state['page'], next_cursor
+
+
+def show_page_controls(key: str, page_index: int, next_cursor: Optional[str]):
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+
+    with col_prev:
+        st.button(
+            "이전",
+            icon="⬅️",
+            key=f"{key}_prev_page",
+            disabled=page_index == 0,
+            on_click=_move_page,
+            args=(key, -1, None),
+            use_container_width=True,
+        )
+    with col_page:
+        st.markdown(
+            f"<div style='text-align: center;'>{page_index + 1} 페이지</div>",
+            unsafe_allow_html=True,
+        )
+    with col_next:
+        st.button(
+            "다음",
+            icon="➡️",
+            key=f"{key}_next_page",
+            disabled=next_cursor is None,
+            on_click=_move_page,
+            args=(key, 1, next_cursor),
+            use_container_width=True,
+        )
+
+
+def _get_page_state(key: str, filter_type: List[str], page_size: int) -> Dict[str, Any]:
+    state_key = f"{key}_pagination"
+    filter_key = (tuple(sorted(filter_type)), page_size)
+    state = st.session_state.get(state_key)
+
+    # 필터나 페이지 크기가 바뀌면 첫 페이지부터 다시 조회
+    if state is None or state['filter'] != filter_key:
+        state = {
+            'filter': filter_key,
+            'cursors': [None],
+            'page': 0,
+        }
+        st.session_state[state_key] = state
+    return state
+
+
+def _move_page(key: str, step: int, next_cursor: Optional[str]):
+    state = st.session_state[f"{key}_pagination"]
+    if step > 0:
+        del state['cursors'][state['page'] + 1:]
+        state['cursors'].append(next_cursor)
+        state['page'] += 1
+    elif state['page'] > 0:
+        state['page'] -= 1
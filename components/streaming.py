@@ -0,0 +1,25 @@
+import streamlit as st
+from typing import Any, Callable, Dict, Iterator
+
+
+def stream_prompt(stream_fn: Callable[..., Iterator[str]], fallback: str = "", **kwargs) -> str:
+    '''
+    stream_fn(**kwargs, stats=...)이 반환하는 텍스트 조각을 도착하는 대로 화면에 표시하고
+    완성된 프롬프트를 반환합니다. 실패하거나 빈 응답이면 fallback을 반환합니다.
+    '''
+    stats: Dict[str, Any] = {}
+    placeholder = st.empty()
+    text = ""
+    try:
+        for delta in stream_fn(**kwargs, stats=stats):
+            text += delta
+            placeholder.code(text, wrap_lines=True, language='txt')
+    except Exception as e:
+        print(e)
+    placeholder.empty()
+
+    if stats.get('total') is not None:
+        ttft = stats.get('ttft') or 0.0
+        source = "cache" if stats.get('cached') else "LLM"
+        st.caption(f"{source} · first token {ttft:.2f}s · total {stats['total']:.2f}s")
+    return text.strip() or fallback
@@ -4,13 +4,13 @@ from genai_kit.aws.bedrock import BedrockModel
 from genai_kit.utils.images import encode_image_base64, resize_image
 from genai_kit.aws.amazon_video import LumaDuration, LumaSize
 from services.bedrock_service import (
-    gen_english,
-    gen_mm_video_prompt,
-    gen_video,
-    get_video_job,
+    stream_english,
+    stream_mm_video_prompt,
 )
+from components.jobs import show_jobs
+from components.streaming import stream_prompt
+from services.job_queue import JobKind
 from session import SessionManager
-from constants import MediaType
 
 
 def show_video_generator(session_manager: SessionManager):
@@ -31,6 +31,8 @@ def show_video_generator(session_manager: SessionManager):
     if generate_clicked:
         generate_video(session_manager)
 
+    show_jobs(session_manager, JobKind.GEN_VIDEO)
+
 def initialize_video_session_state():
     if 'video_generation_prompt' not in st.session_state:
         st.session_state.video_generation_prompt = ""
@@ -58,7 +60,9 @@ def show_video_prompt_input_section():
         prompt_text = st.text_area("Enter your prompt:", height=150, key="video_prompt_text")
         if st.button("Generate Video Prompt", icon='📝', type="primary", use_container_width=True, key="video_gen_prompt_btn"):
             with st.spinner("Generating video prompt..."):
-                st.session_state.video_generation_prompt = gen_english(
+                st.session_state.video_generation_prompt = stream_prompt(
+                    stream_english,
+                    fallback=prompt_text,
                     request=prompt_text,
                     temperature=temperature,
                     top_p=top_p,
@@ -83,7 +87,9 @@ def show_video_prompt_input_section():
 
                     image = encode_image_base64(resized_img)
                     st.session_state.video_generation_image = image
-                st.session_state.video_generation_prompt = gen_mm_video_prompt(
+                st.session_state.video_generation_prompt = stream_prompt(
+                    stream_mm_video_prompt,
+                    fallback=multimodal_keyword_text,
                     keyword=multimodal_keyword_text,
                     image=image,
                     temperature=temperature,
@@ -120,38 +126,14 @@ def show_video_model_section():
     return st.button("Generate Videos", icon='🎥', type="primary", use_container_width=True, key="video_generate_btn")
 
 def generate_video(session_manager: SessionManager):
-    st.divider()
-    st.subheader("Generated Videos")
-    
-    with st.status("Generating videos...", expanded=True) as status:
-        try:
-            configs = st.session_state.video_generation_configs
-                        
-            invocation_arn = gen_video(
-                model_type=BedrockModel(st.session_state.video_model_type),
-                text=st.session_state.video_generation_prompt,
-                image=st.session_state.video_generation_image,
-                params=configs
-            )
-            
-            with st.spinner("Generating video..."):
-                invocation = get_video_job(invocation_arn)
-                st.json(invocation)
-                        
-                # Add to history
-                session_manager.add_to_history(
-                    media_type=MediaType.VIDEO,
-                    prompt=st.session_state.video_generation_prompt,
-                    model_type=BedrockModel(st.session_state.video_model_type),
-                    details=invocation,
-                    ref_image=st.session_state.video_generation_image,
-                )
-            
-                status.update(label="비디오 생성이 시작되었습니다. 작업은 약 5분 소요됩니다.", state="complete")
-            
-        except Exception as e:
-            status.update(label=f"Error: {str(e)}", state="error")
-            st.error(f"비디오 생성 중 오류가 발생했습니다: {str(e)}")
+    # 작업 시작 요청은 job worker가 보내고, 이후 상태는 video poller가 갱신
+    session_manager.submit_job(
+        JobKind.GEN_VIDEO,
+        model_type=BedrockModel(st.session_state.video_model_type).value,
+        prompt=st.session_state.video_generation_prompt,
+        image=st.session_state.video_generation_image,
+        configs=st.session_state.video_generation_configs,
+    )
         
 def _get_video_model_configurations(model_type: str):
     
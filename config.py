@@ -9,9 +9,22 @@ load_dotenv()
 
 class Settings(BaseModel):
     BEDROCK_REGION: str
-    DYNAMO_TABLE: str
-    S3_BUCKET: str
-    CF_DOMAIN: str
+    DYNAMO_TABLE: str = ""
+    S3_BUCKET: str = ""
+    CF_DOMAIN: str = ""
+    GENERATION_CACHE_DIR: str = ".cache/generation"
+    GENERATION_CACHE_MAX_MB: int = 512
+    PROMPT_CACHE_SIZE: int = 1024
+    PROMPT_CACHE_TTL: int = 86400
+    PROMPT_CACHE_PATH: str = ""
+    MODEL_FALLBACK_ENABLED: bool = True
+    METRICS_PORT: int = 0
+    JOB_QUEUE_PATH: str = ".cache/jobs.sqlite3"
+    JOB_WORKERS: int = 4
+    STORAGE_BACKEND: str = "aws"
+    LOCAL_STORAGE_PATH: str = ".cache/storage"
+    LOCAL_MEDIA_URL: str = ""
+    LOCAL_MEDIA_PORT: int = 8502
 
 
 def get_secrets_from_manager():
@@ -34,9 +47,22 @@ def get_settings():
         try:
             settings = Settings(
                 BEDROCK_REGION=os.getenv("BEDROCK_REGION"),
-                DYNAMO_TABLE=os.getenv("DYNAMO_TABLE"),
-                S3_BUCKET=os.getenv("S3_BUCKET"),
-                CF_DOMAIN=os.getenv("CF_DOMAIN"),
+                DYNAMO_TABLE=os.getenv("DYNAMO_TABLE", ""),
+                S3_BUCKET=os.getenv("S3_BUCKET", ""),
+                CF_DOMAIN=os.getenv("CF_DOMAIN", ""),
+                GENERATION_CACHE_DIR=os.getenv("GENERATION_CACHE_DIR", ".cache/generation"),
+                GENERATION_CACHE_MAX_MB=int(os.getenv("GENERATION_CACHE_MAX_MB", 512)),
+                PROMPT_CACHE_SIZE=int(os.getenv("PROMPT_CACHE_SIZE", 1024)),
+                PROMPT_CACHE_TTL=int(os.getenv("PROMPT_CACHE_TTL", 86400)),
+                PROMPT_CACHE_PATH=os.getenv("PROMPT_CACHE_PATH", ""),
+                MODEL_FALLBACK_ENABLED=os.getenv("MODEL_FALLBACK_ENABLED", "true").lower() == "true",
+                METRICS_PORT=int(os.getenv("METRICS_PORT", 0)),
+                JOB_QUEUE_PATH=os.getenv("JOB_QUEUE_PATH", ".cache/jobs.sqlite3"),
+                JOB_WORKERS=int(os.getenv("JOB_WORKERS", 4)),
+                STORAGE_BACKEND=os.getenv("STORAGE_BACKEND", "aws").lower(),
+                LOCAL_STORAGE_PATH=os.getenv("LOCAL_STORAGE_PATH", ".cache/storage"),
+                LOCAL_MEDIA_URL=os.getenv("LOCAL_MEDIA_URL", ""),
+                LOCAL_MEDIA_PORT=int(os.getenv("LOCAL_MEDIA_PORT", 8502)),
             )
         except Exception as e:
             return None
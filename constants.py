@@ -3,6 +3,7 @@ from enum import Enum
 VIDEO_PREFIX = "video"
 IMAGE_PREFIX = "image"
 VIDEO_OUTPUT_FILE = "output.mp4"
+MEDIA_TYPE_INDEX = "media_type-created_at-index"
 
 class MediaType(Enum):
     IMAGE = "IMAGE"
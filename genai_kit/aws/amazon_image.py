@@ -1,34 +1,37 @@
-import boto3
 import json
 import secrets
 from enum import Enum
 from typing import List, Optional
-from botocore.config import Config
+from genai_kit.aws.client import get_client
+from genai_kit.utils.image_stream import iter_response_images
 
 
 class BedrockAmazonImage():
     def __init__(self, region='us-east-1', modelId = 'amazon.titan-image-generator-v2:0'):
         self.region = region
         self.modelId = modelId
-        self.bedrock = boto3.client(
-            service_name = 'bedrock-runtime',
+        self.bedrock = get_client(
+            service_name='bedrock-runtime',
             region_name=self.region,
-            config = Config(
-                connect_timeout=300,
-                read_timeout=300,
-                retries={'max_attempts': 5}
-            ),
+            connect_timeout=300,
+            read_timeout=300,
         )
 
     def generate_image(self, body: str):
+        return list(self.iter_images(body, decode=False))
+
+    def iter_images(self, body: str, decode: bool = True):
+        '''
+        응답 body를 stream으로 읽으면서 이미지를 하나씩 반환합니다.
+        decode=True: BytesIO (PNG bytes), False: base64 str
+        '''
         response = self.bedrock.invoke_model(
             body=body,
             modelId=self.modelId,
             accept="application/json",
             contentType="application/json"
         )
-        response_body = json.loads(response.get("body").read())
-        return response_body.get("images")
+        yield from iter_response_images(response.get("body"), decode=decode)
     
 
 class TitanImageSize(Enum):
@@ -130,8 +133,11 @@ class ImageParams:
     def get_configuration(self):
         return self._config
 
-    def set_configuration(self, count: int = 1, width: int = 512, height: int = 512, cfg: float = 8.0):
-        self._config = self._default_configuration(count, width, height, cfg)
+    def set_configuration(self, count: int = 1, width: int = 512, height: int = 512, cfg: float = 8.0, seed: Optional[int] = None):
+        # seed를 지정하지 않으면 생성자에서 설정한 seed를 유지
+        if seed is None:
+            seed = self._config["imageGenerationConfig"]["seed"]
+        self._config = self._default_configuration(count, width, height, cfg, seed)
 
     def _prepare_body(self, task_type: str, params: dict) -> str:
         body = {
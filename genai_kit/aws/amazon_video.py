@@ -1,9 +1,8 @@
-import boto3
 import json
 import secrets
 from enum import Enum
 from typing import List, Optional
-from botocore.config import Config
+from genai_kit.aws.client import get_client
 from genai_kit.aws.bedrock import BedrockModel
 from genai_kit.aws.s3 import S3
 from genai_kit.utils.random import seed
@@ -38,14 +37,11 @@ class BedrockAmazonVideo():
         self.bucket_name = bucket_name
         self.region = region
         self.modelId = modelId
-        self.bedrock = boto3.client(
-            service_name = 'bedrock-runtime',
+        self.bedrock = get_client(
+            service_name='bedrock-runtime',
             region_name=self.region,
-            config = Config(
-                connect_timeout=300,
-                read_timeout=300,
-                retries={'max_attempts': 5}
-            ),
+            connect_timeout=300,
+            read_timeout=300,
         )
 
     def generate_video(
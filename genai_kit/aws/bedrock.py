@@ -1,4 +1,4 @@
-import boto3
+from genai_kit.aws.client import get_client
 from enum import Enum
 
 
@@ -31,7 +31,7 @@ class BedrockModel(str, Enum):
 class BedrockWrapper():
     def __init__(self, region='us-west-2'):
         self.region = region
-        self.client = boto3.client(
+        self.client = get_client(
             service_name="bedrock",
             region_name=self.region,
         )
@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, Deque, Dict
+from botocore.exceptions import BotoCoreError, ClientError
+from genai_kit.aws.rate_limiter import is_throttling_error
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, model_id: str, retry_after: float):
+        super().__init__(f"Circuit open for {model_id}, retry after {retry_after:.1f}s")
+        self.model_id = model_id
+        self.retry_after = retry_after
+
+
+# 재시도로 회복되지 않는 quota 오류: rate limiter는 재시도하지 않지만 breaker는 실패로 세어 fallback 모델로 전환
+QUOTA_ERROR_CODES = {'ServiceQuotaExceededException'}
+# 모델을 아직 사용할 수 없는 상태 (HTTP 429): 요청 오류가 아니라 모델 가용성 문제
+UNAVAILABLE_ERROR_CODES = {'ModelNotReadyException'}
+
+_breakers: Dict[str, "CircuitBreaker"] = {}
+_lock = threading.Lock()
+
+
+def is_model_failure(e: Exception) -> bool:
+    '''
+    모델 상태와 관련된 오류만 breaker 실패로 셉니다 (throttling, quota 초과, 모델 준비 중, 5xx, timeout / 연결 오류).
+    ValidationException 같은 요청 오류는 제외합니다.
+    '''
+    if is_throttling_error(e):
+        return True
+    if isinstance(e, ClientError):
+        if e.response.get('Error', {}).get('Code') in QUOTA_ERROR_CODES | UNAVAILABLE_ERROR_CODES:
+            return True
+        return e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500
+    return isinstance(e, BotoCoreError)
+
+
+class CircuitBreaker:
+    '''
+    연속 failure_threshold번 실패하면 OPEN이 되어 recovery_timeout 동안 호출을 바로 거절하고,
+    이후 HALF_OPEN에서 한 번의 시험 호출 결과로 CLOSED / OPEN을 결정합니다.
+    상태 전환은 metric 로그로 남기고 최근 전환 이력을 transitions에 보관합니다.
+    '''
+
+    def __init__(self, model_id: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.model_id = model_id
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.state = CircuitState.CLOSED
+        self.transitions: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self._transition_count = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self._transition(CircuitState.HALF_OPEN)
+            if self.state == CircuitState.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self.state != CircuitState.CLOSED:
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self.state == CircuitState.HALF_OPEN or \
+                    (self.state == CircuitState.CLOSED and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._transition(CircuitState.OPEN)
+
+    def release(self):
+        # 성공/실패를 판단할 수 없는 오류 (요청 오류 등): HALF_OPEN 시험 호출만 반납
+        with self._lock:
+            self._probing = False
+
+    @contextmanager
+    def guard(self):
+        if not self.allow():
+            with self._lock:
+                self._rejected += 1
+                retry_after = max(self.recovery_timeout - (time.monotonic() - self._opened_at), 0)
+            raise CircuitOpenError(self.model_id, retry_after)
+        try:
+            yield
+        except GeneratorExit:
+            self.record_success()
+            raise
+        except Exception as e:
+            if is_model_failure(e):
+                self.record_failure()
+            else:
+                self.release()
+            raise
+        else:
+            self.record_success()
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        with self.guard():
+            return fn(*args, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'state': self.state.value,
+                'failures': self._failures,
+                'rejected': self._rejected,
+                'transitions': self._transition_count,
+            }
+
+    def _transition(self, state: CircuitState):
+        event = {
+            'metric': 'circuit_breaker.transition',
+            'model_id': self.model_id,
+            'from': self.state.value,
+            'to': state.value,
+            'failures': self._failures,
+            'timestamp': time.time(),
+        }
+        self.state = state
+        self.transitions.append(event)
+        self._transition_count += 1
+        print(json.dumps(event))
+
+
+def get_circuit_breaker(model_id: str, **kwargs) -> CircuitBreaker:
+    '''
+    model 단위로 프로세스 전체에서 공유하는 breaker를 반환합니다.
+    kwargs는 처음 생성될 때만 적용됩니다.
+    '''
+    model_id = getattr(model_id, 'value', model_id)
+    with _lock:
+        breaker = _breakers.get(model_id)
+        if breaker is None:
+            breaker = CircuitBreaker(model_id, **kwargs)
+            _breakers[model_id] = breaker
+    return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        breakers = dict(_breakers)
+    return {model_id: breaker.stats() for model_id, breaker in breakers.items()}
@@ -1,24 +1,32 @@
-import boto3
+import hashlib
 import json
-from botocore.config import Config
+from genai_kit.aws.client import BEDROCK_MAX_ATTEMPTS, get_client
+from genai_kit.aws.rate_limiter import get_rate_limiter
+from genai_kit.aws.circuit_breaker import get_circuit_breaker
+from genai_kit.aws.metrics import record_tokens
+from genai_kit.utils.singleflight import SingleFlight
 
 from langchain_aws.chat_models import ChatBedrock
 from langchain.callbacks import StdOutCallbackHandler
 
 
+# 프로세스 전체에서 동일한 invoke_llm 요청을 합침
+_inflight = SingleFlight()
+
+
 class BedrockClaude():
     def __init__(self, region='us-west-2', modelId = 'anthropic.claude-3-5-sonnet-20240620-v1:0', **model_kwargs):
         self.region = region
         self.modelId = modelId
-        self.bedrock = boto3.client(
-            service_name = 'bedrock-runtime',
-            region_name = self.region,
-            config = Config(
-                connect_timeout=120,
-                read_timeout=120,
-                retries={'max_attempts': 5}
-            ),
+        self.bedrock = get_client(
+            service_name='bedrock-runtime',
+            region_name=self.region,
+            connect_timeout=120,
+            read_timeout=120,
+            max_attempts=BEDROCK_MAX_ATTEMPTS,
         )
+        self.limiter = get_rate_limiter(self.modelId, self.region)
+        self.breaker = get_circuit_breaker(self.modelId)
 
         self.model_kwargs = {
             'anthropic_version': 'bedrock-2023-05-31',
@@ -92,17 +100,26 @@ class BedrockClaude():
             }]
         })
 
+        body = json.dumps(parameter, sort_keys=True)
+        key = hashlib.sha256(f"{self.region}\n{self.modelId}\n{body}".encode('utf-8')).hexdigest()
         try:
-            response = self.bedrock.invoke_model(
-                body=json.dumps(parameter),
-                modelId=self.modelId,
-                accept='application/json',
-                contentType='application/json'
-            )
-            return json.loads(response.get('body').read())
+            return _inflight.do(key, self._invoke_model, body)
         except Exception as e:
             print(e)
             return None
+
+    def _invoke_model(self, body: str):
+        response = self.breaker.call(
+            self.limiter.call,
+            self.bedrock.invoke_model,
+            body=body,
+            modelId=self.modelId,
+            accept='application/json',
+            contentType='application/json'
+        )
+        result = json.loads(response.get('body').read())
+        record_tokens(self.modelId, 'InvokeModel', result.get('usage'))
+        return result
         
     def invoke_llm_response(self, text: str, image: str = None, system: str = None):
         return self.invoke_llm(
@@ -144,13 +161,16 @@ class BedrockClaude():
             system_prompts.append({'text': system})
 
         try:
-            response = self.bedrock.converse(
+            response = self.breaker.call(
+                self.limiter.call,
+                self.bedrock.converse,
                 modelId=self.modelId,
                 messages=messages,
                 system=system_prompts,
                 inferenceConfig=self.inference_config,
-                # additionalModelRequestFields=self.additional_model_fields,
+                additionalModelRequestFields=self.additional_model_fields,
             )
+            record_tokens(self.modelId, 'Converse', response.get('usage'))
             return response
         except Exception as e:
             print(e)
@@ -159,9 +179,16 @@ class BedrockClaude():
     '''
     Bedrock Converse Stream
     '''
-    def converse_stream(self, text: str, image: bytes = None, system: str = None):
+    def converse_stream(self,
+                        text: str,
+                        image: bytes = None,
+                        system: str = None,
+                        image_format: str = 'png',
+                        raise_errors: bool = False):
         '''
         Generator that yields assistant's response chunks
+        (generator를 close하면 응답 stream도 바로 닫힙니다)
+        raise_errors가 False이면 오류를 출력하고 stream을 끝내며, True이면 호출자에게 그대로 전달합니다.
         '''
         # 메시지 내용 구성
         content = []
@@ -171,7 +198,7 @@ class BedrockClaude():
         if image:
             content.append({
                 'image': {
-                    'format': 'png', # png, jpeg, gif, webp
+                    'format': image_format, # png, jpeg, gif, webp
                     'source': {
                         'bytes': image,
                     }
@@ -191,21 +218,31 @@ class BedrockClaude():
             system_prompts.append({'text': system})
 
         try:
-            response = self.bedrock.converse_stream(
-                modelId=self.modelId,
-                messages=messages,
-                system=system_prompts,
-                inferenceConfig=self.inference_config,
-                # additionalModelRequestFields=self.additional_model_fields,
-            )
-
-            stream = response.get('stream')
-            if stream:
-                for event in stream:
-                    if 'contentBlockDelta' in event:
-                        delta = event['contentBlockDelta']['delta']
-                        if 'text' in delta:
-                            yield delta['text']
+            # stream을 읽는 동안 동시성 slot을 유지
+            with self.breaker.guard(), self.limiter.acquire():
+                response = self.bedrock.converse_stream(
+                    modelId=self.modelId,
+                    messages=messages,
+                    system=system_prompts,
+                    inferenceConfig=self.inference_config,
+                    # top_k는 inferenceConfig에 없으므로 모델별 추가 필드로 전달
+                    additionalModelRequestFields=self.additional_model_fields,
+                )
+
+                stream = response.get('stream')
+                if stream:
+                    try:
+                        for event in stream:
+                            if 'contentBlockDelta' in event:
+                                delta = event['contentBlockDelta']['delta']
+                                if 'text' in delta:
+                                    yield delta['text']
+                            elif 'metadata' in event:
+                                record_tokens(self.modelId, 'ConverseStream', event['metadata'].get('usage'))
+                    finally:
+                        stream.close()
         except Exception as e:
+            if raise_errors:
+                raise
             print(e)
             return
\ No newline at end of file
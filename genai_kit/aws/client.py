@@ -0,0 +1,104 @@
+import threading
+import boto3
+from botocore.config import Config
+from genai_kit.aws.metrics import instrument_client
+
+
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+# rate limiter를 거치는 bedrock-runtime 호출: throttling은 limiter가 재시도
+BEDROCK_MAX_ATTEMPTS = 2
+
+_clients = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_client(service_name: str,
+               region_name: str = None,
+               connect_timeout: int = 60,
+               read_timeout: int = 60,
+               max_attempts: int = 5,
+               max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+               endpoint_url: str = None):
+    '''
+    (service, region, config) 단위로 캐시된 boto3 client를 반환합니다.
+
+    boto3 client는 thread-safe하므로 프로세스 전체에서 공유하며,
+    credential 조회 / endpoint 구성 / TLS 연결을 호출마다 반복하지 않도록
+    keep-alive가 켜진 connection pool을 재사용합니다.
+    모든 호출의 latency / bytes / retry는 genai_kit.aws.metrics에 기록됩니다.
+    '''
+    key = (service_name, region_name, connect_timeout, read_timeout,
+           max_attempts, max_pool_connections, endpoint_url)
+
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = boto3.client(
+                service_name=service_name,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=get_config(
+                    connect_timeout=connect_timeout,
+                    read_timeout=read_timeout,
+                    max_attempts=max_attempts,
+                    max_pool_connections=max_pool_connections,
+                ),
+            )
+            instrument_client(client)
+            _clients[key] = client
+    return client
+
+
+def get_resource(service_name: str,
+                 region_name: str = None,
+                 endpoint_url: str = None,
+                 max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS):
+    '''
+    현재 thread 전용 boto3 resource를 반환합니다.
+
+    resource는 thread-safe하지 않으므로 thread마다 만들되, boto3 default session을 여러 thread에서
+    동시에 쓰지 않도록 thread별 Session에서 생성합니다. Config (connection pool / keep-alive / retry)와
+    metrics 계측은 get_client()와 같습니다.
+    '''
+    key = (service_name, region_name, endpoint_url, max_pool_connections)
+    resources = getattr(_local, 'resources', None)
+    if resources is None:
+        resources = _local.resources = {}
+
+    resource = resources.get(key)
+    if resource is None:
+        session = getattr(_local, 'session', None)
+        if session is None:
+            session = _local.session = boto3.session.Session()
+        resource = session.resource(
+            service_name,
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            config=get_config(max_pool_connections=max_pool_connections),
+        )
+        instrument_client(resource.meta.client)
+        resources[key] = resource
+    return resource
+
+
+def get_config(connect_timeout: int = 60,
+               read_timeout: int = 60,
+               max_attempts: int = 5,
+               max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS) -> Config:
+    return Config(
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        retries={'max_attempts': max_attempts, 'mode': 'standard'},
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+    )
+
+
+def clear_clients():
+    with _lock:
+        _clients.clear()
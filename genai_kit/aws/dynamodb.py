@@ -1,33 +1,44 @@
-import boto3
-import json
-from decimal import Decimal
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from genai_kit.aws.client import get_resource
+from genai_kit.utils.converter import from_dynamodb, from_dynamodb_items, to_dynamodb
 
 
 class DynamoDB:
-    def __init__(self, table_name):
-        self.db = boto3.resource('dynamodb')
+    def __init__(self, table_name, endpoint_url=None):
         self.name = table_name
-        self.table = self.db.Table(table_name)
+        self.endpoint_url = endpoint_url
+        self._local = threading.local()
+
+    @property
+    def db(self):
+        # boto3 resource는 thread-safe하지 않으므로 thread마다 생성 (get_resource가 thread별로 캐시)
+        return get_resource('dynamodb', endpoint_url=self.endpoint_url)
+
+    @property
+    def table(self):
+        table = getattr(self._local, 'table', None)
+        if table is None:
+            table = self.db.Table(self.name)
+            self._local.table = table
+        return table
         
     def get_item(self, key):
         response = self.table.get_item(Key={
             'id': key
         })
-        return json.loads(json.dumps(response.get('Item'), default=_default_serializer))
+        return from_dynamodb(response.get('Item'))
     
     def put_item(self, item: dict):
         self.table.put_item(
-            Item=json.loads(json.dumps(item, default=_default_serializer), parse_float=Decimal)
+            Item=to_dynamodb(item)
         )
 
     def update_item(self, id: str, updates: dict):
         update_expression = "SET " + ", ".join([f"#{k} = :{k}" for k in updates.keys()])
         expression_attribute_names = {f"#{k}": k for k in updates.keys()}
-        expression_attribute_values = {f":{k}": json.loads(
-            json.dumps(v, default=_default_serializer), 
-            parse_float=Decimal
-        ) for k, v in updates.items()}
+        expression_attribute_values = {f":{k}": to_dynamodb(v) for k, v in updates.items()}
         
         self.table.update_item(
             Key={"id": id},
@@ -36,32 +47,115 @@ class DynamoDB:
             ExpressionAttributeValues=expression_attribute_values
         )
 
+    def upsert_item(self, id: str, updates: dict, defaults: dict = None):
+        '''
+        UpdateItem 한 번으로 항목을 생성하거나 갱신하고, 갱신된 전체 항목을 반환합니다.
+        defaults의 값은 해당 속성이 없을 때만 기록됩니다 (if_not_exists).
+        '''
+        defaults = {k: v for k, v in (defaults or {}).items() if k not in updates}
+        assignments = [f"#{k} = :{k}" for k in updates.keys()]
+        assignments += [f"#{k} = if_not_exists(#{k}, :{k})" for k in defaults.keys()]
+
+        values = {**updates, **defaults}
+        expression_attribute_names = {f"#{k}": k for k in values.keys()}
+        expression_attribute_values = {f":{k}": to_dynamodb(v) for k, v in values.items()}
+
+        response = self.table.update_item(
+            Key={"id": id},
+            UpdateExpression="SET " + ", ".join(assignments),
+            ExpressionAttributeNames=expression_attribute_names,
+            ExpressionAttributeValues=expression_attribute_values,
+            ReturnValues="ALL_NEW"
+        )
+        return from_dynamodb(response.get('Attributes'))
+
+    def batch_get_items(self, ids: list, projection: str = None, expression_attribute_names: dict = None):
+        '''
+        BatchGetItem으로 여러 항목을 조회합니다 (요청당 최대 100개, UnprocessedKeys 재시도).
+        '''
+        items = []
+        unique_ids = list(dict.fromkeys(ids))
+        for i in range(0, len(unique_ids), 100):
+            request = {'Keys': [{'id': id} for id in unique_ids[i:i + 100]]}
+            if projection:
+                request['ProjectionExpression'] = projection
+            if expression_attribute_names:
+                request['ExpressionAttributeNames'] = expression_attribute_names
+
+            request_items = {self.name: request}
+            while request_items:
+                response = self.db.batch_get_item(RequestItems=request_items)
+                items.extend(response.get('Responses', {}).get(self.name, []))
+                request_items = response.get('UnprocessedKeys') or None
+
+        return from_dynamodb_items(items)
+
     def delete_item(self, id):
         self.table.delete_item(Key={"id": id})
         
     def scan_items(self, query):
-        return self.table.scan(**query)
+        response = self.table.scan(**query)
+        items = response.get('Items', [])
+
+        while 'LastEvaluatedKey' in response:
+            response = self.table.scan(**query, ExclusiveStartKey=response['LastEvaluatedKey'])
+            items.extend(response.get('Items', []))
+
+        response['Items'] = from_dynamodb_items(items)
+        response['Count'] = len(items)
+        return response
+
+    def query_items(self, query, limit: int = None, start_key: dict = None):
+        if limit:
+            query = {**query, 'Limit': limit}
+        if start_key:
+            query = {**query, 'ExclusiveStartKey': start_key}
+        response = self.table.query(**query)
+        response['Items'] = from_dynamodb_items(response.get('Items', []))
+        return response
+
+    def query_all_items(self, query):
+        response = self.table.query(**query)
+        items = response.get('Items', [])
+
+        while 'LastEvaluatedKey' in response:
+            response = self.table.query(**query, ExclusiveStartKey=response['LastEvaluatedKey'])
+            items.extend(response.get('Items', []))
+        return from_dynamodb_items(items)
     
-    def delete_all_items(self):
-        scan = self.table.scan()
+    def delete_all_items(self, segments: int = 8, on_deleted: Optional[Callable[[int], None]] = None) -> int:
+        '''
+        병렬 segmented scan (Segment / TotalSegments)으로 모든 항목을 삭제합니다.
+        segment마다 별도 thread와 batch_writer를 사용하며, on_deleted(count)로 진행 상황을 알립니다.
+        '''
+        with ThreadPoolExecutor(max_workers=segments, thread_name_prefix="dynamodb-purge") as executor:
+            return sum(executor.map(
+                lambda segment: self._delete_segment(segment, segments, on_deleted),
+                range(segments),
+            ))
+
+    def _delete_segment(self, segment: int, total_segments: int, on_deleted=None) -> int:
+        query = {
+            'Segment': segment,
+            'TotalSegments': total_segments,
+            'ProjectionExpression': '#id',
+            'ExpressionAttributeNames': {'#id': 'id'},
+        }
+        deleted = 0
         with self.table.batch_writer() as batch:
-            for item in scan['Items']:
-                batch.delete_item(Key={
-                    'id': item['id']
-                })
-        
-        while 'LastEvaluatedKey' in scan:
-            scan = self.table.scan(ExclusiveStartKey=scan['LastEvaluatedKey'])
-            with self.table.batch_writer() as batch:
-                for item in scan['Items']:
+            while True:
+                response = self.table.scan(**query)
+                items = response.get('Items', [])
+                for item in items:
                     batch.delete_item(Key={
                         'id': item['id']
                     })
+                deleted += len(items)
+                if on_deleted and items:
+                    on_deleted(len(items))
 
+                if 'LastEvaluatedKey' not in response:
+                    break
+                query['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        return deleted
 
-def _default_serializer(obj):
-    if isinstance(obj, Decimal):
-        return float(obj)
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
@@ -1,20 +1,16 @@
-import boto3
 import json
-from botocore.config import Config
+from genai_kit.aws.client import get_client
 from langchain_community.embeddings import BedrockEmbeddings
 
 
 class BedrockEmbedding():
     def __init__(self, region='us-west-2'):
         self.region = region
-        self.bedrock = boto3.client(
-            service_name = 'bedrock-runtime',
-            region_name = self.region,
-            config = Config(
-                connect_timeout=120,
-                read_timeout=120,
-                retries={'max_attempts': 5}
-            ),
+        self.bedrock = get_client(
+            service_name='bedrock-runtime',
+            region_name=self.region,
+            connect_timeout=120,
+            read_timeout=120,
         )
 
         self.multimodalId = 'amazon.titan-embed-image-v1'
@@ -1,7 +1,6 @@
-import boto3
 import json
 from enum import Enum
-from botocore.config import Config
+from genai_kit.aws.client import get_client
 from genai_kit.utils.random import seed
 from genai_kit.aws.bedrock import BedrockModel
 
@@ -29,14 +28,11 @@ class BedrockLumaVideo():
         self.bucket_name = bucket_name
         self.region = region
         self.modelId = modelId
-        self.bedrock = boto3.client(
-            service_name = 'bedrock-runtime',
-            region_name = self.region,
-            config = Config(
-                connect_timeout=120,
-                read_timeout=120,
-                retries={'max_attempts': 5}
-            ),
+        self.bedrock = get_client(
+            service_name='bedrock-runtime',
+            region_name=self.region,
+            connect_timeout=120,
+            read_timeout=120,
         )
         
     def generate_video(self, body: dict):
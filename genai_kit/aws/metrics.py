@@ -0,0 +1,295 @@
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from genai_kit.utils.http_server import BackgroundServer
+
+
+# aws_call_duration_seconds histogram 경계 (Bedrock 이미지/비디오 호출까지 포함)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+# context에 저장하는 key (botocore request_context는 호출마다 새로 만들어짐)
+_START = '_metrics_start'
+_MODEL = '_metrics_model'
+_OPERATION = '_metrics_operation'
+_REQUEST_BYTES = '_metrics_request_bytes'
+
+# series 값 index
+_COUNT, _ERRORS, _RETRIES, _SECONDS, _REQUEST, _RESPONSE, _BUCKETS = range(7)
+
+
+class MetricsRegistry:
+    '''
+    AWS 호출별 지표를 (service, operation, model) label로 모으는 thread-safe registry.
+
+    호출 1회당 dict 조회와 정수 덧셈만 하므로 hot path 부담은 수 µs 이내이며,
+    Prometheus text / OpenMetrics 형식으로 내보낼 수 있습니다.
+    '''
+
+    def __init__(self, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str], list] = {}
+        self._tokens: Dict[Tuple[str, str, str], int] = {}  # (model, operation, direction)
+
+    def observe(self,
+                service: str,
+                operation: str,
+                model: str,
+                seconds: float,
+                request_bytes: int = 0,
+                response_bytes: int = 0,
+                retries: int = 0,
+                error: bool = False):
+        key = (service, operation, model)
+        bucket = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [0, 0, 0, 0.0, 0, 0, [0] * (len(self.buckets) + 1)]
+                self._series[key] = series
+            series[_COUNT] += 1
+            series[_ERRORS] += error
+            series[_RETRIES] += retries
+            series[_SECONDS] += seconds
+            series[_REQUEST] += request_bytes
+            series[_RESPONSE] += response_bytes
+            series[_BUCKETS][bucket] += 1
+
+    def record_tokens(self, model: str, operation: str, input_tokens: int = 0, output_tokens: int = 0):
+        with self._lock:
+            for direction, count in (('input', input_tokens), ('output', output_tokens)):
+                if count:
+                    key = (model, operation, direction)
+                    self._tokens[key] = self._tokens.get(key, 0) + count
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+            tokens = dict(self._tokens)
+
+        rows = []
+        for (service, operation, model), values in sorted(series.items()):
+            count = values[_COUNT]
+            rows.append({
+                'service': service,
+                'operation': operation,
+                'model': model,
+                'calls': count,
+                'errors': values[_ERRORS],
+                'retries': values[_RETRIES],
+                'avg_ms': round(values[_SECONDS] / count * 1000, 1) if count else 0.0,
+                'p95_ms': _quantile_ms(self.buckets, values[_BUCKETS], count, 0.95),
+                'request_bytes': values[_REQUEST],
+                'response_bytes': values[_RESPONSE],
+                'input_tokens': tokens.get((model, operation, 'input'), 0),
+                'output_tokens': tokens.get((model, operation, 'output'), 0),
+            })
+        return rows
+
+    def render(self, openmetrics: bool = False) -> str:
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+            tokens = dict(self._tokens)
+
+        lines = []
+        counters = (
+            ('aws_calls', 'AWS API calls', _COUNT),
+            ('aws_call_errors', 'AWS API calls that raised an error', _ERRORS),
+            ('aws_call_retries', 'botocore retry attempts', _RETRIES),
+            ('aws_request_bytes', 'Request body bytes sent', _REQUEST),
+            ('aws_response_bytes', 'Response body bytes received (Content-Length)', _RESPONSE),
+        )
+        for name, help_text, index in counters:
+            _family(lines, name, 'counter', help_text, openmetrics)
+            for key, values in sorted(series.items()):
+                lines.append(f"{name}_total{_labels(key)} {values[index]}")
+
+        name = 'aws_call_duration_seconds'
+        _family(lines, name, 'histogram', 'AWS API call latency including retries', openmetrics)
+        for key, values in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, values[_BUCKETS]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(key, le=repr(bound))} {cumulative}")
+            lines.append(f"{name}_bucket{_labels(key, le='+Inf')} {values[_COUNT]}")
+            lines.append(f"{name}_sum{_labels(key)} {values[_SECONDS]}")
+            lines.append(f"{name}_count{_labels(key)} {values[_COUNT]}")
+
+        _family(lines, 'bedrock_tokens', 'counter', 'Bedrock model tokens reported in usage', openmetrics)
+        for (model, operation, direction), count in sorted(tokens.items()):
+            lines.append(
+                f'bedrock_tokens_total{{operation="{operation}",model="{_escape(model)}",direction="{direction}"}} {count}'
+            )
+
+        if openmetrics:
+            lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+            self._tokens.clear()
+
+
+registry = MetricsRegistry()
+
+_instrumented_lock = threading.Lock()
+_server = BackgroundServer('metrics-server')
+
+
+def instrument_client(client, metrics: MetricsRegistry = None):
+    '''
+    boto3 client의 event hook으로 모든 API 호출의 latency / bytes / retry를 기록합니다.
+    같은 client에는 한 번만 등록합니다.
+    '''
+    metrics = metrics or registry
+    with _instrumented_lock:
+        if getattr(client, '_metrics_instrumented', False):
+            return client
+        client._metrics_instrumented = True
+
+    service = client.meta.service_model.service_name
+    events = client.meta.events
+
+    def start(params, model, context, **kwargs):
+        context[_START] = time.perf_counter()
+        context[_OPERATION] = model.name
+        context[_MODEL] = params.get('modelId', '') if isinstance(params, dict) else ''
+
+    def sent(params, context, **kwargs):
+        context[_REQUEST_BYTES] = _body_size(params.get('body'))
+
+    def finished(http_response, parsed, model, context, **kwargs):
+        started = context.get(_START)
+        if started is None:
+            return
+        metadata = parsed.get('ResponseMetadata', {}) if isinstance(parsed, dict) else {}
+        headers = getattr(http_response, 'headers', None) or {}
+        metrics.observe(
+            service,
+            model.name,
+            context.get(_MODEL, ''),
+            time.perf_counter() - started,
+            request_bytes=context.get(_REQUEST_BYTES, 0),
+            response_bytes=int(headers.get('content-length') or 0),
+            retries=metadata.get('RetryAttempts', 0),
+            error='Error' in parsed if isinstance(parsed, dict) else False,
+        )
+
+    def failed(context, **kwargs):
+        # 연결 오류 등 응답을 받지 못한 호출
+        started = context.get(_START)
+        if started is None:
+            return
+        metrics.observe(
+            service,
+            context.get(_OPERATION, ''),
+            context.get(_MODEL, ''),
+            time.perf_counter() - started,
+            request_bytes=context.get(_REQUEST_BYTES, 0),
+            error=True,
+        )
+
+    events.register('before-parameter-build', start)
+    events.register('before-call', sent)
+    events.register('after-call', finished)
+    events.register('after-call-error', failed)
+    return client
+
+
+def record_tokens(model: str, operation: str, usage: Optional[Dict[str, Any]]):
+    '''
+    invoke_model (`input_tokens`/`output_tokens`) 와 converse (`inputTokens`/`outputTokens`) usage를 모두 받습니다.
+    '''
+    if not usage:
+        return
+    registry.record_tokens(
+        model,
+        operation,
+        input_tokens=usage.get('input_tokens', usage.get('inputTokens', 0)) or 0,
+        output_tokens=usage.get('output_tokens', usage.get('outputTokens', 0)) or 0,
+    )
+
+
+def get_metrics_snapshot() -> List[Dict[str, Any]]:
+    return registry.snapshot()
+
+
+def render_metrics(openmetrics: bool = False) -> str:
+    return registry.render(openmetrics=openmetrics)
+
+
+def start_metrics_server(port: int, addr: str = '0.0.0.0') -> Optional[ThreadingHTTPServer]:
+    '''
+    /metrics를 제공하는 HTTP server를 daemon thread로 띄웁니다 (프로세스당 1개).
+    Accept header에 application/openmetrics-text가 있으면 OpenMetrics 형식으로 응답합니다.
+    port를 열 수 없으면 (예: 다른 프로세스가 사용 중) 한 번만 출력하고 None을 반환합니다.
+    '''
+    return _server.start(addr, port, _MetricsHandler)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+
+        openmetrics = 'application/openmetrics-text' in self.headers.get('Accept', '')
+        body = render_metrics(openmetrics=openmetrics).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _body_size(body) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    try:
+        # bytes / bytearray / s3transfer ReadFileChunk
+        return len(body)
+    except TypeError:
+        return 0
+
+
+def _family(lines: List[str], name: str, type: str, help_text: str, openmetrics: bool):
+    # OpenMetrics는 counter family 이름에서 _total을 뺌
+    family = name if openmetrics or type != 'counter' else f"{name}_total"
+    lines.append(f"# HELP {family} {help_text}")
+    lines.append(f"# TYPE {family} {type}")
+
+
+def _labels(key: Tuple[str, str, str], le: str = None) -> str:
+    service, operation, model = key
+    labels = f'service="{service}",operation="{operation}",model="{_escape(model)}"'
+    if le is not None:
+        labels += f',le="{le}"'
+    return '{' + labels + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _quantile_ms(buckets: Tuple[float, ...], counts: List[int], total: int, q: float) -> float:
+    # histogram bucket 상한으로 근사
+    if not total:
+        return 0.0
+    target = total * q
+    cumulative = 0
+    for bound, count in zip(buckets, counts):
+        cumulative += count
+        if cumulative >= target:
+            return bound * 1000
+    return float('inf')
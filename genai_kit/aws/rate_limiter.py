@@ -0,0 +1,169 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Tuple
+from botocore.exceptions import ClientError
+
+
+# 일시적인 throttling만 AIMD 감소 / 재시도 대상
+# (ServiceQuotaExceededException은 기다려도 풀리지 않는 quota 오류이므로 제외)
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException',
+    'TooManyRequestsException',
+}
+
+_limiters: Dict[Tuple[str, str], "AdaptiveRateLimiter"] = {}
+_lock = threading.Lock()
+
+
+def is_throttling_error(e: Exception) -> bool:
+    return isinstance(e, ClientError) and \
+        e.response.get('Error', {}).get('Code') in THROTTLING_ERROR_CODES
+
+
+class AdaptiveRateLimiter:
+    '''
+    token bucket(초당 요청 수)과 AIMD 동시성 제한을 함께 사용하는 client-side limiter.
+
+    - 성공: rate는 rate_increase만큼, 동시성은 창(window)당 1씩 증가 (additive increase)
+    - throttling: rate와 동시성을 decrease 비율로 줄임 (multiplicative decrease)
+      동시에 실패한 요청들이 여러 번 줄이지 않도록 cooldown 동안은 한 번만 적용합니다.
+    throttling된 요청은 줄어든 rate로 다시 대기열에 들어가 max_attempts까지 재시도합니다.
+    '''
+
+    def __init__(self,
+                 rate: float = 2.0,
+                 burst: float = 4.0,
+                 concurrency: int = 4,
+                 min_rate: float = 0.05,
+                 max_rate: float = 50.0,
+                 max_concurrency: int = 32,
+                 rate_increase: float = 0.05,
+                 decrease: float = 0.5,
+                 cooldown: float = 1.0,
+                 max_attempts: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_concurrency = max_concurrency
+        self.rate_increase = rate_increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.max_attempts = max_attempts
+
+        self._window = float(concurrency)
+        self._tokens = burst
+        self._refilled_at = time.monotonic()
+        self._decreased_at = 0.0
+        self._in_flight = 0
+        self._waiting = 0
+        self._successes = 0
+        self._throttles = 0
+        self._cond = threading.Condition()
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(1, int(self._window))
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with self.acquire():
+                    return fn(*args, **kwargs)
+            except ClientError as e:
+                if not is_throttling_error(e) or attempt == self.max_attempts:
+                    raise
+
+    @contextmanager
+    def acquire(self):
+        self._wait_for_slot()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        except GeneratorExit:
+            # stream을 끝까지 읽지 않고 닫은 경우
+            succeeded = True
+            raise
+        except Exception as e:
+            if is_throttling_error(e):
+                self.on_throttle()
+            raise
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                if succeeded:
+                    self._on_success()
+                self._cond.notify_all()
+
+    def on_throttle(self):
+        with self._cond:
+            self._throttles += 1
+            now = time.monotonic()
+            if now - self._decreased_at < self.cooldown:
+                return
+            self._decreased_at = now
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._window = max(1.0, self._window * self.decrease)
+            self._tokens = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'rate': round(self.rate, 3),
+                'concurrency_limit': self.concurrency_limit,
+                'in_flight': self._in_flight,
+                'queue_depth': self._waiting,
+                'successes': self._successes,
+                'throttles': self._throttles,
+            }
+
+    def _on_success(self):
+        self._successes += 1
+        self.rate = min(self.max_rate, self.rate + self.rate_increase)
+        self._window = min(float(self.max_concurrency), self._window + 1.0 / self._window)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _wait_for_slot(self):
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    self._refill()
+                    if self._in_flight < self.concurrency_limit and self._tokens >= 1:
+                        self._tokens -= 1
+                        self._in_flight += 1
+                        return
+                    if self._in_flight >= self.concurrency_limit:
+                        # release / throttle 시 notify
+                        self._cond.wait()
+                    else:
+                        self._cond.wait((1 - self._tokens) / self.rate)
+            finally:
+                self._waiting -= 1
+
+
+def get_rate_limiter(model_id: str, region: str, **kwargs) -> AdaptiveRateLimiter:
+    '''
+    (model, region) 단위로 프로세스 전체에서 공유하는 limiter를 반환합니다.
+    kwargs는 처음 생성될 때만 적용됩니다.
+    '''
+    key = (getattr(model_id, 'value', model_id), region)
+    with _lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(**kwargs)
+            _limiters[key] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        limiters = dict(_limiters)
+    return {f"{model_id} ({region})": limiter.stats()
+            for (model_id, region), limiter in limiters.items()}
@@ -1,13 +1,12 @@
 import os
-import boto3
 import datetime
 from urllib.parse import urlparse, quote, unquote
+from genai_kit.aws.client import get_client
 
 
 class S3:
     def __init__(self, bucket_name, region='us-west-2'):
-        self.storage = boto3.client('s3',                            
-                                    region_name = region)
+        self.storage = get_client('s3', region_name=region)
         self.bucket_name = bucket_name
 
     def upload_object(self, bytes, key, metadata=None, extra_args=None):
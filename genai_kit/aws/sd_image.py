@@ -1,7 +1,9 @@
-import boto3
 import json
 from enum import Enum
-from botocore.config import Config
+from genai_kit.aws.client import BEDROCK_MAX_ATTEMPTS, get_client
+from genai_kit.utils.image_stream import iter_response_images
+from genai_kit.aws.rate_limiter import get_rate_limiter
+from genai_kit.aws.circuit_breaker import get_circuit_breaker
 from genai_kit.utils.random import seed
 
 
@@ -9,23 +11,24 @@ class BedrockStableDiffusion():
     def __init__(self, modelId: str, region='us-west-2'):
         self.region = region
         self.modelId = modelId
-        self.bedrock = boto3.client(
-            service_name = 'bedrock-runtime',
-            region_name = self.region,
-            config = Config(
-                connect_timeout=120,
-                read_timeout=120,
-                retries={'max_attempts': 5}
-            ),
+        self.bedrock = get_client(
+            service_name='bedrock-runtime',
+            region_name=self.region,
+            connect_timeout=120,
+            read_timeout=120,
+            max_attempts=BEDROCK_MAX_ATTEMPTS,
         )
+        self.limiter = get_rate_limiter(self.modelId, self.region)
+        self.breaker = get_circuit_breaker(self.modelId)
 
     def invoke_model(self, body: dict):
-        response = self.bedrock.invoke_model(
+        response = self.breaker.call(
+            self.limiter.call,
+            self.bedrock.invoke_model,
             body=json.dumps(body),
             modelId=self.modelId
         )
-        response_body = json.loads(response.get("body").read())
-        return response_body["images"][0]
+        return next(iter_response_images(response.get("body"), decode=False))
 
     def text_to_image(self,
                       prompt: str,
@@ -0,0 +1,110 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class TTLCache:
+    '''
+    항목 수 제한(LRU)과 TTL 만료를 가진 thread-safe memo cache.
+    persist_path를 지정하면 JSON 파일로 저장하여 프로세스 재시작 후에도 재사용합니다.
+    파일은 set()마다 쓰지 않고 마지막 변경 후 save_delay초 뒤 (그리고 종료 시) lock 밖에서 한 번에 씁니다.
+    값은 JSON 직렬화가 가능해야 합니다.
+    '''
+
+    def __init__(self,
+                 maxsize: int = 256,
+                 ttl: float = 3600,
+                 persist_path: Optional[str] = None,
+                 save_delay: float = 1.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.persist_path = persist_path
+        self.save_delay = save_delay
+
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self.hits = 0
+        self.misses = 0
+
+        if self.persist_path:
+            self._load()
+            atexit.register(self.flush)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = (time.time() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            self._schedule_save()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._schedule_save()
+
+    def flush(self):
+        '''
+        예약된 저장을 기다리지 않고 현재 항목을 파일에 씁니다.
+        '''
+        if not self.persist_path:
+            return
+        # snapshot과 쓰기를 _save_lock으로 묶어 오래된 snapshot이 나중에 쓰이지 않도록 함
+        with self._save_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                entries = [[key, expires_at, value] for key, (expires_at, value) in self._data.items()]
+            self._save(entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._data)}
+
+    def _load(self):
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+        for key, expires_at, value in entries:
+            if expires_at > now:
+                self._data[key] = (expires_at, value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def _schedule_save(self):
+        # self._lock을 잡은 상태에서 호출
+        if self.persist_path and self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save(self, entries: list):
+        # 파일 쓰기는 self._lock 밖에서 하므로 get() / set()을 막지 않음
+        os.makedirs(os.path.dirname(os.path.abspath(self.persist_path)), exist_ok=True)
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.persist_path)
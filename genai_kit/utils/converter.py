@@ -1,6 +1,9 @@
+import json
 import re
 import numpy as np
-from typing import List, Union
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Union
 
 
 def deep_clean(data):
@@ -17,6 +20,65 @@ def deep_clean(data):
         return data
 
 
+def from_dynamodb(value: Any) -> Any:
+    '''
+    DynamoDB 항목 (Decimal 숫자)을 JSON 호환 값으로 한 번에 변환합니다.
+    json.dumps(default=json_default) -> json.loads 왕복과 같은 결과를 문자열 직렬화 없이 만듭니다.
+    '''
+    value_type = type(value)
+    if value_type is str or value is None or value_type is bool or value_type is int:
+        return value
+    if value_type is dict:
+        return {k: from_dynamodb(v) for k, v in value.items()}
+    if value_type is Decimal:
+        return float(value)
+    if value_type is list or value_type is tuple:
+        return [from_dynamodb(v) for v in value]
+    if value_type is float:
+        return value
+    if value_type is datetime:
+        return value.isoformat()
+    # Enum / dict subclass 등 드문 타입은 기존 왕복 변환으로 처리
+    return json.loads(json.dumps(value, default=json_default))
+
+
+def from_dynamodb_items(items: List[dict]) -> List[dict]:
+    '''
+    query / scan 결과처럼 항목 list를 한 번에 변환합니다.
+    '''
+    convert = from_dynamodb
+    return [convert(item) for item in items]
+
+
+def to_dynamodb(value: Any) -> Any:
+    '''
+    float을 Decimal로 바꿔 DynamoDB에 쓸 수 있는 값으로 변환합니다 (datetime은 ISO 문자열).
+    json.dumps -> json.loads(parse_float=Decimal) 왕복과 같은 결과를 문자열 직렬화 없이 만듭니다.
+    '''
+    value_type = type(value)
+    if value_type is str or value is None or value_type is bool or value_type is int:
+        return value
+    if value_type is dict:
+        return {k: to_dynamodb(v) for k, v in value.items()}
+    if value_type is float:
+        return Decimal(repr(value))
+    if value_type is list or value_type is tuple:
+        return [to_dynamodb(v) for v in value]
+    if value_type is Decimal:
+        return Decimal(repr(float(value)))
+    if value_type is datetime:
+        return value.isoformat()
+    return json.loads(json.dumps(value, default=json_default), parse_float=Decimal)
+
+
+def json_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
 def safe_float_conversion(value):
     try:
         return float(value)
@@ -45,4 +107,46 @@ def extract_xml_values(input_string: str, extract_keyword: str) -> Union[List[st
     
     pattern = f"<{extract_keyword}>(.*?)</{extract_keyword}>"
     matches = re.findall(pattern, input_string)
-    return matches
\ No newline at end of file
+    return matches
+
+class XmlStreamExtractor:
+    """
+    스트리밍으로 들어오는 텍스트에서 <tag>...</tag> 사이 값을 점진적으로 추출하는 클래스
+
+    feed()는 새로 확정된 태그 내부 텍스트만 반환하며, 닫는 태그의 일부일 수 있는
+    꼬리 문자열은 다음 chunk가 올 때까지 보류합니다. 닫는 태그가 도착하면 done이 True가 됩니다.
+    """
+
+    def __init__(self, extract_keyword: str):
+        self.open_tag = f"<{extract_keyword}>"
+        self.close_tag = f"</{extract_keyword}>"
+        self.value = ""
+        self.started = False
+        self.done = False
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> str:
+        if self.done:
+            return ""
+        self._buffer += chunk
+
+        if not self.started:
+            idx = self._buffer.find(self.open_tag)
+            if idx < 0:
+                self._buffer = self._buffer[-(len(self.open_tag) - 1):]
+                return ""
+            self.started = True
+            self._buffer = self._buffer[idx + len(self.open_tag):]
+
+        idx = self._buffer.find(self.close_tag)
+        if idx >= 0:
+            delta = self._buffer[:idx]
+            self.done = True
+            self._buffer = ""
+        else:
+            safe = max(len(self._buffer) - (len(self.close_tag) - 1), 0)
+            delta = self._buffer[:safe]
+            self._buffer = self._buffer[safe:]
+
+        self.value += delta
+        return delta
@@ -0,0 +1,37 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+
+class BackgroundServer:
+    '''
+    프로세스당 하나의 ThreadingHTTPServer를 daemon thread로 띄웁니다.
+
+    Streamlit은 rerun마다 start()를 다시 호출하므로 이미 떠 있으면 그 server를 반환하고,
+    port를 열 수 없으면 (예: 다른 프로세스가 사용 중) 한 번만 출력한 뒤 이후 호출에서도 None을 반환합니다.
+    '''
+
+    def __init__(self, name: str):
+        self.name = name
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def start(self,
+              addr: str,
+              port: int,
+              handler: Callable[..., BaseHTTPRequestHandler]) -> Optional[ThreadingHTTPServer]:
+        if not port:
+            return None
+
+        with self._lock:
+            if self._server is None and not self._failed:
+                try:
+                    self._server = ThreadingHTTPServer((addr, port), handler)
+                except OSError as e:
+                    self._failed = True
+                    print(f"Failed to start {self.name} on {addr}:{port}: {e}")
+                    return None
+                self._server.daemon_threads = True
+                threading.Thread(target=self._server.serve_forever, name=self.name, daemon=True).start()
+            return self._server
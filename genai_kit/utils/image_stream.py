@@ -0,0 +1,162 @@
+import binascii
+import re
+from io import BytesIO
+from typing import Iterator, List, Union
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_STRUCTURE = re.compile(rb'["{}\[\]:,]')
+_ESCAPES = {
+    ord('"'): b'"', ord('\\'): b'\\', ord('/'): b'/',
+    ord('b'): b'\b', ord('f'): b'\f', ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t',
+}
+
+
+class ImageStreamParser:
+    '''
+    invoke_model 응답 JSON을 조각 단위로 받아 최상위 key (기본 "images") 배열의 base64 문자열을
+    하나씩 꺼내는 incremental parser.
+
+    전체 body / dict / base64 문자열 목록을 한 번에 메모리에 올리지 않고, 완성된 이미지만 반환합니다.
+    decode=True이면 base64를 4글자 단위로 바로 decode하여 BytesIO로, False이면 base64 str로 반환합니다.
+    '''
+
+    def __init__(self, key: str = 'images', decode: bool = True):
+        self.key = key.encode('utf-8')
+        self.decode = decode
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = b''          # '\\' 또는 '\\uXXX' 처럼 아직 끝나지 않은 escape
+        self._is_key = False        # 현재 문자열이 최상위 object의 key인지
+        self._expect_key = False
+        self._last_key = b''
+        self._text = bytearray()    # key 문자열 (이미지 이외의 값은 저장하지 않음)
+        self._array_depth = 0       # images 배열 내부의 depth (0이면 배열 밖)
+        self._image = None          # 현재 이미지: BytesIO (decode) 또는 bytearray (base64)
+        self._pending = b''         # 4글자 미만으로 남은 base64
+
+    def feed(self, chunk: bytes) -> List[Union[BytesIO, str]]:
+        images = []
+        i, n = 0, len(chunk)
+        while i < n:
+            if self._in_string:
+                if self._escape:
+                    i = self._consume_escape(chunk, i)
+                    continue
+                # 문자열 내부는 bytes.find(memchr)로 큰 구간을 한 번에 처리
+                quote = chunk.find(b'"', i)
+                end = quote if quote >= 0 else n
+                backslash = chunk.find(b'\\', i, end)
+                if backslash >= 0:
+                    end = backslash
+                if end > i:
+                    self._write_string(chunk[i:end])
+                if end == n:
+                    break
+                if end == backslash:
+                    self._escape = b'\\'
+                    i = end + 1
+                else:
+                    i = end + 1
+                    image = self._end_string()
+                    if image is not None:
+                        images.append(image)
+                continue
+
+            match = _STRUCTURE.search(chunk, i)
+            if match is None:
+                break
+            i = match.end()
+            self._on_structure(match.group())
+        return images
+
+    def _on_structure(self, token: bytes):
+        if token == b'"':
+            self._in_string = True
+            self._is_key = self._depth == 1 and self._expect_key
+            if self._is_key:
+                self._text = bytearray()
+            elif self._in_images():
+                self._image = BytesIO() if self.decode else bytearray()
+                self._pending = b''
+        elif token in (b'{', b'['):
+            self._depth += 1
+            if token == b'{' and self._depth == 1:
+                self._expect_key = True
+            if token == b'[' and self._depth == 2 and self._last_key == self.key:
+                self._array_depth = self._depth
+        elif token in (b'}', b']'):
+            if self._array_depth and self._depth == self._array_depth:
+                self._array_depth = 0
+            self._depth -= 1
+        elif token == b':':
+            if self._depth == 1:
+                self._expect_key = False
+        elif token == b',':
+            if self._depth == 1:
+                self._expect_key = True
+                self._last_key = b''
+
+    def _in_images(self) -> bool:
+        return self._array_depth > 0 and self._depth == self._array_depth
+
+    def _write_string(self, data: bytes):
+        if self._is_key:
+            self._text += data
+        elif self._image is not None:
+            if not self.decode:
+                self._image += data
+                return
+            data = self._pending + data
+            cut = len(data) - len(data) % 4
+            if cut:
+                self._image.write(binascii.a2b_base64(data[:cut]))
+            self._pending = data[cut:]
+
+    def _end_string(self):
+        self._in_string = False
+        if self._is_key:
+            self._last_key = bytes(self._text)
+            self._is_key = False
+            return None
+        if self._image is None:
+            return None
+
+        image, self._image = self._image, None
+        if not self.decode:
+            return image.decode('ascii')
+        if self._pending:
+            image.write(binascii.a2b_base64(self._pending))
+            self._pending = b''
+        image.seek(0)
+        return image
+
+    def _consume_escape(self, chunk: bytes, i: int) -> int:
+        self._escape += chunk[i:i + 1]
+        i += 1
+        if self._escape[1:2] == b'u':
+            if len(self._escape) < 6:
+                return i
+            value = chr(int(self._escape[2:6], 16)).encode('utf-8')
+        else:
+            value = _ESCAPES.get(self._escape[1], self._escape[1:2])
+        self._escape = b''
+        # base64 문자열 안의 줄바꿈 등 공백은 무시
+        if not value.isspace():
+            self._write_string(value)
+        return i
+
+
+def iter_response_images(body, key: str = 'images', decode: bool = True,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Union[BytesIO, str]]:
+    '''
+    botocore StreamingBody (또는 read(size)를 지원하는 file-like)에서 이미지를 하나씩 반환합니다.
+    '''
+    parser = ImageStreamParser(key=key, decode=decode)
+    while True:
+        chunk = body.read(chunk_size)
+        if not chunk:
+            break
+        yield from parser.feed(chunk)
@@ -68,7 +68,12 @@ def display_video(video_bytes: bytes, width=800):
         pass
 
 def base64_to_bytes(base64str: str):
-    return BytesIO(base64.decodebytes(bytes(base64str, "utf-8")))
+    # str을 bytes로 복사하지 않고 바로 decode
+    return BytesIO(base64.b64decode(base64str))
+
+def base64_to_raw_bytes(base64str: str) -> bytes:
+    # st.image와 S3 업로드에 같은 bytes를 그대로 사용 (읽기 위치가 없음)
+    return base64.b64decode(base64str)
 
 def base64_to_image(base64str: str):
     return Image.open(base64_to_bytes(base64str))
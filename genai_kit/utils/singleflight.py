@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    '''
+    같은 key로 동시에 들어온 호출을 하나로 합칩니다.
+    먼저 들어온 호출만 fn을 실행하고, 실행 중에 들어온 나머지 호출은 그 결과 (또는 예외)를 함께 받습니다.
+    완료된 결과는 저장하지 않으므로 이후 호출은 다시 실행됩니다 (캐시는 별도 계층에서 담당).
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        leader, call = self.claim(key)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        result, error = None, None
+        try:
+            result = fn(*args, **kwargs)
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.release(key, call, result, error)
+
+    def claim(self, key: Hashable) -> Tuple[bool, _Call]:
+        '''
+        do()를 쓸 수 없는 호출 (예: 결과를 stream으로 반환하는 generator)을 위한 저수준 API.
+        (True, call)이면 호출자가 leader이며 끝난 뒤 반드시 release()를 호출해야 하고,
+        (False, call)이면 call.done을 기다린 뒤 call.result / call.error를 사용합니다.
+        '''
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._shared += 1
+                return False, call
+            call = _Call()
+            self._calls[key] = call
+            self._executed += 1
+            return True, call
+
+    def release(self, key: Hashable, call: _Call, result: Any = None, error: BaseException = None):
+        call.result = result
+        call.error = error
+        with self._lock:
+            del self._calls[key]
+        call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'executed': self._executed, 'shared': self._shared, 'in_flight': len(self._calls)}
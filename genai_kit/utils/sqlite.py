@@ -0,0 +1,41 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ThreadLocalSQLite:
+    '''
+    thread마다 별도의 connection을 여는 SQLite 파일 (sqlite3 connection은 thread 간에 공유하지 않음).
+
+    connection은 WAL + synchronous=NORMAL, autocommit (isolation_level=None)이며
+    여러 문장을 묶어야 하면 transaction()으로 write transaction을 엽니다.
+    '''
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE: 시작할 때 write lock을 잡아 읽기 -> 쓰기 사이에 다른 writer가 끼어들지 않음
+        conn = self.conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
@@ -1,21 +1,65 @@
 from enum import Enum
-import boto3
 import re
 import json
-from typing import List, Optional, Dict, Any, Union
+import base64
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, List, Optional, Dict, Any, Tuple, Union
 from genai_kit.aws.amazon_image import ImageParams, NovaImageSize, TitanImageSize
 from genai_kit.aws.claude import BedrockClaude
+from genai_kit.aws.client import BEDROCK_MAX_ATTEMPTS, get_client
+from genai_kit.aws.rate_limiter import get_rate_limiter
+from genai_kit.aws.circuit_breaker import get_circuit_breaker
 from genai_kit.aws.bedrock import BedrockModel
 from genai_kit.aws.sd_image import BedrockStableDiffusion, SDImageSize
-from genai_kit.utils.converter import extract_xml_values
+from genai_kit.utils.cache import TTLCache
+from genai_kit.utils.singleflight import SingleFlight
+from genai_kit.utils.converter import XmlStreamExtractor
+from genai_kit.utils.image_stream import iter_response_images
+from services.generation_cache import GenerationCache
+from services.model_router import get_candidate_models, invoke_with_fallback, log_fallback, should_fallback
 from constants import VIDEO_PREFIX, EditingMode
 from config import config
 
 
+LUMA_REGION = 'us-west-2'
+MAX_IMAGES_PER_REQUEST = 5
+MAX_SEED = 2147483647
+
+generation_cache = GenerationCache(
+    cache_dir=config.GENERATION_CACHE_DIR,
+    max_bytes=config.GENERATION_CACHE_MAX_MB * 1024 * 1024,
+    # local storage backend에서는 S3 캐시 계층을 사용하지 않음
+    s3_client=get_client('s3') if config.STORAGE_BACKEND == 'aws' else None,
+    bucket_name=config.S3_BUCKET,
+)
+inflight_requests = SingleFlight()
+inflight_prompts = SingleFlight()
+prompt_cache = TTLCache(
+    maxsize=config.PROMPT_CACHE_SIZE,
+    ttl=config.PROMPT_CACHE_TTL,
+    persist_path=config.PROMPT_CACHE_PATH or None,
+)
+
+
 def gen_english(request: str,
                 temperature: Optional[float] = None,
                 top_p: Optional[float] = None,
-                top_k: Optional[int] = None):
+                top_k: Optional[int] = None) -> str:
+    # 실패하거나 빈 응답이면 원래 요청을 그대로 사용 (gen_mm_image_prompt / gen_mm_video_prompt와 같음)
+    try:
+        return "".join(stream_english(request, temperature, top_p, top_k)) or request
+    except Exception as e:
+        print(e)
+        return request
+
+def stream_english(request: str,
+                   temperature: Optional[float] = None,
+                   top_p: Optional[float] = None,
+                   top_k: Optional[int] = None,
+                   stats: Optional[Dict[str, Any]] = None) -> Iterator[str]:
     prompt = f"""You are an Assistant for translation.
                 Always change the contents in <request> to English without any additional descriptions or tags.
                 If there is no <request>, please suggest a new keyword about object or scene without any additional descriptions or tags.
@@ -26,17 +70,30 @@ def gen_english(request: str,
                 """
       
     model_kwargs = _get_model_kwargs(temperature, top_p, top_k)  
-    return BedrockClaude(
-        region=config.BEDROCK_REGION,
-        modelId=BedrockModel.HAIKU_3_5_CR,
-        **model_kwargs
-    ).invoke_llm_response(prompt)
+    return _stream_llm_cached(
+        model_id=BedrockModel.HAIKU_3_5_CR,
+        prompt=prompt,
+        model_kwargs=model_kwargs,
+        stats=stats,
+    )
 
 def gen_mm_image_prompt(keyword: str,
                         image: str,
                         temperature: Optional[float] = None,
                         top_p: Optional[float] = None,
-                        top_k: Optional[int] = None) -> List[str]:
+                        top_k: Optional[int] = None) -> str:
+    try:
+        return "".join(stream_mm_image_prompt(keyword, image, temperature, top_p, top_k)) or keyword
+    except Exception as e:
+        print(e)
+        return keyword
+
+def stream_mm_image_prompt(keyword: str,
+                           image: str,
+                           temperature: Optional[float] = None,
+                           top_p: Optional[float] = None,
+                           top_k: Optional[int] = None,
+                           stats: Optional[Dict[str, Any]] = None) -> Iterator[str]:
     prompt = f"""You are an Assistant that generates prompt for generate image by image generator model.
     The image that Human wants is written in <keyword>.
     - Write a images creation prompt keeping it to 400 characters or less.
@@ -52,26 +109,34 @@ def gen_mm_image_prompt(keyword: str,
     </keyword>
     """
 
-    try:
-        model_kwargs = _get_model_kwargs(temperature, top_p, top_k)
-        claude = BedrockClaude(
-            region=config.BEDROCK_REGION,
-            modelId=BedrockModel.SONNET_3_5_CR,
-            **model_kwargs
-        )
-        res = claude.invoke_llm_response(text=prompt, image=image)
-        print(res)
-        return extract_xml_values(res, "prompt")[0]
-    except Exception as e:
-        print(e)
-        return keyword
+    model_kwargs = _get_model_kwargs(temperature, top_p, top_k)
+    return _stream_llm_cached(
+        model_id=BedrockModel.SONNET_3_5_CR,
+        prompt=prompt,
+        image=image,
+        model_kwargs=model_kwargs,
+        extract_tag="prompt",
+        stats=stats,
+    )
 
 
 def gen_mm_video_prompt(keyword: str,
                        image: str,
                        temperature: Optional[float] = None,
                        top_p: Optional[float] = None,
-                       top_k: Optional[int] = None) -> List[str]:    
+                       top_k: Optional[int] = None) -> str:
+    try:
+        return "".join(stream_mm_video_prompt(keyword, image, temperature, top_p, top_k)) or keyword
+    except Exception as e:
+        print(e)
+        return keyword
+
+def stream_mm_video_prompt(keyword: str,
+                           image: str,
+                           temperature: Optional[float] = None,
+                           top_p: Optional[float] = None,
+                           top_k: Optional[int] = None,
+                           stats: Optional[Dict[str, Any]] = None) -> Iterator[str]:
     prompt = f"""You are an Assistant that generates prompt for generate video by video generator model.
                 The video that Human wants is written in <keyword>.
                 - Write a video creation prompt keeping it to 400 characters or less.
@@ -89,25 +154,130 @@ def gen_mm_video_prompt(keyword: str,
                 </keyword>
                 """
 
+    model_kwargs = _get_model_kwargs(temperature, top_p, top_k)
+    return _stream_llm_cached(
+        model_id=BedrockModel.SONNET_3_5_CR if image else BedrockModel.HAIKU_3_5_CR,
+        prompt=prompt,
+        image=image,
+        model_kwargs=model_kwargs,
+        extract_tag="prompt",
+        stats=stats,
+    )
+
+
+def _stream_llm_cached(model_id: BedrockModel,
+                       prompt: str,
+                       image: Optional[str] = None,
+                       model_kwargs: Optional[Dict[str, Any]] = None,
+                       extract_tag: Optional[str] = None,
+                       stats: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """
+    converse_stream으로 응답을 받아 텍스트 조각을 바로 반환합니다.
+    extract_tag가 주어지면 태그 내부 텍스트만 반환하고, 닫는 태그가 도착하는 즉시 stream을 종료합니다.
+
+    (프롬프트, 입력 이미지 digest, 샘플링 파라미터, 모델)이 같은 요청은 LLM을 다시 호출하지 않습니다.
+    같은 요청이 동시에 들어오면 먼저 들어온 호출만 stream을 받고, 나머지는 그 결과를 기다렸다가 한 번에 받습니다.
+    stats dict를 넘기면 ttft / total (초)와 cached / shared 여부가 기록됩니다.
+    """
+    stats = stats if stats is not None else {}
+    model_kwargs = model_kwargs or {}
+    key = hashlib.sha256(json.dumps({
+        'modelId': model_id.value,
+        'prompt': prompt,
+        'image': hashlib.sha256(image.encode('utf-8')).hexdigest() if image else None,
+        'model_kwargs': model_kwargs,
+        'extract_tag': extract_tag,
+    }, sort_keys=True).encode('utf-8')).hexdigest()
+
+    start = time.perf_counter()
+    cached = prompt_cache.get(key)
+    if cached is not None:
+        stats.update({'cached': True, 'ttft': time.perf_counter() - start, 'total': time.perf_counter() - start})
+        yield cached
+        return
+
+    leader, call = inflight_prompts.claim(key)
+    if not leader:
+        call.done.wait()
+        # leader가 끝까지 받지 못했으면 (중간에 닫힘 / 빈 응답) 직접 호출
+        if call.result:
+            stats.update({'cached': False, 'shared': True,
+                          'ttft': time.perf_counter() - start, 'total': time.perf_counter() - start})
+            yield call.result
+            return
+        yield from _stream_llm(key, start, model_id, prompt, image, model_kwargs, extract_tag, stats)
+        return
+
+    result = None
     try:
-        model_kwargs = _get_model_kwargs(temperature, top_p, top_k)
-        if image:
+        result = yield from _stream_llm(key, start, model_id, prompt, image, model_kwargs, extract_tag, stats)
+    finally:
+        inflight_prompts.release(key, call, result)
+
+
+def _stream_llm(key: str,
+                start: float,
+                model_id: BedrockModel,
+                prompt: str,
+                image: Optional[str],
+                model_kwargs: Dict[str, Any],
+                extract_tag: Optional[str],
+                stats: Dict[str, Any]):
+    # 응답을 stream으로 반환하고, 끝까지 받은 결과 (없으면 None)를 generator의 반환값으로 돌려줌
+    extractor = XmlStreamExtractor(extract_tag) if extract_tag else None
+    parts = []
+    stats.update({'cached': False, 'shared': False, 'ttft': None, 'model_id': model_id.value})
+    try:
+        # 모델 가용성 오류 (breaker OPEN, throttling, quota 등)로 응답을 하나도 받지 못했을 때만 fallback 모델로 다시 요청
+        candidates = get_candidate_models(model_id)
+        reason = None
+        for candidate in candidates:
+            if candidate != model_id:
+                log_fallback(model_id, candidate, reason=reason)
+                stats['model_id'] = candidate.value
+
             claude = BedrockClaude(
                 region=config.BEDROCK_REGION,
-                modelId=BedrockModel.SONNET_3_5_CR,
+                modelId=candidate,
                 **model_kwargs
             )
-        else:
-            claude = BedrockClaude(
-                region=config.BEDROCK_REGION,
-                modelId=BedrockModel.HAIKU_3_5_CR,
-                **model_kwargs
+            chunks = claude.converse_stream(
+                text=prompt,
+                image=base64.b64decode(image) if image else None,
+                image_format='jpeg',
+                raise_errors=True,
             )
-        res = claude.invoke_llm_response(text=prompt, image=image)
-        return extract_xml_values(res, "prompt")[0]
-    except Exception as e:
-        print(e)
-        return keyword
+            try:
+                for chunk in chunks:
+                    if stats['ttft'] is None:
+                        stats['ttft'] = time.perf_counter() - start
+                    delta = extractor.feed(chunk) if extractor else chunk
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+                    if extractor and extractor.done:
+                        break
+                break
+            except Exception as e:
+                # 이미 일부를 반환했거나 요청 오류 (validation, 잘못된 이미지, 권한 등)이면 그대로 raise
+                if stats['ttft'] is not None or not should_fallback(e) or candidate == candidates[-1]:
+                    raise
+                reason = getattr(e, 'response', {}).get('Error', {}).get('Code') or type(e).__name__
+            finally:
+                chunks.close()
+    finally:
+        stats['total'] = time.perf_counter() - start
+
+    result = "".join(parts)
+    if not result or (extractor is not None and not extractor.done):
+        return None
+    # fallback 모델의 결과는 요청한 모델의 key로 저장하지 않음
+    if stats['model_id'] == model_id.value:
+        prompt_cache.set(key, result)
+    return result
+
+def get_prompt_cache_stats() -> Dict[str, int]:
+    return {**prompt_cache.stats(), 'shared': inflight_prompts.stats()['shared']}
 
 
 def gen_image(model_type: BedrockModel,
@@ -117,8 +287,11 @@ def gen_image(model_type: BedrockModel,
               seed: Optional[int] = 0,
               cfg: Optional[float] = 8.0,
               color_guide: Optional[List[str]] = [], 
+              fallback: bool = True,
+              stream: bool = False,
               ):
-    
+    # fallback=False: 요청한 모델로만 생성 (모델 비교 등)
+    # stream=True: 이미지 list 대신 응답에서 하나씩 꺼낸 base64 str의 iterator를 반환 (캐시 대상이면 list)
     if is_sd_model(model_type):
         sd_image_gen = BedrockStableDiffusion(
             modelId=model_type, 
@@ -130,10 +303,13 @@ def gen_image(model_type: BedrockModel,
             "seed": seed,
             "output_format": "png"
         }
-        image = sd_image_gen.invoke_model(
-            body = body,
+        images, _ = _generate_cached(
+            model_type,
+            body,
+            deterministic=_is_deterministic(model_type, seed),
+            generate=lambda: ([sd_image_gen.invoke_model(body=body)], model_type),
         )
-        return [image], body
+        return images, body
     
     else:
         img_params = ImageParams(seed=seed)
@@ -154,8 +330,13 @@ def gen_image(model_type: BedrockModel,
                 text=prompt
             )
 
-        image = invoke_bedrock(model_type, body)
-        return image, json.loads(body)
+        image, used_model = _generate_cached(
+            model_type,
+            body,
+            deterministic=_is_deterministic(model_type, seed),
+            generate=lambda: _invoke_image_routed(model_type, body, size, fallback, stream),
+        )
+        return image, _routed_details(body, model_type, used_model)
 
 
 def edit_image(model_type: BedrockModel,
@@ -168,8 +349,9 @@ def edit_image(model_type: BedrockModel,
                count: Optional[int] = 1,
                seed: Optional[int] = 0,
                cfg: Optional[float] = 8.0,
+               stream: bool = False,
               ):
-    
+    # stream: gen_image와 같음
     img_params = ImageParams(seed=seed)
     img_params.set_configuration(
             count=count,
@@ -213,21 +395,210 @@ def edit_image(model_type: BedrockModel,
             negative_text=negative_text,
         )
 
-    image = invoke_bedrock(model_type, body)
-    return image, json.loads(body)
+    image, used_model = _generate_cached(
+        model_type,
+        body,
+        deterministic=_is_deterministic(model_type, seed),
+        generate=lambda: _invoke_image_routed(model_type, body, size, stream=stream),
+    )
+    return image, _routed_details(body, model_type, used_model)
+
+
+def gen_image_compare(model_types: List[BedrockModel],
+                      prompt: str,
+                      width: int,
+                      height: int,
+                      seed: Optional[int] = 0,
+                      cfg: Optional[float] = 8.0,
+                      max_workers: Optional[int] = None):
+    """
+    같은 프롬프트를 여러 모델에 동시에 요청하고, 완료되는 순서대로 결과를 반환합니다.
+
+    비교 결과가 요청한 모델의 것이어야 하므로 fallback 모델로 전환하지 않습니다.
+
+    Yields:
+        dict: model_type, used_model, images, body, latency(초), error
+    """
+    if not model_types:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(model_types)) as executor:
+        futures = {
+            executor.submit(
+                _timed_gen_image,
+                model_type=model_type,
+                prompt=prompt,
+                size=get_model_size(model_type, width, height),
+                seed=seed,
+                cfg=cfg,
+                fallback=False,
+            ): model_type
+            for model_type in model_types
+        }
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _timed_gen_image(model_type: BedrockModel, **kwargs) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        images, body = gen_image(model_type=model_type, **kwargs)
+        error = None
+    except Exception as e:
+        images, body, error = [], None, str(e)
+    return {
+        'model_type': model_type,
+        # breaker가 fallback 모델로 전환했으면 실제로 생성한 모델
+        'used_model': BedrockModel(body['fallbackModel']) if body and 'fallbackModel' in body else model_type,
+        'images': images,
+        'body': body,
+        'latency': time.perf_counter() - start,
+        'error': error,
+    }
+
+
+def gen_image_batch(model_type: BedrockModel,
+                    prompt: str,
+                    size: Union[TitanImageSize, NovaImageSize, SDImageSize],
+                    total: int,
+                    seed: Optional[int] = 0,
+                    cfg: Optional[float] = 8.0,
+                    color_guide: Optional[List[str]] = [],
+                    max_workers: int = 4):
+    """
+    요청한 이미지 수를 모델당 최대 생성 수(Nova/Titan 5장, Stability 1장) 단위로 나누어
+    최대 max_workers개씩 병렬 호출하고, 완료되는 순서대로 결과를 반환합니다.
+    각 shard는 seed + shard index로 파생된 seed를 사용하므로 첫 shard는 단일 요청과 같은 결과를 냅니다.
+
+    Yields:
+        dict: index, seed, used_model, images, body, latency(초), error
+    """
+    per_request = 1 if is_sd_model(model_type) else MAX_IMAGES_PER_REQUEST
+    shards = [
+        (index, min(per_request, total - offset))
+        for index, offset in enumerate(range(0, total, per_request))
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _timed_gen_image_shard,
+                index=index,
+                model_type=model_type,
+                prompt=prompt,
+                size=size,
+                count=count,
+                seed=_derive_seed(seed, index),
+                cfg=cfg,
+                color_guide=color_guide,
+            )
+            for index, count in shards
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _timed_gen_image_shard(index: int, **kwargs) -> Dict[str, Any]:
+    result = _timed_gen_image(**kwargs)
+    result.update({'index': index, 'seed': kwargs['seed']})
+    return result
+
+
+def _derive_seed(seed: Optional[int], index: int) -> Optional[int]:
+    if seed is None:
+        return None
+    return (seed + index) % MAX_SEED
+
+
+def _generate_cached(model_type: BedrockModel,
+                     body: Union[str, Dict[str, Any]],
+                     deterministic: bool,
+                     generate: Callable[[], Tuple[List[str], BedrockModel]]) -> Tuple[List[str], BedrockModel]:
+    if not deterministic:
+        generation_cache.bypass()
+        return generate()
+
+    key = GenerationCache.make_key(model_type, body)
+    images = generation_cache.get(key)
+    if images is not None:
+        return images, model_type
+
+    images, used_model = generate()
+    # 캐시에 저장하려면 모든 이미지가 필요하므로 stream 요청이어도 여기서는 list로 받음
+    images = list(images)
+    # fallback 모델의 결과는 요청한 모델의 key로 저장하지 않음
+    if images and used_model == model_type:
+        generation_cache.put(key, images)
+    return images, used_model
+
+
+def _invoke_image_routed(model_type: BedrockModel,
+                         body: str,
+                         size: Union[TitanImageSize, NovaImageSize],
+                         fallback: bool = True,
+                         stream: bool = False) -> Tuple[Iterable[str], BedrockModel]:
+    # stream이면 동시 요청 병합 (결과 전체를 공유해야 함)을 거치지 않고 응답을 하나씩 읽는 iterator를 반환
+    invoke = _invoke_bedrock if stream else invoke_bedrock
+    if not fallback:
+        return invoke(model_type, body), model_type
+    return invoke_with_fallback(
+        model_type,
+        invoke=lambda model: invoke(model, body),
+        compatible=lambda model: _supports_size(model, size.width, size.height),
+    )
+
+
+def _supports_size(model_type: BedrockModel, width: int, height: int) -> bool:
+    if model_type == BedrockModel.TITAN_IMAGE:
+        return (width, height) in {size.value for size in TitanImageSize}
+    if model_type == BedrockModel.NOVA_CANVAS:
+        return (width, height) in {size.value for size in NovaImageSize}
+    return True
+
 
+def _routed_details(body: str, model_type: BedrockModel, used_model: BedrockModel) -> Dict[str, Any]:
+    details = json.loads(body)
+    if used_model != model_type:
+        details['fallbackModel'] = getattr(used_model, 'value', used_model)
+    return details
 
-def invoke_bedrock(model_type: str, body: str):
+
+def _is_deterministic(model_type: BedrockModel, seed: Optional[int]) -> bool:
+    # seed를 지정하지 않으면 ImageParams가 임의 seed를 사용하고, Stability 모델은 seed 0이 임의 seed
+    if seed is None:
+        return False
+    if is_sd_model(model_type) and seed == 0:
+        return False
+    return True
+
+
+def get_generation_cache_stats() -> Dict[str, Any]:
+    return generation_cache.stats()
+
+
+def get_inflight_stats() -> Dict[str, int]:
+    return inflight_requests.stats()
+
+
+def invoke_bedrock(model_type: str, body: str) -> List[str]:
+    # 같은 (모델, body) 요청이 동시에 들어오면 Bedrock 호출 한 번의 결과를 공유
+    # (follower에게 넘기려면 결과 전체가 필요하므로 이 경로에서만 list로 받음)
+    key = hashlib.sha256(f"{getattr(model_type, 'value', model_type)}\n{body}".encode('utf-8')).hexdigest()
+    return inflight_requests.do(key, lambda: list(_invoke_bedrock(model_type, body)))
+
+def _invoke_bedrock(model_type: str, body: str) -> Iterator[str]:
     bedrock = _get_bedrock_runtime()
-    response = bedrock.invoke_model(
+    limiter = get_rate_limiter(model_type, config.BEDROCK_REGION)
+    response = get_circuit_breaker(model_type).call(
+        limiter.call,
+        bedrock.invoke_model,
         body=body,
         modelId=model_type,
         accept="application/json",
         contentType="application/json"
     )
-    response_body = json.loads(response.get("body").read())
-    image = response_body.get("images")
-    return image
+    # invoke_model은 여기서 호출하고 (오류 / fallback 판단), body는 소비하는 쪽에서 base64 이미지를 하나씩 꺼냄
+    return iter_response_images(response.get("body"), decode=False)
 
 
 def is_sd_model(model_type: str):
@@ -237,14 +608,37 @@ def is_sd_model(model_type: str):
         return True
     return False
 
+def get_model_size(model_type: BedrockModel, width: int, height: int):
+    """
+    요청한 해상도와 가장 가까운 모델별 지원 크기를 반환합니다 (비율 우선, 면적 차순).
+    """
+    ratio = width / height
+    if is_sd_model(model_type):
+        return min(SDImageSize, key=lambda size: abs(_aspect_ratio(size.value) - ratio))
+
+    size_enum = TitanImageSize if model_type == BedrockModel.TITAN_IMAGE else NovaImageSize
+    return min(
+        size_enum,
+        key=lambda size: (round(abs(size.width / size.height - ratio), 2),
+                          abs(size.width * size.height - width * height))
+    )
+
+def _aspect_ratio(value: str) -> float:
+    w, h = value.split(':')
+    return int(w) / int(h)
+
 def is_luma_model(model_type: str):
     if model_type in [BedrockModel.LUMA_RAY2]:
         return True
     return False
 
-def gen_video(model_type: BedrockModel, text: str, image: str = None, params: dict = {}):
+def gen_video(model_type: BedrockModel,
+              text: str,
+              image: str = None,
+              params: dict = {},
+              client_request_token: Optional[str] = None):
     if is_luma_model(model_type):
-        bedrock = _get_bedrock_runtime(region='us-west-2')
+        bedrock = _get_bedrock_runtime(region=LUMA_REGION)
         
         model_input = {
             "prompt": text,
@@ -273,20 +667,26 @@ def gen_video(model_type: BedrockModel, text: str, image: str = None, params: di
                 }
             }]
 
-    invocation = bedrock.start_async_invoke(
+    region = LUMA_REGION if is_luma_model(model_type) else config.BEDROCK_REGION
+    # 같은 clientRequestToken으로 다시 요청하면 Bedrock이 새 작업을 시작하지 않고 기존 invocation을 반환
+    extra = {'clientRequestToken': client_request_token} if client_request_token else {}
+    invocation = get_circuit_breaker(model_type).call(
+        get_rate_limiter(model_type, region).call,
+        bedrock.start_async_invoke,
         modelId=model_type,
         modelInput=model_input,
         outputDataConfig={
             "s3OutputDataConfig": {
                 "s3Uri": f"s3://{config.S3_BUCKET}/{VIDEO_PREFIX}/"
             }
-        }
+        },
+        **extra
     )
 
     return invocation.get('invocationArn', '')
 
 def get_video_job(invocation_arn: str):
-    bedrock = _get_bedrock_runtime()
+    bedrock = _get_bedrock_runtime(region=_region_from_arn(invocation_arn))
     invocation = bedrock.get_async_invoke(
         invocationArn=invocation_arn
     )
@@ -296,7 +696,7 @@ def get_video_job(invocation_arn: str):
 def list_video_job(status: str = None, max_results: int = None):
     params = {}
     if status:
-        params["status"] = status
+        params["statusEquals"] = status
     if max_results:
         params["maxResults"] = max_results
 
@@ -304,11 +704,41 @@ def list_video_job(status: str = None, max_results: int = None):
     jobs = bedrock.list_async_invokes(**params)
     return jobs.get("asyncInvokeSummaries", [])
 
+def iter_video_job_pages(submit_time_after: Optional[datetime] = None,
+                         region: str = config.BEDROCK_REGION,
+                         page_size: int = 100):
+    """
+    submitTimeAfter 이후 제출된 async job을 제출 시간 오름차순으로 페이지 단위 반환합니다.
+    """
+    params = {
+        "sortBy": "SubmissionTime",
+        "sortOrder": "Ascending",
+        "maxResults": page_size,
+    }
+    if submit_time_after:
+        params["submitTimeAfter"] = submit_time_after
+
+    bedrock = _get_bedrock_runtime(region=region)
+    while True:
+        response = bedrock.list_async_invokes(**params)
+        yield response.get("asyncInvokeSummaries", [])
+
+        next_token = response.get("nextToken")
+        if not next_token:
+            break
+        params["nextToken"] = next_token
+
+def video_job_regions() -> List[str]:
+    return sorted({config.BEDROCK_REGION, LUMA_REGION})
+
+def _region_from_arn(arn: str, default: str = config.BEDROCK_REGION) -> str:
+    # arn:aws:bedrock:<region>:<account>:async-invoke/<id>
+    parts = arn.split(':')
+    return parts[3] if len(parts) > 3 and parts[3] else default
+
 def _get_bedrock_runtime(region: str = config.BEDROCK_REGION):
-    return boto3.client(
-            service_name = 'bedrock-runtime',
-            region_name=region
-    )
+    # throttling 재시도는 rate limiter가 담당하므로 botocore 재시도는 일시적 오류용으로 최소화
+    return get_client('bedrock-runtime', region, 300, 300, max_attempts=BEDROCK_MAX_ATTEMPTS)
 
 def _get_model_kwargs(temperature: Optional[float] = None,
                     top_p: Optional[float] = None, 
@@ -0,0 +1,119 @@
+import base64
+import binascii
+import hashlib
+import threading
+from typing import Any, Optional
+from genai_kit.utils.cache import TTLCache
+from genai_kit.utils.singleflight import SingleFlight
+from services.storage_backend import StorageBackend
+
+
+BLOB_PREFIX = "blob"
+BLOB_REF_PREFIX = "blob:sha256:"
+
+# Bedrock 요청 body / 레코드에서 base64 이미지를 담는 key
+IMAGE_KEYS = {'image', 'images', 'conditionImage', 'referenceImage', 'maskImage', 'bytes', 'ref_image'}
+# 이보다 짧은 값은 그대로 둠 (digest 참조가 더 길어지는 경우)
+MIN_BLOB_LENGTH = 256
+
+# 저장을 확인한 blob의 URL (backend마다 다름). 프로세스의 모든 BlobStore가 공유하며 purge 후 forget_blobs()로 비움
+_known = TTLCache(maxsize=4096, ttl=86400)
+_known_lock = threading.Lock()
+_generation = 0
+
+
+class BlobStore:
+    """
+    base64 이미지를 SHA-256 digest를 key로 storage backend (S3 / local)에 한 번만 저장하는 content-addressed store.
+
+    레코드에는 "blob:sha256:<digest>" 참조만 남기고, 화면에서는 미디어 URL (CloudFront 등)로 바꿔 표시합니다.
+    이미 저장한 digest는 메모리에 기억하고, 처음 보는 digest만 존재 여부를 확인합니다 (S3는 HeadObject).
+    같은 digest의 동시 업로드는 하나로 합칩니다. 기억한 digest는 storage를 purge하면 forget_blobs()로 잊습니다.
+    """
+
+    def __init__(self, backend: StorageBackend, prefix: str = BLOB_PREFIX):
+        self.backend = backend
+        self.prefix = prefix
+        self._inflight = SingleFlight()
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        if not _known.get(self.backend.url(self._key(digest))):
+            self._inflight.do(digest, self._upload, digest, data)
+        return f"{BLOB_REF_PREFIX}{digest}"
+
+    def put_base64(self, value: str) -> str:
+        return self.put(base64.b64decode(value, validate=True))
+
+    def url(self, ref: str) -> str:
+        return self.backend.url(self._key(ref[len(BLOB_REF_PREFIX):]))
+
+    def externalize(self, value: Any, key: Optional[str] = None) -> Any:
+        """
+        IMAGE_KEYS 아래의 base64 문자열 (또는 그 list)을 blob 참조로 바꾼 사본을 반환합니다.
+        """
+        if isinstance(value, dict):
+            return {k: self.externalize(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.externalize(v, key) for v in value]
+        if key in IMAGE_KEYS and isinstance(value, str) and len(value) >= MIN_BLOB_LENGTH:
+            try:
+                return self.put_base64(value)
+            except (binascii.Error, ValueError):
+                return value
+        return value
+
+    def resolve(self, value: Any) -> Any:
+        """
+        blob 참조를 미디어 URL로 바꾼 사본을 반환합니다.
+        """
+        if isinstance(value, dict):
+            return {k: self.resolve(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+        if is_blob_ref(value):
+            return self.url(value)
+        return value
+
+    def _upload(self, digest: str, data: bytes):
+        key = self._key(digest)
+        generation = _generation
+        if not self.backend.object_exists(key):
+            self.backend.put_object(
+                key,
+                memoryview(data),
+                _content_type(data),
+                # 내용이 바뀌지 않는 key이므로 CloudFront / 브라우저 캐시를 길게 유지
+                cache_control='public, max-age=31536000, immutable',
+            )
+        with _known_lock:
+            # 업로드 도중 purge가 끝났으면 이미 지워졌을 수 있으므로 기억하지 않음
+            if generation == _generation:
+                _known.set(self.backend.url(key), True)
+
+    def _key(self, digest: str) -> str:
+        return f"{self.prefix}/{digest}"
+
+
+def forget_blobs():
+    '''
+    storage를 purge한 뒤 호출합니다. 다음 put()은 blob이 있는지 다시 확인하고 필요하면 다시 업로드합니다.
+    '''
+    global _generation
+    with _known_lock:
+        _generation += 1
+        _known.clear()
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith(BLOB_REF_PREFIX)
+
+
+def _content_type(data: bytes) -> str:
+    if data.startswith(b'\x89PNG'):
+        return 'image/png'
+    if data.startswith(b'\xff\xd8'):
+        return 'image/jpeg'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'application/octet-stream'
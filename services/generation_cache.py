@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+from botocore.exceptions import BotoCoreError, ClientError
+
+
+class GenerationCache:
+    """
+    (model id, request body)의 정규화된 해시를 key로 생성 결과를 저장하는 2단계 캐시.
+
+    - disk tier: cache_dir/<key>.json, 항목 수/용량 기준 LRU eviction
+    - S3 tier: s3://<bucket>/<prefix>/<key>.json (만료는 bucket lifecycle rule에 맡김)
+      선택적인 계층이므로 S3 오류는 생성 요청을 실패시키지 않고, 쓰기는 background thread에서 처리
+    """
+
+    def __init__(self,
+                 cache_dir: str,
+                 max_bytes: int = 512 * 1024 * 1024,
+                 max_entries: int = 2000,
+                 s3_client=None,
+                 bucket_name: Optional[str] = None,
+                 prefix: str = "cache"):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> size, 오래된 순
+        self._total_bytes = 0
+        self._stats = {'disk_hits': 0, 's3_hits': 0, 'misses': 0, 'bypassed': 0, 'evictions': 0}
+        self._s3_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="generation-cache-s3")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(model_id: str, body: Union[str, Dict[str, Any]]) -> str:
+        if isinstance(body, str):
+            body = json.loads(body)
+        canonical = json.dumps(
+            {'modelId': getattr(model_id, 'value', model_id), 'body': body},
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        images = self._get_disk(key)
+        if images is not None:
+            self._count('disk_hits')
+            return images
+
+        images = self._get_s3(key)
+        if images is not None:
+            self._count('s3_hits')
+            self._put_disk(key, json.dumps(images).encode('utf-8'))
+            return images
+
+        self._count('misses')
+        return None
+
+    def put(self, key: str, images: List[str]):
+        data = json.dumps(images).encode('utf-8')
+        self._put_disk(key, data)
+        if self.s3_client and self.bucket_name:
+            self._s3_writer.submit(self._put_s3, key, data)
+
+    def bypass(self):
+        self._count('bypassed')
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({'entries': len(self._entries), 'bytes': self._total_bytes})
+        lookups = stats['disk_hits'] + stats['s3_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['disk_hits'] + stats['s3_hits']) / lookups if lookups else 0.0
+        return stats
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    '''
+    Disk tier
+    '''
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_index(self):
+        files = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            stat = os.stat(os.path.join(self.cache_dir, name))
+            files.append((stat.st_mtime, name[:-len('.json')], stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _get_disk(self, key: str) -> Optional[List[str]]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+
+        try:
+            with open(self._path(key), 'rb') as f:
+                images = json.loads(f.read())
+            os.utime(self._path(key))
+            return images
+        except (OSError, ValueError):
+            with self._lock:
+                self._total_bytes -= self._entries.pop(key, 0)
+            return None
+
+    def _put_disk(self, key: str, data: bytes):
+        tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+
+        with self._lock:
+            self._total_bytes += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._stats['evictions'] += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    '''
+    S3 tier
+    '''
+    def _s3_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}.json"
+
+    def _get_s3(self, key: str) -> Optional[List[str]]:
+        if not self.s3_client or not self.bucket_name:
+            return None
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self._s3_key(key))
+            return json.loads(response['Body'].read())
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                print(f"Failed to read generation cache from S3: {e}")
+            return None
+        except (BotoCoreError, ValueError) as e:
+            # 네트워크 / credential 오류 등: S3 계층 없이 계속 진행
+            print(f"Failed to read generation cache from S3: {e}")
+            return None
+
+    def _put_s3(self, key: str, data: bytes):
+        if not self.s3_client or not self.bucket_name:
+            return
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=self._s3_key(key),
+                Body=data,
+                ContentType='application/json',
+            )
+        except (ClientError, BotoCoreError) as e:
+            print(f"Failed to write generation cache to S3: {e}")
@@ -0,0 +1,376 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from genai_kit.aws.amazon_image import NovaImageSize, TitanImageSize
+from genai_kit.aws.bedrock import BedrockModel
+from genai_kit.aws.sd_image import SDImageSize
+from genai_kit.utils.images import base64_to_raw_bytes
+from genai_kit.utils.sqlite import ThreadLocalSQLite
+from genai_kit.utils.uuid import generate_uuid
+from services.bedrock_service import edit_image, gen_image, gen_video, get_video_job, is_sd_model
+from services.storage_service import StorageService
+from services.video_poller import get_video_poller
+from constants import EditingMode, MediaType
+from config import config
+
+
+# job 하나의 이미지들을 S3 / DynamoDB에 동시에 저장 (worker 간 공유)
+_upload_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="job-upload")
+
+
+class JobKind(str, Enum):
+    GEN_IMAGE = 'gen_image'
+    EDIT_IMAGE = 'edit_image'
+    GEN_VIDEO = 'gen_video'
+
+
+class JobStatus(str, Enum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    checkpoint TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created_at ON jobs (status, created_at);
+"""
+
+
+class JobQueue:
+    '''
+    SQLite 파일에 저장되는 생성 job queue와 worker pool.
+
+    component는 submit()으로 job을 넣고 바로 반환하며, worker가 gen_image / edit_image / gen_video를
+    실행한 뒤 결과를 StorageService로 저장합니다. UI는 get_jobs()로 상태를 polling 합니다.
+    프로세스가 재시작되면 실행 중이던 job은 다시 queued로 돌아가 max_attempts까지 재실행되며,
+    레코드 id는 job id에서 만들어지므로 재실행해도 같은 레코드를 덮어씁니다.
+    외부에 작업을 시작하는 handler (gen_video)는 JobCheckpoint에 저장한 상태로 재실행 시 이어서 진행합니다.
+    '''
+
+    def __init__(self,
+                 path: str,
+                 storage_service: StorageService,
+                 workers: int = 4,
+                 max_attempts: int = 3,
+                 poll_interval: float = 1.0):
+        self.path = path
+        self.storage_service = storage_service
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+
+        self._db = ThreadLocalSQLite(path)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db.conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def start(self):
+        if any(thread.is_alive() for thread in self._threads):
+            return
+        self._requeue_interrupted()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def submit(self, kind: JobKind, params: Dict[str, Any]) -> str:
+        job_id = generate_uuid()
+        now = time.time()
+        self._db.conn.execute(
+            'INSERT INTO jobs (id, kind, status, params, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
+            (job_id, JobKind(kind).value, JobStatus.QUEUED.value, json.dumps(params), now, now),
+        )
+        self._wake.set()
+        return job_id
+
+    def get_jobs(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        if not job_ids:
+            return []
+        placeholders = ','.join('?' * len(job_ids))
+        rows = self._db.conn.execute(
+            f'SELECT id, kind, status, result, error, attempts, created_at, updated_at '
+            f'FROM jobs WHERE id IN ({placeholders}) ORDER BY created_at DESC',
+            list(job_ids),
+        ).fetchall()
+        return [_to_job(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        rows = self._db.conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        counts = {status.value: 0 for status in JobStatus}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def run_once(self) -> bool:
+        job = self._claim()
+        if job is None:
+            return False
+
+        try:
+            handler = HANDLERS[JobKind(job['kind'])]
+            checkpoint = JobCheckpoint(self, job['id'], json.loads(job['checkpoint'] or '{}'))
+            result = handler(self.storage_service, job['id'], json.loads(job['params']), checkpoint)
+            self._finish(job['id'], JobStatus.DONE, result=result)
+        except Exception as e:
+            print(f"Job {job['id']} ({job['kind']}) failed: {e}")
+            self._finish(job['id'], JobStatus.FAILED, error=str(e))
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception as e:
+                print(f"Job worker error: {e}")
+            # 다른 프로세스가 넣은 job도 poll_interval마다 확인
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                'SELECT id, kind, params, checkpoint FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1',
+                (JobStatus.QUEUED.value,),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    'UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?',
+                    (JobStatus.RUNNING.value, time.time(), row['id']),
+                )
+        return row
+
+    def _finish(self, job_id: str, status: JobStatus, result: Any = None, error: Optional[str] = None):
+        self._db.conn.execute(
+            'UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?',
+            (status.value, json.dumps(result, default=str) if result is not None else None,
+             error, time.time(), job_id),
+        )
+
+    def _save_checkpoint(self, job_id: str, data: Dict[str, Any]):
+        self._db.conn.execute(
+            'UPDATE jobs SET checkpoint = ?, updated_at = ? WHERE id = ?',
+            (json.dumps(data, default=str), time.time(), job_id),
+        )
+
+    def _migrate(self):
+        # checkpoint column이 없던 이전 버전의 jobs table
+        columns = {row['name'] for row in self._db.conn.execute('PRAGMA table_info(jobs)')}
+        if 'checkpoint' not in columns:
+            self._db.conn.execute('ALTER TABLE jobs ADD COLUMN checkpoint TEXT')
+
+    def _requeue_interrupted(self):
+        # 이전 프로세스가 실행하다 멈춘 job
+        now = time.time()
+        self._db.conn.execute(
+            'UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE status = ? AND attempts >= ?',
+            (JobStatus.FAILED.value, 'Interrupted too many times', now,
+             JobStatus.RUNNING.value, self.max_attempts),
+        )
+        self._db.conn.execute(
+            'UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?',
+            (JobStatus.QUEUED.value, now, JobStatus.RUNNING.value),
+        )
+
+
+class JobCheckpoint:
+    '''
+    handler가 job row에 남기는 중간 상태. 재실행된 job은 이전 시도에서 저장한 값을 그대로 받습니다.
+    '''
+
+    def __init__(self, queue: JobQueue, job_id: str, data: Dict[str, Any]):
+        self._queue = queue
+        self._job_id = job_id
+        self._data = data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def save(self, **values):
+        self._data.update(values)
+        self._queue._save_checkpoint(self._job_id, self._data)
+
+
+def run_gen_image(storage_service: StorageService,
+                  job_id: str,
+                  params: Dict[str, Any],
+                  checkpoint: JobCheckpoint) -> Dict[str, Any]:
+    model_type = BedrockModel(params['model_type'])
+    imgs, configuration = gen_image(
+        model_type=model_type,
+        prompt=params['prompt'],
+        size=resolve_size(model_type, params['size']),
+        count=params.get('count', 1),
+        seed=params.get('seed', 0),
+        cfg=params.get('cfg', 8.0),
+        color_guide=params.get('color_guide', []),
+        stream=True,
+    )
+    return _store_images(storage_service, job_id, params, model_type, imgs, configuration)
+
+
+def run_edit_image(storage_service: StorageService,
+                   job_id: str,
+                   params: Dict[str, Any],
+                   checkpoint: JobCheckpoint) -> Dict[str, Any]:
+    model_type = BedrockModel(params['model_type'])
+    imgs, configuration = edit_image(
+        model_type=model_type,
+        editing_mode=EditingMode(params['editing_mode']),
+        text=params.get('prompt'),
+        mask_prompt=params.get('mask_prompt'),
+        ref_image=params.get('ref_image'),
+        size=resolve_size(model_type, params['size']),
+        count=params.get('count', 1),
+        seed=params.get('seed', 0),
+        cfg=params.get('cfg', 8.0),
+        stream=True,
+    )
+    return _store_images(storage_service, job_id, params, model_type, imgs, configuration)
+
+
+def run_gen_video(storage_service: StorageService,
+                  job_id: str,
+                  params: Dict[str, Any],
+                  checkpoint: JobCheckpoint) -> Dict[str, Any]:
+    model_type = BedrockModel(params['model_type'])
+    # 재실행된 job이 비동기 작업을 다시 시작 (그리고 다시 과금) 하지 않도록,
+    # 시작한 invocation ARN을 저장해 두고 job id를 idempotency token으로 사용
+    invocation_arn = checkpoint.get('invocation_arn')
+    if not invocation_arn:
+        invocation_arn = gen_video(
+            model_type=model_type,
+            text=params['prompt'],
+            image=params.get('image'),
+            params=params.get('configs', {}),
+            client_request_token=job_id,
+        )
+        checkpoint.save(invocation_arn=invocation_arn)
+    invocation = get_video_job(invocation_arn)
+    record = storage_service.upload_media(
+        media_type=MediaType.VIDEO,
+        prompt=params['prompt'],
+        model_type=model_type,
+        details=invocation,
+        ref_image=params.get('image'),
+    )
+    get_video_poller().track(
+        invocation_arn=invocation_arn,
+        id=record.get('id', ''),
+        status=invocation.get('status', ''),
+    )
+    return {'records': [record], 'model_type': model_type.value}
+
+
+HANDLERS: Dict[JobKind, Callable[[StorageService, str, Dict[str, Any], JobCheckpoint], Dict[str, Any]]] = {
+    JobKind.GEN_IMAGE: run_gen_image,
+    JobKind.EDIT_IMAGE: run_edit_image,
+    JobKind.GEN_VIDEO: run_gen_video,
+}
+
+
+def resolve_size(model_type: BedrockModel, name: str):
+    if is_sd_model(model_type):
+        return SDImageSize[name]
+    if model_type == BedrockModel.TITAN_IMAGE:
+        return TitanImageSize[name]
+    return NovaImageSize[name]
+
+
+def _store_images(storage_service: StorageService,
+                  job_id: str,
+                  params: Dict[str, Any],
+                  model_type: BedrockModel,
+                  imgs: Iterable[str],
+                  configuration: Dict[str, Any]) -> Dict[str, Any]:
+    result = {'model_type': model_type.value}
+    if 'fallbackModel' in configuration:
+        result['fallback_model'] = configuration['fallbackModel']
+        model_type = BedrockModel(configuration['fallbackModel'])
+
+    # imgs는 응답에서 하나씩 꺼내는 iterator: 꺼내는 대로 업로드 / 기록을 시작하고 결과는 index 순서로 모음
+    futures = [
+        _upload_executor.submit(
+            _store_image, storage_service, job_id, index, params, model_type, img, configuration
+        )
+        for index, img in enumerate(imgs)
+    ]
+    result['records'] = [future.result() for future in futures]
+    return result
+
+
+def _store_image(storage_service: StorageService,
+                 job_id: str,
+                 index: int,
+                 params: Dict[str, Any],
+                 model_type: BedrockModel,
+                 img: str,
+                 configuration: Dict[str, Any]) -> Dict[str, Any]:
+    return storage_service.upload_media(
+        media_type=MediaType.IMAGE,
+        model_type=model_type,
+        prompt=params.get('prompt'),
+        details=configuration,
+        media_file=base64_to_raw_bytes(img),
+        ref_image=params.get('ref_image'),
+        id=_record_id(job_id, index),
+    )
+
+
+def _record_id(job_id: str, index: int) -> str:
+    # 재실행된 job도 같은 레코드를 덮어쓰도록 결정적인 id 사용
+    return hashlib.sha256(f"{job_id}:{index}".encode('utf-8')).hexdigest()[:16]
+
+
+def _to_job(row: sqlite3.Row) -> Dict[str, Any]:
+    job = dict(row)
+    job['result'] = json.loads(job['result']) if job['result'] else None
+    return job
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue(
+                path=config.JOB_QUEUE_PATH,
+                storage_service=StorageService(
+                    bucket_name=config.S3_BUCKET,
+                    cloudfront_domain=config.CF_DOMAIN
+                ),
+                workers=config.JOB_WORKERS,
+            )
+            _queue.start()
+    return _queue
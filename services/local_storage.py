@@ -0,0 +1,219 @@
+import json
+import os
+import uuid
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from genai_kit.utils.converter import from_dynamodb
+from genai_kit.utils.http_server import BackgroundServer
+from genai_kit.utils.sqlite import ThreadLocalSQLite
+from services.purge import PurgeProgress
+from services.storage_backend import SUMMARY_ATTRIBUTES, SUMMARY_DETAIL_ATTRIBUTES, StorageBackend
+
+
+DATABASE_FILE = "media.sqlite3"
+FILES_DIR = "files"
+# SQLite host parameter 수 제한 (SQLITE_MAX_VARIABLE_NUMBER) 이하로 IN 조회
+BATCH_GET_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media (
+    id TEXT PRIMARY KEY,
+    media_type TEXT,
+    created_at TEXT,
+    status TEXT,
+    summary TEXT NOT NULL,
+    item TEXT NOT NULL
+);
+-- DynamoDB GSI처럼 media_type이 있는 항목만 색인 (sync watermark 등은 제외)
+CREATE INDEX IF NOT EXISTS media_type_created_at
+    ON media (media_type, created_at DESC, id DESC) WHERE media_type IS NOT NULL;
+"""
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    SQLite 파일 + local filesystem 저장소 (AWS 없이 단일 서버에서 실행할 때).
+
+    레코드는 JSON으로 저장하고, 목록 조회용 summary와 media_type / created_at / details.status를
+    별도 column으로 함께 기록해 (media_type, created_at) index로 바로 페이지를 읽습니다.
+    미디어 파일은 <path>/files/<key>에 저장하며 start_media_server()가 media_url로 제공합니다.
+    """
+
+    def __init__(self, path: str, media_url: str):
+        self.path = path
+        self.files_dir = os.path.join(path, FILES_DIR)
+        self.media_url = media_url.rstrip('/')
+        self._db = ThreadLocalSQLite(os.path.join(path, DATABASE_FILE))
+
+        os.makedirs(self.files_dir, exist_ok=True)
+        self._db.conn.executescript(_SCHEMA)
+
+    def get_item(self, id: str) -> Optional[Dict[str, Any]]:
+        row = self._db.conn.execute('SELECT item FROM media WHERE id = ?', (id,)).fetchone()
+        return json.loads(row['item']) if row else None
+
+    def upsert_item(self, id: str, updates: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        # 읽기 -> 병합 -> 쓰기를 하나의 write transaction으로 처리 (다른 thread / 프로세스와 경합 없음)
+        with self._db.transaction() as conn:
+            row = conn.execute('SELECT item FROM media WHERE id = ?', (id,)).fetchone()
+            item = json.loads(row['item']) if row else {'id': id}
+            for key, value in (defaults or {}).items():
+                if key not in updates and key not in item:
+                    item[key] = from_dynamodb(value)
+            item.update(from_dynamodb(updates))
+
+            details = item.get('details') if isinstance(item.get('details'), dict) else {}
+            conn.execute(
+                'INSERT OR REPLACE INTO media (id, media_type, created_at, status, summary, item) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (id, item.get('media_type'), item.get('created_at'), details.get('status'),
+                 json.dumps(_summary(item)), json.dumps(item)),
+            )
+            return item
+
+    def batch_get_items(self, ids: List[str], attributes: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        items = []
+        unique_ids = list(dict.fromkeys(ids))
+        for i in range(0, len(unique_ids), BATCH_GET_SIZE):
+            chunk = unique_ids[i:i + BATCH_GET_SIZE]
+            rows = self._db.conn.execute(
+                f"SELECT item FROM media WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            items.extend(json.loads(row['item']) for row in rows)
+
+        if attributes:
+            paths = [attribute.split('.') for attribute in attributes]
+            items = [_project(item, paths) for item in items]
+        return items
+
+    def query_media_page(self,
+                         media_type: str,
+                         limit: int,
+                         start_key: Optional[Dict[str, Any]] = None,
+                         summary: bool = False) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        column = 'summary' if summary else 'item'
+        sql = f'SELECT {column} FROM media WHERE media_type = ?'
+        params = [media_type]
+        if start_key:
+            sql += ' AND (created_at, id) < (?, ?)'
+            params += [start_key['created_at'], start_key['id']]
+        sql += ' ORDER BY created_at DESC, id DESC LIMIT ?'
+        params.append(limit)
+
+        items = [json.loads(row[column]) for row in self._db.conn.execute(sql, params).fetchall()]
+        if len(items) < limit:
+            return items, None
+        last = items[-1]
+        return items, {'id': last['id'], 'media_type': last['media_type'], 'created_at': last['created_at']}
+
+    def query_media(self, media_type: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql = 'SELECT item FROM media WHERE media_type = ?'
+        params = [media_type]
+        if status is not None:
+            sql += ' AND status = ?'
+            params.append(status)
+        sql += ' ORDER BY created_at DESC, id DESC'
+        return [json.loads(row['item']) for row in self._db.conn.execute(sql, params).fetchall()]
+
+    def put_object(self, key: str, buffer: memoryview, content_type: str, cache_control: Optional[str] = None):
+        # 임시 파일에 쓴 뒤 rename 해서 읽는 쪽이 쓰다 만 파일을 보지 않도록 함
+        path = self._file_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(buffer)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def object_exists(self, key: str) -> bool:
+        return os.path.isfile(self._file_path(key))
+
+    def url(self, key: str) -> str:
+        return f"{self.media_url}/{key}"
+
+    def purge(self, prefixes: Optional[List[str]] = None, progress: Optional[PurgeProgress] = None):
+        progress = progress or PurgeProgress()
+        try:
+            deleted = self._db.conn.execute('DELETE FROM media').rowcount
+            progress.add('items_deleted', deleted)
+
+            roots = [self._file_path(prefix) for prefix in prefixes] if prefixes else [self.files_dir]
+            for root in roots:
+                for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+                    progress.add('objects_listed', len(filenames))
+                    for filename in filenames:
+                        try:
+                            os.remove(os.path.join(dirpath, filename))
+                            progress.add('objects_deleted')
+                        except OSError as e:
+                            print(f"Failed to delete {filename}: {e}")
+                            progress.add('errors')
+                    if dirpath != self.files_dir and not os.listdir(dirpath):
+                        os.rmdir(dirpath)
+        finally:
+            progress.finish()
+
+    def _file_path(self, key: str) -> str:
+        path = os.path.normpath(os.path.join(self.files_dir, key))
+        if os.path.commonpath([path, self.files_dir]) != os.path.normpath(self.files_dir):
+            raise ValueError(f"Invalid object key: {key}")
+        return path
+
+
+def _summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {attr: item[attr] for attr in SUMMARY_ATTRIBUTES if attr in item}
+    details = item.get('details')
+    if isinstance(details, dict):
+        summary['details'] = {attr: details[attr] for attr in SUMMARY_DETAIL_ATTRIBUTES if attr in details}
+    return summary
+
+
+def _project(item: Dict[str, Any], paths: List[List[str]]) -> Dict[str, Any]:
+    # ProjectionExpression처럼 없는 속성은 결과에서 빠짐
+    projected = {}
+    for path in paths:
+        value = item
+        for part in path:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = projected
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+            target[path[-1]] = value
+    return projected
+
+
+_server = BackgroundServer('media-server')
+
+
+def start_media_server(path: str, port: int, addr: str = '0.0.0.0') -> Optional[ThreadingHTTPServer]:
+    '''
+    LocalStorageBackend의 미디어 파일 (<path>/files)을 제공하는 static file server를
+    daemon thread로 띄웁니다 (프로세스당 1개). CloudFront 대신 이 주소를 media_url로 사용합니다.
+    '''
+    directory = os.path.join(path, FILES_DIR)
+    os.makedirs(directory, exist_ok=True)
+    return _server.start(addr, port, partial(_MediaHandler, directory=directory))
+
+
+class _MediaHandler(SimpleHTTPRequestHandler):
+    def end_headers(self):
+        # blob/은 내용이 바뀌지 않는 digest key이므로 브라우저 캐시를 길게 유지
+        if self.path.startswith('/blob/'):
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        else:
+            self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
+    def list_directory(self, path):
+        self.send_error(404)
+        return None
+
+    def log_message(self, format, *args):
+        pass
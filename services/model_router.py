@@ -0,0 +1,61 @@
+import json
+import time
+from typing import Callable, List, Optional, Tuple, TypeVar
+from genai_kit.aws.bedrock import BedrockModel
+from genai_kit.aws.circuit_breaker import CircuitOpenError, is_model_failure
+from config import config
+
+
+T = TypeVar("T")
+
+# 요청 형식이 호환되는 모델끼리만 연결
+FALLBACK_MODELS = {
+    BedrockModel.NOVA_CANVAS: BedrockModel.TITAN_IMAGE,     # ImageParams body 공유
+    BedrockModel.SONNET_3_5_CR: BedrockModel.HAIKU_3_5_CR,  # 프롬프트 재작성
+}
+
+
+def get_fallback_model(model_type: BedrockModel) -> Optional[BedrockModel]:
+    if not config.MODEL_FALLBACK_ENABLED:
+        return None
+    return FALLBACK_MODELS.get(model_type)
+
+
+def get_candidate_models(model_type: BedrockModel) -> List[BedrockModel]:
+    fallback = get_fallback_model(model_type)
+    return [model_type, fallback] if fallback else [model_type]
+
+
+def should_fallback(e: Exception) -> bool:
+    # 모델 가용성 문제 (breaker OPEN, throttling, quota, 5xx 등)만 fallback 대상이며 요청 오류는 제외
+    return isinstance(e, CircuitOpenError) or is_model_failure(e)
+
+
+def invoke_with_fallback(model_type: BedrockModel,
+                         invoke: Callable[[BedrockModel], T],
+                         compatible: Optional[Callable[[BedrockModel], bool]] = None) -> Tuple[T, BedrockModel]:
+    """
+    invoke(model_type)을 호출하고, breaker가 열려 있거나 모델 장애(throttling, 5xx, timeout)로 실패하면
+    fallback 모델로 한 번 다시 호출합니다. 요청 오류나 compatible(fallback)이 False인 경우는 그대로 raise합니다.
+    반환: (결과, 실제 사용한 모델)
+    """
+    try:
+        return invoke(model_type), model_type
+    except Exception as e:
+        fallback = get_fallback_model(model_type)
+        if fallback is None or not should_fallback(e):
+            raise
+        if compatible is not None and not compatible(fallback):
+            raise
+        log_fallback(model_type, fallback, reason=type(e).__name__)
+        return invoke(fallback), fallback
+
+
+def log_fallback(model_type: BedrockModel, fallback: BedrockModel, reason: str):
+    print(json.dumps({
+        'metric': 'model_router.fallback',
+        'model_id': model_type.value,
+        'fallback_model_id': fallback.value,
+        'reason': reason,
+        'timestamp': time.time(),
+    }))
@@ -0,0 +1,258 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from genai_kit.utils.images import base64_to_raw_bytes
+from genai_kit.utils.random import random_id
+from services.bedrock_service import edit_image, gen_english, gen_image, gen_mm_image_prompt
+from services.storage_service import StorageService
+from constants import IMAGE_PREFIX
+
+
+_DONE = object()
+PREPARE_STAGE = "prepare"
+
+
+class Stage:
+    '''
+    fn(item)의 반환값을 다음 stage로 넘깁니다. fan_out이면 반환된 list (또는 generator)의 항목을 하나씩 넘깁니다.
+    '''
+
+    def __init__(self, name: str, fn: Callable[[Any], Any], workers: int = 1, fan_out: bool = False):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.fan_out = fan_out
+
+
+class Pipeline:
+    """
+    stage 사이를 bounded queue로 연결하고 stage마다 별도 worker thread를 두어
+    서로 다른 stage의 작업이 겹쳐서 실행되도록 합니다.
+    queue가 가득 차면 앞 stage가 대기하므로 (backpressure) 메모리 사용량이 queue_size로 제한됩니다.
+
+    run()은 마지막 stage의 결과를 완료 순서대로 {'value', 'error', 'stage'} dict로 반환하고,
+    실패한 항목은 실패한 stage 이후를 건너뛰고 error와 함께 반환됩니다.
+    run(items, prepare=fn)이면 feed thread가 항목마다 fn을 적용하고, 변환에 실패한 항목은
+    stage PREPARE_STAGE의 오류로 반환한 뒤 다음 항목을 계속 넣습니다.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 16):
+        self.stages = stages
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self._output: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._remaining = [stage.workers for stage in stages]
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._stats = {
+            stage.name: {'processed': 0, 'failed': 0, 'busy': 0.0, 'max_queue_depth': 0}
+            for stage in stages
+        }
+
+    def run(self, items: Iterable[Any], prepare: Optional[Callable[[Any], Any]] = None) -> Iterator[Dict[str, Any]]:
+        self._started_at = time.perf_counter()
+        threads = [threading.Thread(target=self._feed, args=(items, prepare), name="pipeline-feed", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work, args=(index,), name=f"pipeline-{stage.name}-{n}", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                result = self._output.get()
+                if result is _DONE:
+                    break
+                yield result
+        finally:
+            # consumer가 중간에 멈추면 남은 항목은 처리하지 않고 흘려보냄
+            self._cancelled.set()
+            for thread in threads:
+                thread.join()
+            self._finished_at = time.perf_counter()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+
+        with self._lock:
+            stats = {}
+            for index, stage in enumerate(self.stages):
+                stage_stats = dict(self._stats[stage.name])
+                stage_stats.update({
+                    'workers': stage.workers,
+                    'queue_depth': self.queues[index].qsize(),
+                    'utilization': stage_stats['busy'] / (stage.workers * elapsed) if elapsed else 0.0,
+                })
+                stats[stage.name] = stage_stats
+            return stats
+
+    def _put(self, index: int, item: Any):
+        self.queues[index].put(item)
+        depth = self.queues[index].qsize()
+        with self._lock:
+            stage_stats = self._stats[self.stages[index].name]
+            stage_stats['max_queue_depth'] = max(stage_stats['max_queue_depth'], depth)
+
+    def _feed(self, items: Iterable[Any], prepare: Optional[Callable[[Any], Any]] = None):
+        try:
+            for item in items:
+                if self._cancelled.is_set():
+                    break
+                if prepare is not None:
+                    # 한 항목의 변환 오류가 나머지 항목의 feed를 멈추지 않도록 항목 단위로 처리
+                    try:
+                        item = prepare(item)
+                    except Exception as e:
+                        self._output.put({'value': item, 'error': e, 'stage': PREPARE_STAGE})
+                        continue
+                self._put(0, item)
+        finally:
+            for _ in range(self.stages[0].workers):
+                self.queues[0].put(_DONE)
+
+    def _work(self, index: int):
+        stage = self.stages[index]
+        is_last = index == len(self.stages) - 1
+
+        while True:
+            item = self.queues[index].get()
+            if item is _DONE:
+                self._finish_worker(index)
+                return
+            if self._cancelled.is_set():
+                continue
+
+            start = time.perf_counter()
+            error, blocked = None, 0.0
+            try:
+                # fan_out stage가 generator를 반환하면 항목을 만드는 도중의 오류도 이 item의 실패로 처리
+                # (이미 넘긴 항목은 다음 stage에서 계속 진행됨)
+                output = stage.fn(item)
+                for value in (output if stage.fan_out else [output]):
+                    put_start = time.perf_counter()
+                    if is_last:
+                        self._output.put({'value': value, 'error': None, 'stage': stage.name})
+                    else:
+                        self._put(index + 1, value)
+                    blocked += time.perf_counter() - put_start
+            except Exception as e:
+                error = e
+            # 다음 stage queue가 가득 차서 기다린 시간은 utilization에서 제외
+            busy = time.perf_counter() - start - blocked
+
+            with self._lock:
+                stage_stats = self._stats[stage.name]
+                stage_stats['busy'] += busy
+                stage_stats['failed' if error else 'processed'] += 1
+
+            if error is not None:
+                self._output.put({'value': item, 'error': error, 'stage': stage.name})
+
+    def _finish_worker(self, index: int):
+        # stage의 마지막 worker가 끝나면 다음 stage worker 수만큼 종료 신호 전달
+        with self._lock:
+            self._remaining[index] -= 1
+            last = self._remaining[index] == 0
+        if not last:
+            return
+        if index + 1 < len(self.stages):
+            for _ in range(self.stages[index + 1].workers):
+                self.queues[index + 1].put(_DONE)
+        else:
+            self._output.put(_DONE)
+
+
+def build_image_pipeline(storage_service: StorageService,
+                         rewrite_workers: int = 2,
+                         generate_workers: int = 4,
+                         upload_workers: int = 8,
+                         record_workers: int = 4,
+                         queue_size: int = 16) -> Pipeline:
+    """
+    rewrite → generate → upload (S3) → record (DynamoDB) 이미지 생성 pipeline.
+
+    입력 item은 dict이며 prompt, model_type, size는 필수입니다.
+    rewrite가 True이면 ref_image가 있을 때 gen_mm_image_prompt, 없으면 gen_english로 프롬프트를 재작성하고,
+    editing_mode가 있으면 edit_image, 없으면 gen_image로 생성합니다.
+    생성된 이미지마다 하나의 item으로 나뉘며 (image_index 포함, image_count는 마지막 이미지에만 있고 나머지는 None),
+    record_id(item, index)가 있으면 그 값을 레코드 id로 사용합니다.
+    """
+    def rewrite(item: Dict[str, Any]) -> Dict[str, Any]:
+        if not item.get('rewrite'):
+            return item
+        if item.get('ref_image') and not item.get('editing_mode'):
+            prompt = gen_mm_image_prompt(keyword=item['prompt'], image=item['ref_image'])
+        else:
+            prompt = gen_english(item['prompt'])
+        return {**item, 'prompt': prompt}
+
+    def generate(item: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        # 응답에서 이미지를 하나씩 꺼내 바로 upload stage로 넘김.
+        # image_count는 응답을 끝까지 읽어야 알 수 있으므로 이미지 하나를 늦게 넘기고 마지막에 채움
+        if item.get('editing_mode'):
+            images, details = edit_image(
+                model_type=item['model_type'],
+                editing_mode=item['editing_mode'],
+                size=item['size'],
+                text=item['prompt'],
+                negative_text=item.get('negative_text'),
+                mask_prompt=item.get('mask_prompt'),
+                ref_image=item.get('ref_image'),
+                count=item.get('count', 1),
+                seed=item.get('seed', 0),
+                cfg=item.get('cfg', 8.0),
+                stream=True,
+            )
+        else:
+            images, details = gen_image(
+                model_type=item['model_type'],
+                prompt=item['prompt'],
+                size=item['size'],
+                count=item.get('count', 1),
+                seed=item.get('seed', 0),
+                cfg=item.get('cfg', 8.0),
+                color_guide=item.get('color_guide', []),
+                stream=True,
+            )
+
+        used_model = details.get('fallbackModel', item['model_type'].value)
+        previous = None
+        for index, image in enumerate(images):
+            if previous is not None:
+                yield previous
+            previous = {**item, 'image': image, 'image_index': index, 'image_count': None,
+                        'details': details, 'used_model': used_model}
+        if previous is None:
+            raise Exception("No images returned")
+        yield {**previous, 'image_count': previous['image_index'] + 1}
+
+    def upload(item: Dict[str, Any]) -> Dict[str, Any]:
+        record_id = item['record_id'](item, item['image_index']) if item.get('record_id') else None
+        image_id = record_id or random_id()
+        url = storage_service.upload_object(base64_to_raw_bytes(item['image']), f"{IMAGE_PREFIX}/{image_id}")
+        # 업로드가 끝난 base64 이미지는 다음 stage로 넘기지 않음
+        return {**item, 'image': None, 'id': image_id, 'url': url}
+
+    def record(item: Dict[str, Any]) -> Dict[str, Any]:
+        storage_service.upload_image(
+            model_type=item['used_model'],
+            prompt=item['prompt'],
+            details=item['details'],
+            ref_image=item.get('ref_image'),
+            id=item['id'],
+            url=item['url'],
+        )
+        return item
+
+    return Pipeline([
+        Stage("rewrite", rewrite, workers=rewrite_workers),
+        Stage("generate", generate, workers=generate_workers, fan_out=True),
+        Stage("upload", upload, workers=upload_workers),
+        Stage("record", record, workers=record_workers),
+    ], queue_size=queue_size)
@@ -0,0 +1,158 @@
+import json
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from genai_kit.aws.dynamodb import DynamoDB
+
+
+# delete_objects 요청당 최대 key 수
+S3_DELETE_BATCH = 1000
+# key의 첫 글자 (random_id / invocation id / sha256 hex)로 prefix를 나누어 병렬로 list
+SHARD_CHARS = string.ascii_letters + string.digits
+
+
+class PurgeProgress:
+    '''
+    purge 진행 상황을 worker thread들이 함께 갱신하는 thread-safe 카운터.
+    UI thread는 snapshot()을 polling 해서 표시합니다.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {'items_deleted': 0, 'objects_listed': 0, 'objects_deleted': 0, 'errors': 0}
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    def add(self, name: str, count: int = 1):
+        with self._lock:
+            self._counts[name] += count
+
+    def finish(self):
+        self.finished_at = time.perf_counter()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        counts['elapsed'] = elapsed
+        counts['items_per_sec'] = counts['items_deleted'] / elapsed if elapsed else 0.0
+        counts['objects_per_sec'] = counts['objects_deleted'] / elapsed if elapsed else 0.0
+        return counts
+
+
+def purge_all(dynamodb: DynamoDB,
+              s3_client,
+              bucket_name: str,
+              prefixes: Optional[Iterable[str]] = None,
+              segments: int = 8,
+              workers: int = 8,
+              progress: Optional[PurgeProgress] = None) -> PurgeProgress:
+    '''
+    DynamoDB 테이블과 S3 bucket (prefixes를 지정하면 해당 prefix만)을 동시에 비웁니다.
+    '''
+    progress = progress or PurgeProgress()
+    try:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="purge") as executor:
+            table = executor.submit(purge_table, dynamodb, segments, progress)
+            bucket = executor.submit(purge_bucket, s3_client, bucket_name, prefixes, workers, progress)
+            table.result()
+            bucket.result()
+    finally:
+        progress.finish()
+    return progress
+
+
+def purge_table(dynamodb: DynamoDB, segments: int = 8, progress: Optional[PurgeProgress] = None) -> int:
+    progress = progress or PurgeProgress()
+    return dynamodb.delete_all_items(
+        segments=segments,
+        on_deleted=lambda count: progress.add('items_deleted', count),
+    )
+
+
+def purge_bucket(s3_client,
+                 bucket_name: str,
+                 prefixes: Optional[Iterable[str]] = None,
+                 workers: int = 8,
+                 progress: Optional[PurgeProgress] = None) -> int:
+    '''
+    prefix를 key 첫 글자 단위로 나누어 병렬로 list 하고, 1000개씩 delete_objects를 동시에 요청합니다.
+    나눈 prefix에 걸리지 않은 key는 마지막에 원래 prefix를 한 번 더 list 해서 지웁니다.
+    '''
+    progress = progress or PurgeProgress()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-purge-delete") as deleter, \
+         ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-purge-list") as lister:
+        pending = []
+        pending_lock = threading.Lock()
+
+        def submit(keys: List[str]):
+            progress.add('objects_listed', len(keys))
+            future = deleter.submit(_delete_objects, s3_client, bucket_name, keys, progress)
+            with pending_lock:
+                pending.append(future)
+
+        def list_prefix(prefix: str):
+            paginator = s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+                keys = [obj['Key'] for obj in page.get('Contents', [])]
+                if keys:
+                    submit(keys)
+
+        if prefixes:
+            prefixes = list(prefixes)
+        else:
+            prefixes, root_keys = _top_level(s3_client, bucket_name)
+            for i in range(0, len(root_keys), S3_DELETE_BATCH):
+                submit(root_keys[i:i + S3_DELETE_BATCH])
+
+        shards = [prefix + char for prefix in prefixes for char in SHARD_CHARS]
+        list(lister.map(list_prefix, shards))
+        with pending_lock:
+            futures = list(pending)
+        for future in futures:
+            future.result()
+        list(lister.map(list_prefix, prefixes))
+
+        with pending_lock:
+            futures = list(pending)
+        return sum(future.result() for future in futures)
+
+
+def _top_level(s3_client, bucket_name: str) -> Tuple[List[str], List[str]]:
+    prefixes, keys = [], []
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket_name, Delimiter='/'):
+        prefixes.extend(common['Prefix'] for common in page.get('CommonPrefixes', []))
+        keys.extend(obj['Key'] for obj in page.get('Contents', []))
+    return prefixes, keys
+
+
+def _delete_objects(s3_client, bucket_name: str, keys: List[str], progress: PurgeProgress) -> int:
+    response = s3_client.delete_objects(
+        Bucket=bucket_name,
+        Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True},
+    )
+    errors = response.get('Errors', [])
+    if errors:
+        _log_delete_errors(bucket_name, errors)
+    progress.add('errors', len(errors))
+    progress.add('objects_deleted', len(keys) - len(errors))
+    return len(keys) - len(errors)
+
+
+def _log_delete_errors(bucket_name: str, errors: List[Dict[str, Any]]):
+    # key마다 출력하지 않고 delete_objects 요청당 한 줄의 metric 로그로 남김 (개수는 PurgeProgress의 errors)
+    codes: Dict[str, int] = {}
+    for error in errors:
+        code = error.get('Code', 'Unknown')
+        codes[code] = codes.get(code, 0) + 1
+    print(json.dumps({
+        'metric': 'purge.delete_errors',
+        'bucket': bucket_name,
+        'count': len(errors),
+        'codes': codes,
+        'sample_keys': [error.get('Key') for error in errors[:5]],
+        'timestamp': time.time(),
+    }))
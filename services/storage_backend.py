@@ -0,0 +1,239 @@
+import io
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from genai_kit.aws.client import get_client
+from genai_kit.aws.dynamodb import DynamoDB
+from services.purge import PurgeProgress, purge_all
+from constants import MEDIA_TYPE_INDEX
+
+
+# 목록 조회(summary)에서 읽는 속성: ref_image / details 전체는 get_media_details()로 필요할 때만 조회
+SUMMARY_ATTRIBUTES = ('id', 'media_type', 'model_type', 'prompt', 'url', 'created_at', 'updated_at')
+SUMMARY_DETAIL_ATTRIBUTES = ('taskType', 'status')
+
+# 생성 이미지는 대부분 threshold 미만이라 PutObject 한 번으로 업로드되고,
+# 큰 파일 (4096px PNG 등)만 multipart로 나누어 병렬 업로드
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+
+class StorageBackend(ABC):
+    """
+    StorageService가 사용하는 레코드 / 미디어 저장소 인터페이스.
+
+    레코드는 id를 key로 하는 dict이며, media_type이 있는 레코드만 media_type + created_at
+    (최신순) 조회 대상입니다. 페이지 key는 {'id', 'media_type', 'created_at'} 형태입니다.
+    미디어는 key (예: "image/<id>.png")로 저장하고 url(key)로 화면에 표시할 주소를 만듭니다.
+    """
+
+    @abstractmethod
+    def get_item(self, id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def upsert_item(self, id: str, updates: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        '''
+        항목을 원자적으로 생성하거나 갱신하고 전체 항목을 반환합니다.
+        defaults의 값은 해당 속성이 없을 때만 기록됩니다.
+        '''
+        ...
+
+    @abstractmethod
+    def batch_get_items(self, ids: List[str], attributes: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        '''
+        attributes: 읽을 속성 경로 (예: 'details.status'). 없으면 전체 항목
+        '''
+        ...
+
+    @abstractmethod
+    def query_media_page(self,
+                         media_type: str,
+                         limit: int,
+                         start_key: Optional[Dict[str, Any]] = None,
+                         summary: bool = False) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        '''
+        media_type의 항목을 최신순으로 최대 limit개 반환합니다.
+        summary이면 SUMMARY_ATTRIBUTES와 details의 SUMMARY_DETAIL_ATTRIBUTES만 읽습니다.
+
+        Returns:
+            (items, next_key): 더 읽을 항목이 없으면 next_key는 None
+        '''
+        ...
+
+    @abstractmethod
+    def query_media(self, media_type: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        '''
+        media_type의 모든 항목을 최신순으로 반환합니다. status를 지정하면 details.status가 같은 항목만 반환합니다.
+        '''
+        ...
+
+    @abstractmethod
+    def put_object(self, key: str, buffer: memoryview, content_type: str, cache_control: Optional[str] = None):
+        ...
+
+    @abstractmethod
+    def object_exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        ...
+
+    @abstractmethod
+    def purge(self, prefixes: Optional[List[str]] = None, progress: Optional[PurgeProgress] = None):
+        '''
+        모든 레코드와 미디어 (prefixes를 지정하면 해당 prefix의 미디어만)를 삭제합니다.
+        '''
+        ...
+
+
+class AwsStorageBackend(StorageBackend):
+    """
+    DynamoDB 테이블 (media_type-created_at GSI) + S3 bucket + CloudFront.
+    """
+
+    def __init__(self, table_name: str, bucket_name: str, cloudfront_domain: str):
+        self.s3_client = get_client('s3')
+        self.dynamodb = DynamoDB(table_name=table_name)
+        self.bucket_name = bucket_name
+        self.cloudfront_domain = cloudfront_domain
+
+    def get_item(self, id: str) -> Optional[Dict[str, Any]]:
+        return self.dynamodb.get_item(id)
+
+    def upsert_item(self, id: str, updates: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.dynamodb.upsert_item(id, updates=updates, defaults=defaults)
+
+    def batch_get_items(self, ids: List[str], attributes: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        if not attributes:
+            return self.dynamodb.batch_get_items(ids)
+        projection, names = _projection(attributes)
+        return self.dynamodb.batch_get_items(ids, projection=projection, expression_attribute_names=names)
+
+    def query_media_page(self,
+                         media_type: str,
+                         limit: int,
+                         start_key: Optional[Dict[str, Any]] = None,
+                         summary: bool = False) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        response = self.dynamodb.query_items(
+            self._media_type_query(media_type, summary=summary),
+            limit=limit,
+            start_key=start_key,
+        )
+        return response.get('Items', []), response.get('LastEvaluatedKey')
+
+    def query_media(self, media_type: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        query = self._media_type_query(media_type)
+        if status is not None:
+            query['FilterExpression'] = '#details.#status = :status_val'
+            query['ExpressionAttributeNames'].update({'#details': 'details', '#status': 'status'})
+            query['ExpressionAttributeValues'][':status_val'] = status
+        return self.dynamodb.query_all_items(query)
+
+    def put_object(self, key: str, buffer: memoryview, content_type: str, cache_control: Optional[str] = None):
+        body = _BufferReader(buffer)
+        extra_args = {'ContentType': content_type}
+        if cache_control:
+            extra_args['CacheControl'] = cache_control
+
+        if buffer.nbytes < MULTIPART_THRESHOLD:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=body,
+                ContentLength=buffer.nbytes,
+                **extra_args,
+            )
+        else:
+            self.s3_client.upload_fileobj(
+                body,
+                self.bucket_name,
+                key,
+                ExtraArgs=extra_args,
+                Config=TRANSFER_CONFIG,
+            )
+
+    def object_exists(self, key: str) -> bool:
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def url(self, key: str) -> str:
+        return f"{self.cloudfront_domain}/{key}"
+
+    def purge(self, prefixes: Optional[List[str]] = None, progress: Optional[PurgeProgress] = None):
+        purge_all(
+            self.dynamodb,
+            self.s3_client,
+            self.bucket_name,
+            prefixes=prefixes,
+            progress=progress,
+        )
+
+    def _media_type_query(self, media_type: str, summary: bool = False) -> Dict[str, Any]:
+        query = {
+            'IndexName': MEDIA_TYPE_INDEX,
+            'KeyConditionExpression': '#type = :type_val',
+            'ExpressionAttributeNames': {'#type': 'media_type'},
+            'ExpressionAttributeValues': {':type_val': media_type},
+            'ScanIndexForward': False,
+        }
+        if summary:
+            projection, names = _projection(
+                list(SUMMARY_ATTRIBUTES) + [f"details.{attr}" for attr in SUMMARY_DETAIL_ATTRIBUTES]
+            )
+            query['ProjectionExpression'] = projection
+            query['ExpressionAttributeNames'].update(names)
+        return query
+
+
+class _BufferReader(io.RawIOBase):
+    """
+    memoryview를 복사하지 않고 읽는 seekable file-like (botocore checksum 계산 후 seek(0) 지원).
+    """
+
+    def __init__(self, buffer: memoryview):
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        size = min(len(b), len(self._buffer) - self._position)
+        b[:size] = self._buffer[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._buffer)}[whence]
+        self._position = min(max(base + offset, 0), len(self._buffer))
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+def _projection(attributes: Iterable[str]) -> Tuple[str, Dict[str, str]]:
+    # 'details.status' -> ProjectionExpression "#details.#status" (예약어 회피)
+    names = {}
+    paths = []
+    for attribute in attributes:
+        parts = attribute.split('.')
+        names.update({f"#{part}": part for part in parts})
+        paths.append('.'.join(f"#{part}" for part in parts))
+    return ", ".join(paths), names
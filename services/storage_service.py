@@ -1,22 +1,43 @@
 
-import boto3
-from typing import Dict, Any, BinaryIO, List, Optional
-from datetime import datetime
+import base64
+import heapq
+import io
+import itertools
+import json
+from typing import Dict, Any, BinaryIO, List, Optional, Tuple, Union
+from datetime import datetime, timedelta
+from genai_kit.aws.amazon_video import VideoStatus
 from genai_kit.aws.bedrock import BedrockModel
-from genai_kit.aws.dynamodb import DynamoDB
 from genai_kit.utils.random import random_id
-from services.bedrock_service import list_video_job
+from services.bedrock_service import iter_video_job_pages, video_job_regions
+from services.blob_store import BLOB_PREFIX, BlobStore, forget_blobs
+from services.local_storage import LocalStorageBackend
+from services.purge import PurgeProgress
+from services.storage_backend import AwsStorageBackend, StorageBackend
 from utils import extract_key_from_uri
 from config import config
 from constants import IMAGE_PREFIX, VIDEO_OUTPUT_FILE, VIDEO_PREFIX, MediaType
 
 
+# list_async_invokes 동기화 위치를 저장하는 항목 (media_type이 없어 GSI에는 포함되지 않음)
+VIDEO_SYNC_WATERMARK_ID = "__video_sync_watermark__"
+WATERMARK_MARGIN = timedelta(seconds=1)
+
+# clear_all_items에서 미디어만 지울 때의 S3 prefix (생성 캐시 등은 유지)
+MEDIA_PREFIXES = [f"{IMAGE_PREFIX}/", f"{VIDEO_PREFIX}/", f"{BLOB_PREFIX}/"]
+
+# 디코딩된 이미지 bytes / memoryview 또는 file-like
+MediaData = Union[bytes, bytearray, memoryview, BinaryIO]
+
+
 class StorageService:
-    def __init__(self, bucket_name: str, cloudfront_domain: str):
-        self.s3_client = boto3.client('s3')
-        self.dynamodb = DynamoDB(table_name=config.DYNAMO_TABLE)
+    def __init__(self, bucket_name: str, cloudfront_domain: str, backend: Optional[StorageBackend] = None):
+        # backend를 지정하지 않으면 config.STORAGE_BACKEND에 따라 생성
+        self.backend = backend or create_storage_backend(bucket_name, cloudfront_domain)
         self.bucket_name = bucket_name
         self.cloudfront_domain = cloudfront_domain
+        # ref_image / details 안의 base64 이미지는 digest 참조로 바꿔 저장
+        self.blobs = BlobStore(self.backend)
         
     def upload_media(
         self,
@@ -24,8 +45,9 @@ class StorageService:
         model_type: BedrockModel,
         prompt: str,
         details: Optional[Dict[str, Any]] = None,
-        media_file: Optional[BinaryIO] = None,
+        media_file: Optional[MediaData] = None,
         ref_image: Optional[str] = None,
+        id: Optional[str] = None,
     ):
         if media_type == MediaType.IMAGE:
             return self.upload_image(
@@ -34,6 +56,7 @@ class StorageService:
                 details=details,
                 media_file=media_file,
                 ref_image=ref_image,
+                id=id,
             )
         elif media_type == MediaType.VIDEO:
             s3Uri = details.get("outputDataConfig", {}).get("s3OutputDataConfig", {}).get("s3Uri", "")
@@ -51,49 +74,40 @@ class StorageService:
         model_type: str,
         prompt: str,
         details: Dict[str, Any],
-        media_file: Optional[BinaryIO] = None,
+        media_file: Optional[MediaData] = None,
         ref_image: Optional[str] = None,
         id: Optional[str] = None,
+        url: Optional[str] = None,
     ) -> Dict[str, Any]:
+        # url: 이미 업로드된 이미지의 주소 (메타데이터만 기록)
         image_id = id or random_id()
         key = f"{IMAGE_PREFIX}/{image_id}"
         now = datetime.now().isoformat()
-        url = None
-
-        if media_file:
-            url = self.upload_to_s3(media_file, key)
-
-        url = url or f"{self.cloudfront_domain}/{key}"
-        record = {
-            "id": image_id,
-            "media_type": MediaType.IMAGE.value,
-            "model_type": model_type,
-            "prompt": prompt,
-            "ref_image": ref_image,
-            "url": url,
-            "updated_at": now,
-            "details": details
-        }
 
+        if media_file is not None:
+            url = self.upload_object(media_file, key)
+
+        url = url or self.backend.url(key)
         try:
-            existing_item = self.dynamodb.get_item(image_id)
-            
-            if existing_item:
-                updates = {
+            ref_image = self.blobs.externalize(ref_image, 'ref_image')
+            details = self.blobs.externalize(details)
+            record = self.backend.upsert_item(
+                image_id,
+                updates={
                     'model_type': model_type,
-                    'url': record['url'],
+                    'url': url,
                     'updated_at': now,
-                    'details': details
-                }
-                
-                self.dynamodb.update_item(image_id, updates)
-                record = self.dynamodb.get_item(image_id)
-            else:
-                record['created_at'] = now
-                self.dynamodb.put_item(record)
-
+                    'details': details,
+                },
+                defaults={
+                    'media_type': MediaType.IMAGE.value,
+                    'prompt': prompt,
+                    'ref_image': ref_image,
+                    'created_at': now,
+                },
+            )
         except Exception as e:
-            raise Exception(f"Failed to store metadata in DynamoDB: {str(e)}")
+            raise Exception(f"Failed to store metadata: {str(e)}")
 
         return record
     
@@ -109,111 +123,265 @@ class StorageService:
         key = f"{VIDEO_PREFIX}/{id}"
         now = datetime.now().isoformat()
         
-        record = {
-            "id": id,
-            "media_type": MediaType.VIDEO.value,
-            "model_type": model_type,
-            "prompt": prompt,
-            "ref_image": ref_image,
-            "url": f"{self.cloudfront_domain}/{key}/{VIDEO_OUTPUT_FILE}",
-            "updated_at": now,
-            "details": details
-        }
-
         try:
-            existing_item = self.dynamodb.get_item(id)
-            
-            if existing_item:
-                updates = {
-                    'url': record['url'],
+            ref_image = self.blobs.externalize(ref_image, 'ref_image')
+            details = self.blobs.externalize(details)
+            # 비디오 출력은 backend와 관계없이 Bedrock이 S3에 기록하므로 CloudFront 주소를 사용
+            record = self.backend.upsert_item(
+                id,
+                updates={
+                    'url': f"{self.cloudfront_domain}/{key}/{VIDEO_OUTPUT_FILE}",
                     'updated_at': now,
-                    'details': details
-                }
-                
-                self.dynamodb.update_item(id, updates)
-                record = self.dynamodb.get_item(id)
-            else:
-                record['created_at'] = now
-                self.dynamodb.put_item(record)
-
+                    'details': details,
+                },
+                defaults={
+                    'media_type': MediaType.VIDEO.value,
+                    'model_type': model_type,
+                    'prompt': prompt,
+                    'ref_image': ref_image,
+                    'created_at': now,
+                },
+            )
         except Exception as e:
-            raise Exception(f"Failed to store metadata in DynamoDB: {str(e)}")
+            raise Exception(f"Failed to store metadata: {str(e)}")
 
         return record
 
     def get_media_list(
         self,
-        media_type: str = None,
-        sync=True,
+        media_type: Optional[Union[str, List[str]]] = None,
+        sync=False,
     ) -> List[Dict[str, Any]]:
         try:
             if sync:
                 self.sync_video_jobs()
 
-            if media_type:
-                query = {
-                    'FilterExpression': '#type = :type_val',
-                    'ExpressionAttributeNames': {'#type': 'media_type'},
-                    'ExpressionAttributeValues': {':type_val': media_type}
-                }
-                response = self.dynamodb.scan_items(query)
-            else:
-                response = self.dynamodb.scan_items({})
-                
-            return response.get('Items', [])
+            media_types = self._normalize_media_types(media_type)
+            results = [self.query_media_type(type_val) for type_val in media_types]
+            return list(heapq.merge(
+                *results,
+                key=lambda x: x.get('created_at', ''),
+                reverse=True
+            ))
         except Exception as e:
             raise Exception(f"Failed to retrieve media list: {str(e)}")
-        
-    def sync_video_jobs(self) -> None:
+
+    def get_media_page(
+        self,
+        media_type: Optional[Union[str, List[str]]] = None,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        summary: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        media_type별 (media_type, created_at) index 조회 결과를 최신순으로 병합해 한 페이지를 반환합니다.
+        summary이면 SUMMARY_ATTRIBUTES와 details의 taskType / status만 읽습니다.
+
+        Returns:
+            (items, next_cursor): 마지막 페이지이면 next_cursor는 None
+        """
         try:
-            job_list = list_video_job(max_results=10)
-            media_list = self.get_media_list(media_type=MediaType.VIDEO.value, sync=False)
-            media_map = {item['id']: item for item in media_list}
-        
-            for job in job_list:
-                job_id = extract_key_from_uri(
-                    job.get('outputDataConfig', {}).get('s3OutputDataConfig', {}).get('s3Uri', '')
+            media_types = self._normalize_media_types(media_type)
+            start_keys = _decode_cursor(cursor) if cursor else {}
+
+            pages = {}
+            for type_val in media_types:
+                start_key = start_keys.get(type_val)
+                if start_key is _EXHAUSTED:
+                    continue
+                pages[type_val] = self.backend.query_media_page(
+                    type_val,
+                    limit=page_size,
+                    start_key=start_key,
+                    summary=summary,
                 )
-                if not job_id or job_id not in media_map:
+
+            merged = heapq.merge(
+                *[page_items for page_items, _ in pages.values()],
+                key=lambda x: x.get('created_at', ''),
+                reverse=True
+            )
+            items = list(itertools.islice(merged, page_size))
+
+            next_keys = {}
+            for type_val in media_types:
+                if type_val not in pages:
+                    next_keys[type_val] = _EXHAUSTED
                     continue
-                
-                job_status = job.get('status')
-                if media_map[job_id].get('details', {}).get('status', '') != job_status:
-                    self.update_video_status(
-                        details=job,
-                        id=job_id
+                page_items, last_key = pages[type_val]
+                consumed = [item for item in items if item['media_type'] == type_val]
+                if len(consumed) == len(page_items):
+                    next_keys[type_val] = last_key if last_key is not None else _EXHAUSTED
+                elif consumed:
+                    next_keys[type_val] = _index_key(consumed[-1])
+                else:
+                    next_keys[type_val] = start_keys.get(type_val)
+
+            if all(key is _EXHAUSTED for key in next_keys.values()):
+                return items, None
+            return items, _encode_cursor(next_keys)
+        except Exception as e:
+            raise Exception(f"Failed to retrieve media page: {str(e)}")
+
+    def get_media_details(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        summary 항목의 전체 레코드 (ref_image, details 포함)를 한 번에 조회합니다.
+        blob 참조는 미디어 URL로 바꿔 반환합니다.
+
+        Returns:
+            id -> item
+        """
+        if not ids:
+            return {}
+        try:
+            return {item['id']: self.blobs.resolve(item) for item in self.backend.batch_get_items(ids)}
+        except Exception as e:
+            raise Exception(f"Failed to retrieve media details: {str(e)}")
+
+    def get_in_progress_videos(self) -> List[Dict[str, Any]]:
+        return self.backend.query_media(MediaType.VIDEO.value, status=VideoStatus.IN_PROGRESS.value)
+
+    def query_media_type(self, media_type: str) -> List[Dict[str, Any]]:
+        return self.backend.query_media(media_type)
+
+    def _normalize_media_types(self, media_type: Optional[Union[str, List[str]]]) -> List[str]:
+        if media_type is None:
+            return [type.value for type in MediaType]
+        if isinstance(media_type, (str, MediaType)):
+            media_type = [media_type]
+        return [type.value if isinstance(type, MediaType) else type for type in media_type]
+        
+    def sync_video_jobs(self) -> int:
+        """
+        저장된 watermark 이후 제출된 async job만 페이지 단위로 조회하여
+        상태가 바뀐 비디오 레코드만 갱신합니다.
+
+        watermark는 아직 진행 중인 가장 오래된 job의 제출 시간(없으면 마지막으로 본 job의
+        제출 시간)으로 이동하므로, 다음 동기화 비용은 새로운 활동량에만 비례합니다.
+
+        Returns:
+            int: 갱신된 레코드 수
+        """
+        try:
+            watermarks = self.get_sync_watermarks()
+            updated = 0
+
+            for region in video_job_regions():
+                watermark = watermarks.get(region)
+                watermark = datetime.fromisoformat(watermark) if watermark else None
+                submit_time_after = watermark - WATERMARK_MARGIN if watermark else None
+                oldest_in_progress = None
+                latest_submitted = watermark
+
+                for jobs in iter_video_job_pages(submit_time_after=submit_time_after, region=region):
+                    job_map = {}
+                    for job in jobs:
+                        job_id = extract_key_from_uri(
+                            job.get('outputDataConfig', {}).get('s3OutputDataConfig', {}).get('s3Uri', '')
+                        )
+                        submit_time = job['submitTime']
+                        latest_submitted = max(latest_submitted or submit_time, submit_time)
+                        if job.get('status') == VideoStatus.IN_PROGRESS.value:
+                            oldest_in_progress = min(oldest_in_progress or submit_time, submit_time)
+                        if job_id:
+                            job_map[job_id] = job
+
+                    if not job_map:
+                        continue
+
+                    records = self.backend.batch_get_items(
+                        list(job_map.keys()),
+                        attributes=('id', 'details.status'),
                     )
+                    for record in records:
+                        job = job_map[record['id']]
+                        if (record.get('details') or {}).get('status', '') != job.get('status'):
+                            self.update_video_status(details=job, id=record['id'])
+                            updated += 1
 
+                new_watermark = oldest_in_progress or latest_submitted
+                if new_watermark:
+                    watermarks[region] = new_watermark.isoformat()
+
+            self.backend.upsert_item(VIDEO_SYNC_WATERMARK_ID, updates={'watermarks': watermarks})
+            return updated
         except Exception as e:
             raise Exception(f"Failed to sync video jobs: {str(e)}")
+
+    def get_sync_watermarks(self) -> Dict[str, str]:
+        item = self.backend.get_item(VIDEO_SYNC_WATERMARK_ID) or {}
+        return item.get('watermarks') or {}
         
-    def upload_to_s3(self, image: BinaryIO, image_id: str) -> str:
+    def upload_object(self, image: MediaData, image_id: str) -> str:
+        """
+        디코딩된 이미지 (bytes / bytearray / memoryview / file-like)를 업로드하고 URL을 반환합니다.
+        BytesIO는 getbuffer()로 내부 버퍼를 그대로 읽으므로 현재 읽기 위치와 관계없이 전체가 업로드됩니다.
+        """
         filename = f"{image_id}.png"
-        
+        buffer = _as_buffer(image)
+
         try:
-            self.s3_client.upload_fileobj(
-                image,
-                self.bucket_name,
-                filename,
-                ExtraArgs={'ContentType': 'image/png'}
-            )
-            return f"{self.cloudfront_domain}/{filename}"
+            self.backend.put_object(filename, buffer, 'image/png')
+            return self.backend.url(filename)
         except Exception as e:
-            raise Exception(f"Failed to upload image to S3: {str(e)}")
+            raise Exception(f"Failed to upload image: {str(e)}")
+        finally:
+            buffer.release()
         
-    def clear_all_items(self):
+    def clear_all_items(self,
+                        prefixes: Optional[List[str]] = None,
+                        progress: Optional[PurgeProgress] = None):
+        """
+        모든 레코드와 미디어를 삭제합니다 (AWS backend는 DynamoDB 테이블과 S3 bucket을 병렬로 비움).
+        prefixes를 지정하면 해당 prefix의 미디어만 삭제합니다 (예: MEDIA_PREFIXES).
+        """
         try:
-            self.dynamodb.delete_all_items()
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            for page in paginator.paginate(Bucket=self.bucket_name):
-                objects = page.get('Contents', [])
-                if objects:
-                    delete_keys = [{'Key': obj['Key']} for obj in objects]
-                    self.s3_client.delete_objects(
-                        Bucket=self.bucket_name,
-                        Delete={'Objects': delete_keys}
-                    )
+            self.backend.purge(prefixes=prefixes, progress=progress)
             return True
         except Exception as e:
             print(e)
-            return False
\ No newline at end of file
+            return False
+        finally:
+            # 일부만 지워진 경우에도 기억해 둔 blob이 남아 있다고 가정하지 않음
+            forget_blobs()
+
+
+def create_storage_backend(bucket_name: str, cloudfront_domain: str) -> StorageBackend:
+    if config.STORAGE_BACKEND == 'local':
+        return LocalStorageBackend(config.LOCAL_STORAGE_PATH, media_url=local_media_url())
+    return AwsStorageBackend(config.DYNAMO_TABLE, bucket_name, cloudfront_domain)
+
+
+def local_media_url() -> str:
+    return config.LOCAL_MEDIA_URL or f"http://localhost:{config.LOCAL_MEDIA_PORT}"
+
+
+# 페이지 커서: media_type별 ExclusiveStartKey를 담은 불투명 문자열
+_EXHAUSTED = object()
+
+
+def _index_key(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': item['id'],
+        'media_type': item['media_type'],
+        'created_at': item['created_at'],
+    }
+
+
+def _encode_cursor(start_keys: Dict[str, Any]) -> str:
+    payload = {k: (v if v is not _EXHAUSTED else False) for k, v in start_keys.items()}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('utf-8')
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    payload = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')))
+    return {k: (v if v is not False else _EXHAUSTED) for k, v in payload.items()}
+
+
+def _as_buffer(image: MediaData) -> memoryview:
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        return memoryview(image)
+    if isinstance(image, io.BytesIO):
+        return image.getbuffer()
+    image.seek(0)
+    return memoryview(image.read())
@@ -0,0 +1,147 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+from genai_kit.aws.amazon_video import VideoStatus
+from services.bedrock_service import get_video_job
+from services.storage_service import StorageService
+from config import config
+
+
+class VideoJobPoller:
+    """
+    진행 중인 비디오 job만 추적하는 프로세스 단위 백그라운드 poller.
+
+    상태 변화가 없으면 polling 간격을 base_interval부터 max_interval까지
+    두 배씩 늘리고, 변화가 있거나 새 job이 등록되면 다시 base_interval로 돌아갑니다.
+    변경된 상태는 DynamoDB에 기록되므로 UI는 저장된 값을 읽기만 하면 됩니다.
+    추적 대상에서 빠진 job은 reconcile_interval마다 watermark 기반 동기화로 보정합니다.
+    """
+
+    def __init__(self,
+                 storage_service: StorageService,
+                 base_interval: float = 5.0,
+                 max_interval: float = 120.0,
+                 reconcile_interval: float = 600.0):
+        self.storage_service = storage_service
+        self.reconcile_interval = reconcile_interval
+        self._next_reconcile_at = 0.0
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.interval = base_interval
+
+        self._jobs: Dict[str, Dict[str, str]] = {}  # invocationArn -> {id, status}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_poll_at: Optional[float] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="video-job-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def track(self, invocation_arn: str, id: str, status: str = VideoStatus.IN_PROGRESS.value):
+        if not invocation_arn or not id or status != VideoStatus.IN_PROGRESS.value:
+            return
+        with self._lock:
+            self._jobs[invocation_arn] = {'id': id, 'status': status}
+        self.interval = self.base_interval
+        self._wake.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            tracked = len(self._jobs)
+        return {
+            'tracked_jobs': tracked,
+            'interval': self.interval,
+            'last_poll_at': self.last_poll_at,
+        }
+
+    def _reconcile(self):
+        try:
+            self.storage_service.sync_video_jobs()
+        except Exception as e:
+            print(e)
+        self._load_in_progress_jobs()
+        self._next_reconcile_at = time.time() + self.reconcile_interval
+
+    def _load_in_progress_jobs(self):
+        try:
+            for item in self.storage_service.get_in_progress_videos():
+                details = item.get('details') or {}
+                self.track(
+                    invocation_arn=details.get('invocationArn', ''),
+                    id=item['id'],
+                    status=details.get('status', ''),
+                )
+        except Exception as e:
+            print(f"Failed to load in-progress video jobs: {e}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            if time.time() >= self._next_reconcile_at:
+                self._reconcile()
+
+            with self._lock:
+                has_jobs = len(self._jobs) > 0
+
+            until_reconcile = max(self._next_reconcile_at - time.time(), 0)
+            if has_jobs:
+                try:
+                    changed = self.poll_once()
+                except Exception as e:
+                    print(f"Failed to poll video jobs: {e}")
+                    changed = False
+                self.interval = self.base_interval if changed else min(self.interval * 2, self.max_interval)
+                self._wake.wait(min(self.interval, until_reconcile))
+            else:
+                # 추적할 job이 없으면 track() 호출 또는 다음 reconcile까지 대기
+                self._wake.wait(until_reconcile)
+            self._wake.clear()
+
+    def poll_once(self) -> bool:
+        with self._lock:
+            jobs = list(self._jobs.items())
+
+        changed = False
+        for invocation_arn, job in jobs:
+            try:
+                invocation = get_video_job(invocation_arn)
+            except Exception as e:
+                print(f"Failed to get video job {invocation_arn}: {e}")
+                continue
+
+            if invocation.get('status', '') == job['status']:
+                continue
+
+            self.storage_service.update_video_status(details=invocation, id=job['id'])
+            changed = True
+            with self._lock:
+                self._jobs.pop(invocation_arn, None)
+
+        self.last_poll_at = time.time()
+        return changed
+
+
+_poller: Optional[VideoJobPoller] = None
+_poller_lock = threading.Lock()
+
+
+def get_video_poller() -> VideoJobPoller:
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = VideoJobPoller(
+                storage_service=StorageService(
+                    bucket_name=config.S3_BUCKET,
+                    cloudfront_domain=config.CF_DOMAIN
+                )
+            )
+            _poller.start()
+    return _poller
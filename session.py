@@ -1,17 +1,38 @@
+import hashlib
+import threading
 import streamlit as st
-from typing import Dict, Any, BinaryIO, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Callable, Dict, Any, List, Optional, Union
 from genai_kit.aws.bedrock import BedrockModel
-from services.storage_service import StorageService
+from genai_kit.utils.cache import TTLCache
+from services.storage_service import MEDIA_PREFIXES, MediaData, StorageService
+from services.purge import PurgeProgress
+from services.video_poller import get_video_poller
+from services.job_queue import JobKind, JobStatus, get_job_queue
 from config import config
 from constants import MediaType
 
 
+# 세션 간 공유되는 S3/DynamoDB 업로드 pool
+_upload_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="media-upload")
+
+# idempotency key -> 업로드 Future (rerun / 다른 세션의 같은 결과를 한 번만 저장)
+_uploads = TTLCache(maxsize=1024, ttl=3600)
+_uploads_lock = threading.Lock()
+
+# 세션별로 보관하는 상세 레코드 수 (ref_image / details 포함)
+MAX_CACHED_DETAILS = 200
+PURGE_PROGRESS_INTERVAL = 0.5  # seconds
+
+
 class SessionManager:
     def __init__(self):
         self.storage_service = StorageService(
             bucket_name=config.S3_BUCKET,
             cloudfront_domain=config.CF_DOMAIN
         )
+        self.video_poller = get_video_poller()
+        self.job_queue = get_job_queue()
 
     def add_to_history(
         self,
@@ -19,36 +40,197 @@ class SessionManager:
         prompt: str,
         model_type: BedrockModel, 
         details: Optional[Dict[str, Any]] = None,
-        media_file: Optional[BinaryIO] = None,
+        media_file: Optional[MediaData] = None,
         ref_image: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ):
         if 'request_history' not in st.session_state:
             st.session_state.request_history = []
         
         storage_metadata = None
         try:
-            storage_metadata = self.storage_service.upload_media(
+            storage_metadata = self.add_to_history_async(
                 media_type=media_type,
                 model_type=model_type,
                 prompt=prompt,
                 details=details,
                 media_file=media_file,
                 ref_image=ref_image,
-            )
+                idempotency_key=idempotency_key,
+            ).result()
         except Exception as e:
             st.error(f"Failed to upload media: {str(e)}")
             return None
 
-        st.session_state.request_history.insert(0, storage_metadata)
+        if media_type == MediaType.VIDEO:
+            self.video_poller.track(
+                invocation_arn=storage_metadata.get('details', {}).get('invocationArn', ''),
+                id=storage_metadata['id'],
+                status=storage_metadata.get('details', {}).get('status', ''),
+            )
+
+        _insert_history([storage_metadata])
         return storage_metadata
     
-    def get_history(self, media_type: str = None):
+    def add_to_history_async(
+        self,
+        media_type: MediaType,
+        prompt: str,
+        model_type: BedrockModel,
+        details: Optional[Dict[str, Any]] = None,
+        media_file: Optional[MediaData] = None,
+        ref_image: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Future:
+        """
+        업로드를 공유 upload pool에 제출하고 바로 반환합니다.
+        결과는 wait_for_history()로 모아서 history에 반영합니다.
+
+        같은 idempotency_key (이미지는 지정하지 않으면 이미지 bytes의 hash)로 진행 중이거나
+        완료된 업로드가 있으면 새로 저장하지 않고 그 Future를 반환합니다.
+        key에서 만든 id로 저장하므로 프로세스가 바뀌어도 같은 레코드를 덮어씁니다.
+        """
+        key = idempotency_key or _content_key(media_type, media_file)
+        with _uploads_lock:
+            future = _uploads.get(key) if key else None
+            if future is not None and not (future.done() and future.exception()):
+                return future
+
+            future = _upload_executor.submit(
+                self.storage_service.upload_media,
+                media_type=media_type,
+                model_type=model_type,
+                prompt=prompt,
+                details=details,
+                media_file=media_file,
+                ref_image=ref_image,
+                id=_record_id(key) if key else None,
+            )
+            if key:
+                _uploads.set(key, future)
+        return future
+
+    def wait_for_history(self, futures: List[Future]) -> List[Dict[str, Any]]:
+        records = []
+        for future in as_completed(futures):
+            try:
+                records.append(future.result())
+            except Exception as e:
+                st.error(f"Failed to upload media: {str(e)}")
+
+        _insert_history(records)
+        return records
+
+    def submit_job(self, kind: JobKind, **params) -> str:
+        """
+        생성 작업을 job queue에 넣고 바로 반환합니다. 진행 상황은 get_jobs()로 확인합니다.
+        """
+        if 'jobs' not in st.session_state:
+            st.session_state.jobs = []
+
+        job_id = self.job_queue.submit(kind, params)
+        st.session_state.jobs.insert(0, job_id)
+        return job_id
+
+    def get_jobs(self, kind: Optional[JobKind] = None) -> List[Dict[str, Any]]:
+        """
+        이 세션이 제출한 job의 상태를 반환하고, 새로 완료된 job의 레코드를 history에 반영합니다.
+        """
+        if 'collected_jobs' not in st.session_state:
+            st.session_state.collected_jobs = set()
+
+        jobs = self.job_queue.get_jobs(st.session_state.get('jobs', []))
+        for job in jobs:
+            if job['status'] == JobStatus.DONE.value and job['id'] not in st.session_state.collected_jobs:
+                st.session_state.collected_jobs.add(job['id'])
+                _insert_history(job['result'].get('records', []))
+
+        if kind is not None:
+            jobs = [job for job in jobs if job['kind'] == JobKind(kind).value]
+        return jobs
+
+    def get_history(self, media_type: Optional[Union[str, List[str]]] = None):
         return self.storage_service.get_media_list(
             media_type=media_type,
         )
 
-    def clear_history(self):
+    def get_history_page(
+        self,
+        media_type: Optional[Union[str, List[str]]] = None,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+    ):
+        return self.storage_service.get_media_page(
+            media_type=media_type,
+            page_size=page_size,
+            cursor=cursor,
+        )
+
+    def get_history_details(self, items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        summary 항목들의 전체 레코드를 한 번의 BatchGetItem으로 조회합니다.
+        세션에 캐시하며, updated_at이 바뀐 항목만 다시 조회합니다.
+        """
+        if 'media_details' not in st.session_state:
+            st.session_state.media_details = {}
+        cache = st.session_state.media_details
+
+        missing = [
+            item['id'] for item in items
+            if cache.get(item['id'], {}).get('updated_at') != item.get('updated_at')
+        ]
+        if missing:
+            try:
+                cache.update(self.storage_service.get_media_details(missing))
+            except Exception as e:
+                st.error(f"Failed to load details: {str(e)}")
+            while len(cache) > MAX_CACHED_DETAILS:
+                cache.pop(next(iter(cache)))
+
+        return {item['id']: cache[item['id']] for item in items if item['id'] in cache}
+
+    def clear_history(self,
+                      media_only: bool = False,
+                      on_progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        purge를 백그라운드에서 실행하고, 끝날 때까지 on_progress(snapshot)로 진행 상황을 전달합니다.
+        media_only이면 S3에서 image/ video/ blob/ prefix만 삭제합니다.
+        """
         st.session_state.request_history = []
-        return self.storage_service.clear_all_items()
+        st.session_state.media_details = {}
 
-        
+        progress = PurgeProgress()
+        future = _upload_executor.submit(
+            self.storage_service.clear_all_items,
+            prefixes=MEDIA_PREFIXES if media_only else None,
+            progress=progress,
+        )
+        while True:
+            try:
+                success = future.result(timeout=PURGE_PROGRESS_INTERVAL)
+                break
+            except TimeoutError:
+                if on_progress:
+                    on_progress(progress.snapshot())
+        if on_progress:
+            on_progress(progress.snapshot())
+        return success
+
+
+def _insert_history(records: List[Dict[str, Any]]):
+    if 'request_history' not in st.session_state:
+        st.session_state.request_history = []
+
+    known = {record.get('id') for record in st.session_state.request_history}
+    new_records = [record for record in records if record and record.get('id') not in known]
+    st.session_state.request_history[:0] = new_records
+
+
+def _content_key(media_type: MediaType, media_file: Optional[MediaData]) -> Optional[str]:
+    if media_type != MediaType.IMAGE or not isinstance(media_file, (bytes, bytearray, memoryview)):
+        return None
+    return hashlib.sha256(media_file).hexdigest()
+
+
+def _record_id(idempotency_key: str) -> str:
+    return hashlib.sha256(idempotency_key.encode('utf-8')).hexdigest()[:16]